@@ -1,23 +1,192 @@
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Header, Query, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from typing import Callable, Literal, Optional, Tuple
+from src.config import settings
 from src.models import (
     SolveRequest, SolveResponse,
     DecomposeLURequest, DecomposeLUResponse,
     DeterminantRequest, DeterminantResponse,
     InverseRequest, InverseResponse,
     AnalysisRequest, AnalysisResponse,
-    TuringMachineRequest, TuringMachineResponse, TuringExecutionStep
+    OperationsRequest, OperationsResponse,
+    MatrixInput, VectorInput, MatrixGenerator, GeneratedMatrixResponse, UploadResponse,
+    EliminationTraceRequest, RationalNumber,
+    TuringMachineRequest, TuringMachineResponse, TuringExecutionStep,
+    TuringStreamRequest, TuringStreamStatus
 )
 from src.services.matrix_solver import MatrixSolver
+from src.services.backends import default_registry
+from src.services.profiling import load_metrics_hook, set_metrics_hook
 from src.services.turing_machine import TuringMachine
+from src.services.turing_streams import StreamLimitExceeded, StreamRegistry, stream_execution
+from src.services.response_cache import ResponseCache, canonical_hash, etag_matches, make_etag, schema_version
+from src.services.elimination_trace import EliminationTracer
+from src.services.result_store import ResultStore
+from src.services.factorization import SharedFactorization
+from src.services.generators import generate_matrix, generate_vector
+from src.services.reordering import block_components
+from src.services.uploads import UploadError, UploadNotFound, UploadTooLarge, infer_format, upload_store
+from multipart.multipart import MultipartParser, parse_options_header
+from src.services.shared_memory_pool import SharedMemorySolverPool
+from src.services.structured import (
+    DETECT_MIN_SIZE, circulant_row, detect_structure, to_dense, toeplitz_matvec
+)
+from concurrent.futures.process import BrokenProcessPool
 import numpy as np
+import json
 import time
 
 router = APIRouter(prefix="/api/v1", tags=["solver"])
 solver = MatrixSolver()
+if settings.METRICS_HOOK:
+    set_metrics_hook(load_metrics_hook(settings.METRICS_HOOK))
+engines = default_registry(
+    solver,
+    reference_max_size=settings.ENGINE_REFERENCE_MAX_SIZE,
+    numpy_max_size=settings.ENGINE_NUMPY_MAX_SIZE
+)
+tracer = EliminationTracer(solver, max_viewport=settings.TRACE_MAX_VIEWPORT)
+turing_streams = StreamRegistry(max_sessions=settings.TURING_STREAM_MAX_SESSIONS)
+response_cache = ResponseCache(
+    ttl=settings.RESPONSE_CACHE_TTL,
+    max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+    max_bytes=settings.RESPONSE_CACHE_MAX_BYTES
+)
+# Version des clés de cache (mémoire et persistant): une mise à jour qui change
+# la forme des réponses, ou RESULT_STORE_VERSION, rend les anciennes entrées inaccessibles
+CACHE_KEY_VERSION = ":".join((
+    settings.API_VERSION,
+    settings.RESULT_STORE_VERSION,
+    schema_version(
+        DecomposeLUResponse, DeterminantResponse, AnalysisResponse,
+        OperationsResponse, TuringMachineResponse, GeneratedMatrixResponse
+    )
+))
+result_store = ResultStore(
+    settings.RESULT_STORE_PATH,
+    ttl=settings.RESULT_STORE_TTL,
+    max_bytes=settings.RESULT_STORE_MAX_BYTES
+) if settings.RESULT_STORE_PATH else None
+
+block_pool: Optional[SharedMemorySolverPool] = None
+
+def get_block_pool() -> Optional[SharedMemorySolverPool]:
+    """Pool de processus des sous-systèmes indépendants (créé à la première utilisation)"""
+    global block_pool
+    if settings.BLOCK_SOLVE_WORKERS == 0:
+        return None
+    if block_pool is None:
+        block_pool = SharedMemorySolverPool(max_workers=settings.BLOCK_SOLVE_WORKERS, tolerance=solver.tolerance)
+    return block_pool
+
+def discard_block_pool():
+    """Abandonner le pool (worker mort: BrokenProcessPool); recréé à la prochaine utilisation"""
+    global block_pool
+    if block_pool is not None:
+        block_pool.shutdown(wait=False)
+        block_pool = None
+
+def shutdown_block_pool():
+    """Arrêter les workers du pool (arrêt de l'application)"""
+    global block_pool
+    if block_pool is not None:
+        block_pool.shutdown()
+        block_pool = None
+
+def solve_blocks(A: np.ndarray, b: np.ndarray, method: str, blocks) -> Tuple[np.ndarray, dict]:
+    """Résolution bloc par bloc; repli séquentiel si un worker du pool est mort"""
+    try:
+        return solver.block_solve(
+            A, b, method=method, blocks=blocks,
+            pool=get_block_pool(), parallel_min_size=settings.BLOCK_PARALLEL_MIN_SIZE
+        )
+    except BrokenProcessPool:
+        discard_block_pool()
+        return solver.block_solve(A, b, method=method, blocks=blocks)
 
 def list_to_numpy(data):
     """Convertir liste en array NumPy"""
-    return np.array(data, dtype=float)
+    try:
+        return np.array(data, dtype=float)
+    except OverflowError:
+        raise ValueError("Valeur trop grande pour un flottant (au plus ~1.8e308)")
+
+def matrix_to_exact(matrix: MatrixInput, A: Optional[np.ndarray] = None) -> list:
+    """
+    Matrice pour le mode exact: données littérales telles que reçues (les
+    entiers ne passent pas par float64), sinon A ou la matrice construite
+    """
+    if matrix.data is not None:
+        return matrix.data
+    return (matrix_to_numpy(matrix) if A is None else A).tolist()
+
+def matrix_to_numpy(matrix: MatrixInput) -> np.ndarray:
+    """Matrice d'une requête: données littérales ou générées côté serveur"""
+    if matrix.generator is not None:
+        return generate_matrix(**matrix.generator.model_dump())
+    if matrix.structured is not None:
+        _, c, r = find_structure(matrix, None)
+        return to_dense(c, r)
+    if matrix.upload_id is not None:
+        return upload_store.load(matrix.upload_id)
+    return list_to_numpy(matrix.data)
+
+def check_upload(matrix: MatrixInput, vector: Optional[VectorInput] = None, square: bool = False):
+    """
+    Matrice importée: existence et dimensions (inconnues à la validation de la
+    requête) vérifiées avant tout calcul, même servi par le cache
+
+    Raises:
+        HTTPException: 404 si l'import est inconnu ou expiré, 400 si
+        l'identifiant est invalide ou les dimensions incompatibles
+    """
+    if matrix.upload_id is None:
+        return
+    try:
+        n_rows, n_cols = upload_store.shape(matrix.upload_id)
+    except UploadNotFound as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except UploadError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if square and n_rows != n_cols:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"La matrice A doit être carrée (actuellement {n_rows}×{n_cols})"
+        )
+    if vector is not None and vector.size != n_rows:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Le vecteur b doit avoir {n_rows} éléments (actuellement {vector.size})"
+        )
+
+def find_structure(matrix: MatrixInput, A: Optional[np.ndarray]) -> Optional[Tuple[str, np.ndarray, np.ndarray]]:
+    """
+    Structure de Toeplitz / circulante: déclarée (forme compacte) ou détectée sur A
+    
+    Returns:
+        (structure, première colonne, première ligne) ou None
+    """
+    spec = matrix.structured
+    if spec is not None:
+        c = np.array(spec.first_column, dtype=float)
+        if spec.kind == "circulant":
+            r = circulant_row(c)
+        else:
+            r = np.array(spec.first_row, dtype=float) if spec.first_row is not None else c
+        return spec.kind, c, r
+    if A is not None and A.shape[0] >= DETECT_MIN_SIZE:
+        kind = detect_structure(A)
+        if kind is not None:
+            return kind, A[:, 0].copy(), A[0].copy()
+    return None
+
+def vector_to_numpy(vector: VectorInput) -> np.ndarray:
+    """Vecteur d'une requête: données littérales ou générées côté serveur"""
+    if vector.generator is not None:
+        return generate_vector(**vector.generator.model_dump())
+    return list_to_numpy(vector.data)
 
 def numpy_to_list(arr):
     """Convertir array NumPy en liste"""
@@ -27,10 +196,64 @@ def numpy_to_list(arr):
         return [row.tolist() for row in arr]
     return arr.tolist()
 
+def to_rational(value) -> RationalNumber:
+    """Convertir une Fraction en paire numérateur/dénominateur"""
+    return RationalNumber(numerator=str(value.numerator), denominator=str(value.denominator))
+
+def rational_to_float(value) -> Optional[float]:
+    """Approximation flottante d'une Fraction (None si hors de portée d'un float)"""
+    try:
+        return float(value)
+    except OverflowError:
+        return None
+
 def calculate_residual(A, x, b):
     """Calculer l'erreur résiduelle ||Ax - b||"""
     return float(np.linalg.norm(A @ x - b))
 
+def cached_response(
+    namespace: str,
+    request: BaseModel,
+    if_none_match: Optional[str],
+    compute: Callable[[], BaseModel]
+) -> Response:
+    """
+    Servir une réponse d'endpoint déterministe via le cache
+    
+    L'ETag dérive du hash canonique de la requête validée: si le client
+    possède déjà la réponse (If-None-Match), on renvoie 304 sans calcul ni
+    sérialisation. Sinon, le corps JSON déjà sérialisé est servi depuis le
+    cache mémoire, puis depuis le stockage persistant partagé entre workers
+    (si configuré), ou calculé puis enregistré dans les deux.
+    """
+    key = canonical_hash(f"{namespace}@{CACHE_KEY_VERSION}", request.model_dump(mode="json"))
+    etag = make_etag(key)
+    
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    
+    entry = response_cache.get(key) if settings.RESPONSE_CACHE_ENABLED else None
+    cache_status = "HIT"
+    if entry is not None:
+        body = entry.body
+    else:
+        body = result_store.get(key) if result_store is not None else None
+        if body is not None:
+            cache_status = "STORE"
+        else:
+            cache_status = "MISS"
+            body = compute().model_dump_json().encode("utf-8")
+            if result_store is not None:
+                result_store.put(key, body, kind=namespace)
+        if settings.RESPONSE_CACHE_ENABLED:
+            response_cache.put(key, body)
+    
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": etag, "X-Cache": cache_status}
+    )
+
 @router.post("/solve", response_model=SolveResponse)
 async def solve_linear_system(request: SolveRequest):
     """
@@ -38,27 +261,77 @@ async def solve_linear_system(request: SolveRequest):
     
     - **matrix_a**: Matrice de coefficients A (n×n)
     - **vector_b**: Vecteur résultat b (n,)
-    - **method**: Méthode de résolution ('gauss', 'lu')
+    - **method**: Méthode de résolution ('gauss', 'lu', 'qr' pour les moindres carrés)
+    - **column_pivoting**: Pivotage de colonnes révélateur de rang ('qr')
+    - **reordering**: Renumérotation avant factorisation ('rcm', 'minimum_degree')
+    - **detect_structure**: Toeplitz (Levinson) et circulantes (FFT) résolues sans factorisation dense
+    - **engine**: moteur imposé ('reference', 'numpy', 'lapack'); par défaut choisi selon n
     """
+    check_upload(request.matrix_a, request.vector_b, square=request.method != "qr")
     try:
         start_time = time.time()
         
-        # Convertir en NumPy
-        A = list_to_numpy(request.matrix_a.data)
-        b = np.array(request.vector_b.data, dtype=float)
+        # Convertir en NumPy (la forme compacte n'est construite en dense que si nécessaire).
+        # Un moteur imposé désactive les chemins spécialisés
+        fast = (request.detect_structure and not request.exact and request.engine is None
+                and request.method != "qr" and request.reordering == "none")
+        A = None if fast and request.matrix_a.structured is not None else matrix_to_numpy(request.matrix_a)
+        b = vector_to_numpy(request.vector_b)
+        structure = find_structure(request.matrix_a, A) if fast else None
+        blocks = None
+        if fast and structure is None and A.shape[0] >= DETECT_MIN_SIZE:
+            components = block_components(A)
+            blocks = components if len(components) > 1 else None
         
         # Résoudre selon la méthode
-        if request.method == "gauss":
-            x, info = solver.gauss_elimination(A, b)
-        elif request.method == "lu":
-            x, info = solver.solve_with_lu(A, b)
+        rank = None
+        solution_exact = determinant_exact = reordering = None
+        if structure is not None:
+            kind, c, r = structure
+            x, info = solver.structured_solve(kind, c, r, b)
+        elif blocks is not None:
+            x, info = solve_blocks(A, b, request.method, blocks)
+        elif request.exact:
+            x_exact, info = solver.exact_solve(
+                matrix_to_exact(request.matrix_a, A),
+                request.vector_b.data if request.vector_b.data is not None else b.tolist()
+            )
+            x = np.array([rational_to_float(v) for v in x_exact], dtype=float)
+            solution_exact = [to_rational(v) for v in x_exact]
+            determinant_exact = to_rational(info['determinant'])
+        elif request.reordering != "none":
+            x, info = solver.reordered_solve(A, b, method=request.method, reordering=request.reordering)
+            reordering = info['reordering']
+        elif request.method == "qr":
+            engine = engines.select("qr", A.shape[1], request.engine)
+            x, info = engine.least_squares(A, b, pivoting=request.column_pivoting)
+            rank = info['rank']
         else:
-            raise ValueError(f"Méthode inconnue: {request.method}")
+            engine = engines.select(request.method, A.shape[0], request.engine)
+            x, info = engine.solve(A, b, method=request.method)
         
         # Calculer les métriques
-        residual_error = calculate_residual(A, x, b)
-        condition_number = float(np.linalg.cond(A))
-        determinant = float(np.linalg.det(A))
+        if structure is not None:
+            residual_error = float(np.linalg.norm(toeplitz_matvec(c, r, x) - b))
+            condition_number = info['condition_number']
+            determinant = info['determinant']
+        elif blocks is not None:
+            residual_error = calculate_residual(A, x, b)
+            condition_number = info['condition_number']
+            determinant = info['determinant']
+        elif request.method == "qr":
+            residual_error = calculate_residual(A, x, b)
+            # Les valeurs singulières de R sont celles de A: pas de SVD de A
+            condition_number = info['condition_number']
+            determinant = float(np.linalg.det(A)) if A.shape[0] == A.shape[1] else None
+        elif request.exact:
+            residual_error = calculate_residual(A, x, b)
+            condition_number = float(np.linalg.cond(A))
+            determinant = rational_to_float(info['determinant'])
+        else:
+            residual_error = calculate_residual(A, x, b)
+            condition_number = float(np.linalg.cond(A))
+            determinant = float(np.linalg.det(A))
         
         execution_time = time.time() - start_time
         
@@ -70,7 +343,15 @@ async def solve_linear_system(request: SolveRequest):
             execution_time=execution_time,
             matrix_condition=condition_number,
             determinant=determinant,
-            message=f"Système résolu avec succès (méthode: {request.method})"
+            rank=rank,
+            solution_exact=solution_exact,
+            determinant_exact=determinant_exact,
+            reordering=reordering,
+            structure=structure[0] if structure is not None else ("block_diagonal" if blocks is not None else None),
+            blocks=info['blocks'] if blocks is not None else None,
+            engine=info.get('engine', "reference"),
+            profile=info.get('profile'),
+            message=f"Système résolu avec succès (méthode: {info['method'] if request.exact or structure or blocks else request.method})"
         )
         
     except ValueError as e:
@@ -84,82 +365,315 @@ async def solve_linear_system(request: SolveRequest):
             detail=f"Erreur lors de la résolution: {str(e)}"
         )
 
-@router.post("/decompose-lu", response_model=DecomposeLUResponse)
-async def decompose_lu(request: DecomposeLURequest):
-    """Décomposition LU d'une matrice A = LU"""
+def format_sse(event: str, data: dict) -> str:
+    """Formater un événement Server-Sent Events"""
+    return f"event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+
+@router.post("/solve/trace")
+async def trace_elimination(request: EliminationTraceRequest):
+    """
+    Tracer pas à pas une élimination de Gauss ou une décomposition LU (SSE)
+    
+    Les événements (`init`, `pivot`, `eliminate`, `result` ou `error`) sont
+    émis au fur et à mesure du calcul. Seules les lignes modifiées situées dans
+    la fenêtre (`viewport`) sont transmises, ce qui borne chaque événement
+    même pour de grandes matrices.
+    """
+    check_upload(request.matrix_a, request.vector_b if request.method == "gauss" else None, square=True)
     try:
-        A = list_to_numpy(request.matrix_a.data)
-        L, U, info = solver.lu_decomposition(A)
-        
-        return DecomposeLUResponse(
-            success=True,
-            matrix_l=numpy_to_list(L),
-            matrix_u=numpy_to_list(U),
-            execution_time=info['execution_time'],
-            message="Décomposition LU réussie"
-        )
-    except Exception as e:
+        A = matrix_to_numpy(request.matrix_a)
+        b = vector_to_numpy(request.vector_b) if request.method == "gauss" else None
+    except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    viewport = request.viewport.model_dump() if request.viewport else None
+    
+    if request.method == "gauss":
+        events = tracer.trace_gauss(A, b, viewport)
+    else:
+        events = tracer.trace_lu(A, viewport)
+    
+    # Générateur synchrone: exécuté dans le threadpool par Starlette,
+    # chaque étape est envoyée dès qu'elle est calculée
+    stream = (format_sse(event, data) for event, data in events)
+    
+    return StreamingResponse(
+        stream,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.post("/decompose-lu", response_model=DecomposeLUResponse)
+async def decompose_lu(request: DecomposeLURequest, if_none_match: Optional[str] = Header(None)):
+    """Décomposition LU d'une matrice A = LU"""
+    check_upload(request.matrix_a)
+    def compute():
+        try:
+            A = matrix_to_numpy(request.matrix_a)
+            engine = engines.select("lu_decomposition", A.shape[0], request.engine)
+            L, U, info = engine.lu_decomposition(A)
+            
+            return DecomposeLUResponse(
+                success=True,
+                matrix_l=numpy_to_list(L),
+                matrix_u=numpy_to_list(U),
+                engine=info['engine'],
+                profile=info['profile'],
+                execution_time=info['execution_time'],
+                message="Décomposition LU réussie"
+            )
+        except Exception as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    return cached_response("decompose-lu", request, if_none_match, compute)
 
 @router.post("/determinant", response_model=DeterminantResponse)
-async def calculate_determinant(request: DeterminantRequest):
+async def calculate_determinant(request: DeterminantRequest, if_none_match: Optional[str] = Header(None)):
     """Calculer le déterminant d'une matrice"""
-    try:
-        A = list_to_numpy(request.matrix_a.data)
-        det, info = solver.determinant(A)
-        
-        return DeterminantResponse(
-            success=True,
-            determinant=det,
-            method=info['method'],
-            execution_time=info['execution_time'],
-            message=f"Déterminant calculé: {det:.6e}"
-        )
-    except Exception as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    check_upload(request.matrix_a)
+    def compute():
+        try:
+            structure = None
+            if request.exact:
+                det_exact, info = solver.exact_determinant(matrix_to_exact(request.matrix_a))
+                det = rational_to_float(det_exact)
+                message = f"Déterminant exact calculé: {det_exact}"
+            else:
+                A = None
+                detect = request.detect_structure and request.engine is None
+                if not (detect and request.matrix_a.structured is not None):
+                    A = matrix_to_numpy(request.matrix_a)
+                structure = find_structure(request.matrix_a, A) if detect else None
+                if structure is not None:
+                    det, info = solver.structured_determinant(*structure)
+                else:
+                    det, info = engines.select("determinant", A.shape[0], request.engine).determinant(A)
+                det_exact = None
+                message = f"Déterminant calculé: {det:.6e}"
+            
+            return DeterminantResponse(
+                success=True,
+                determinant=det,
+                determinant_exact=to_rational(det_exact) if det_exact is not None else None,
+                structure=structure[0] if structure is not None else None,
+                method=info['method'],
+                engine=info.get('engine', "reference"),
+                profile=info.get('profile'),
+                execution_time=info['execution_time'],
+                message=message
+            )
+        except Exception as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    return cached_response("determinant", request, if_none_match, compute)
 
 @router.post("/inverse", response_model=InverseResponse)
 async def calculate_inverse(request: InverseRequest):
     """Calculer l'inverse d'une matrice"""
+    check_upload(request.matrix_a)
     try:
-        A = list_to_numpy(request.matrix_a.data)
-        A_inv, info = solver.inverse(A)
+        A = matrix_to_numpy(request.matrix_a)
+        engine = engines.select("inverse", A.shape[0], request.engine)
+        A_inv, info = engine.inverse(A)
         
         return InverseResponse(
             success=True,
             matrix_inverse=numpy_to_list(A_inv),
             verification=info['verification_error'],
+            engine=info['engine'],
+            profile=info['profile'],
             execution_time=info['execution_time'],
             message="Matrice inverse calculée avec succès"
         )
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
+def analysis_mode(A: np.ndarray, mode: Optional[str] = None) -> str:
+    """Mode d'analyse demandé, ou approché au-delà de ANALYSIS_SKETCH_THRESHOLD"""
+    if mode is not None:
+        return mode
+    return "approximate" if A.shape[0] > settings.ANALYSIS_SKETCH_THRESHOLD else "exact"
+
+def analysis_response(analysis: dict) -> AnalysisResponse:
+    """Construire la réponse d'analyse à partir du dictionnaire de MatrixSolver"""
+    return AnalysisResponse(
+        success=True,
+        determinant=analysis.get('determinant'),
+        condition_number=analysis.get('condition_number'),
+        is_singular=analysis.get('is_singular', False),
+        is_symmetric=analysis.get('is_symmetric', False),
+        is_positive_definite=analysis.get('is_positive_definite'),
+        eigenvalues=analysis.get('eigenvalues'),
+        rank=analysis.get('rank'),
+        mode=analysis.get('mode', "exact"),
+        estimates=analysis.get('estimates'),
+        properties=analysis,
+        recommendations=analysis.get('recommendations', []),
+        execution_time=analysis['execution_time']
+    )
+
 @router.post("/analyze", response_model=AnalysisResponse)
-async def analyze_matrix(request: AnalysisRequest):
+async def analyze_matrix(request: AnalysisRequest, if_none_match: Optional[str] = Header(None)):
     """Analyse complète d'une matrice"""
-    try:
-        A = list_to_numpy(request.matrix_a.data)
-        analysis = solver.analyze_matrix(A)
+    check_upload(request.matrix_a)
+    def compute():
+        try:
+            A = matrix_to_numpy(request.matrix_a)
+            return analysis_response(solver.analyze_matrix(
+                A, mode=analysis_mode(A, request.mode), sketch_rank=settings.ANALYSIS_SKETCH_RANK
+            ))
+        except Exception as e:
+            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+    
+    return cached_response("analyze", request, if_none_match, compute)
+
+@router.post("/operations", response_model=OperationsResponse)
+async def run_operations(request: OperationsRequest, if_none_match: Optional[str] = Header(None)):
+    """
+    Effectuer plusieurs opérations sur une même matrice
+    
+    - **operations**: parmi 'solve', 'determinant', 'inverse', 'analyze'
+    
+    La factorisation LU (pivotage partiel) et les valeurs singulières sont
+    calculées une seule fois et partagées entre les opérations. `timings`
+    donne la durée de chaque calcul partagé et de chaque opération (hors
+    calculs partagés). Une opération impossible (ex: inverse d'une matrice
+    singulière) est signalée dans sa sous-réponse sans bloquer les autres.
+    """
+    check_upload(request.matrix_a, request.vector_b if "solve" in request.operations else None, square=True)
+    def compute():
+        start_time = time.time()
+        A = matrix_to_numpy(request.matrix_a)
+        shared = SharedFactorization(A, tolerance=solver.tolerance)
         
-        return AnalysisResponse(
-            success=True,
-            determinant=analysis.get('determinant'),
-            condition_number=analysis.get('condition_number'),
-            is_singular=analysis.get('is_singular', False),
-            is_symmetric=analysis.get('is_symmetric', False),
-            is_positive_definite=analysis.get('is_positive_definite'),
-            eigenvalues=analysis.get('eigenvalues'),
-            rank=analysis.get('rank'),
-            properties=analysis,
-            recommendations=analysis.get('recommendations', []),
-            execution_time=analysis['execution_time']
+        def solve():
+            b = vector_to_numpy(request.vector_b)
+            x = shared.lu.solve(b)
+            s = shared.singular_values
+            return SolveResponse(
+                success=True,
+                solution=x.tolist(),
+                residual_error=calculate_residual(A, x, b),
+                method="lu",
+                execution_time=0.0,
+                matrix_condition=float(s[0] / s[-1]) if s[-1] > 0 else None,
+                determinant=shared.lu.determinant(),
+                engine="reference",
+                message="Système résolu avec succès (factorisation partagée)"
+            )
+        
+        def determinant():
+            det = shared.lu.determinant()
+            return DeterminantResponse(
+                success=True,
+                determinant=det,
+                method="lu_partial_pivoting",
+                engine="reference",
+                execution_time=0.0,
+                message=f"Déterminant calculé: {det:.6e}"
+            )
+        
+        def inverse():
+            A_inv = shared.lu.inverse()
+            return InverseResponse(
+                success=True,
+                matrix_inverse=numpy_to_list(A_inv),
+                verification=float(np.linalg.norm(A @ A_inv - np.eye(A.shape[0]))),
+                engine="reference",
+                execution_time=0.0,
+                message="Matrice inverse calculée avec succès"
+            )
+        
+        def analyze():
+            return analysis_response(solver.analyze_matrix(
+                A, shared=shared, mode=analysis_mode(A), sketch_rank=settings.ANALYSIS_SKETCH_RANK
+            ))
+        
+        failures = {
+            'solve': lambda message: SolveResponse(success=False, method="lu", execution_time=0.0, message=message),
+            'inverse': lambda message: InverseResponse(success=False, execution_time=0.0, message=message),
+        }
+        operations = {'solve': solve, 'determinant': determinant, 'inverse': inverse, 'analyze': analyze}
+        
+        results = {}
+        timings = {}
+        for operation in request.operations:
+            shared_before = sum(shared.timings.values())
+            op_start = time.time()
+            try:
+                result = operations[operation]()
+            except ValueError as e:
+                if operation not in failures:
+                    raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+                result = failures[operation](str(e))
+            except Exception as e:
+                raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+            # Les calculs partagés déclenchés par cette opération sont comptés à part
+            elapsed = time.time() - op_start - (sum(shared.timings.values()) - shared_before)
+            result.execution_time = elapsed
+            results[operation] = result
+            timings[operation] = elapsed
+        
+        success = all(result.success for result in results.values())
+        return OperationsResponse(
+            success=success,
+            **results,
+            timings={**shared.timings, **timings},
+            execution_time=time.time() - start_time,
+            message=f"{len(results)} opération(s) effectuée(s) avec une factorisation partagée"
         )
-    except Exception as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+    
+    return cached_response("operations", request, if_none_match, compute)
+
+def build_turing_machine(request: TuringMachineRequest) -> TuringMachine:
+    """Machine de Turing décrite par une requête (mono ou multi-rubans)"""
+    # Déterminer le nombre de rubans
+    if request.initial_tapes is not None:
+        # Multi-rubans
+        tapes = request.initial_tapes
+        num_tapes = len(tapes)
+        head_positions = request.head_positions if request.head_positions else [0] * num_tapes
+    else:
+        # Mono-ruban
+        tapes = [request.initial_tape or ""]
+        num_tapes = 1
+        head_positions = [request.head_position]
+
+    # Convertir les transitions au format attendu
+    transitions = []
+    for trans in request.transitions:
+        trans_dict = {
+            'current_state': trans.current_state,
+            'next_state': trans.next_state
+        }
+        
+        if num_tapes == 1:
+            # Mono-ruban
+            trans_dict['read_symbol'] = trans.read_symbol
+            trans_dict['write_symbol'] = trans.write_symbol
+            trans_dict['move_direction'] = trans.move_direction
+        else:
+            # Multi-rubans
+            trans_dict['read_symbols'] = trans.read_symbols
+            trans_dict['write_symbols'] = trans.write_symbols
+            trans_dict['move_directions'] = trans.move_directions
+        
+        transitions.append(trans_dict)
+
+    # Créer la machine de Turing
+    return TuringMachine(
+        tapes=tapes,
+        blank_symbol=request.blank_symbol,
+        initial_state=request.initial_state,
+        final_states=request.final_states,
+        transitions=transitions,
+        head_positions=head_positions,
+        detect_loops=request.detect_loops,
+        loop_detection=request.loop_detection,
+        loop_memory=request.loop_memory
+    )
 
 @router.post("/turing/simulate", response_model=TuringMachineResponse)
-async def simulate_turing_machine(request: TuringMachineRequest):
+async def simulate_turing_machine(request: TuringMachineRequest, if_none_match: Optional[str] = Header(None)):
     """
     Simuler l'exécution d'une machine de Turing
     
@@ -168,6 +682,13 @@ async def simulate_turing_machine(request: TuringMachineRequest):
     - **final_states**: États acceptants
     - **max_steps**: Limite d'étapes (défaut: 1000, max: 100000)
     - **detect_loops**: Détecter les boucles infinies (défaut: true)
+    - **loop_detection**: exact (défaut) ou bounded (mémoire bornée, runs longs)
+    - **trace**: none, summary, sampled ou full (défaut) pour les étapes retournées
+
+    Les balayages d'une machine mono-ruban sont exécutés en macro-pas
+    seulement sans historique (trace summary ou none) et avec loop_detection
+    exact ou detect_loops false: les valeurs par défaut (trace full)
+    exécutent chaque étape.
     
     Supporte:
     - Machines mono-ruban et multi-rubans (jusqu'à 10 rubans)
@@ -175,94 +696,271 @@ async def simulate_turing_machine(request: TuringMachineRequest):
     - Animation frame-by-frame
     - Exécution jusqu'à 100000 étapes
     """
-    try:
-        # Déterminer le nombre de rubans
-        if request.initial_tapes is not None:
-            # Multi-rubans
-            tapes = request.initial_tapes
-            num_tapes = len(tapes)
-            head_positions = request.head_positions if request.head_positions else [0] * num_tapes
-        else:
-            # Mono-ruban
-            tapes = [request.initial_tape or ""]
-            num_tapes = 1
-            head_positions = [request.head_position]
+    def compute():
+        try:
+            tm = build_turing_machine(request)
         
-        # Convertir les transitions au format attendu
-        transitions = []
-        for trans in request.transitions:
-            trans_dict = {
-                'current_state': trans.current_state,
-                'next_state': trans.next_state
-            }
-            
-            if num_tapes == 1:
-                # Mono-ruban
-                trans_dict['read_symbol'] = trans.read_symbol
-                trans_dict['write_symbol'] = trans.write_symbol
-                trans_dict['move_direction'] = trans.move_direction
-            else:
-                # Multi-rubans
-                trans_dict['read_symbols'] = trans.read_symbols
-                trans_dict['write_symbols'] = trans.write_symbols
-                trans_dict['move_directions'] = trans.move_directions
-            
-            transitions.append(trans_dict)
-        
-        # Créer et exécuter la machine de Turing
-        tm = TuringMachine(
-            tapes=tapes,
-            blank_symbol=request.blank_symbol,
-            initial_state=request.initial_state,
-            final_states=request.final_states,
-            transitions=transitions,
-            head_positions=head_positions,
-            detect_loops=request.detect_loops
-        )
+            # Exécuter avec données d'animation
+            result = tm.run_with_animation_data(
+                max_steps=request.max_steps,
+                trace=request.trace,
+                sample_every=request.sample_every,
+                sample_frames=request.sample_frames
+            )
         
-        # Exécuter avec données d'animation
-        result = tm.run_with_animation_data(max_steps=request.max_steps)
+            # Convertir les étapes au format Pydantic
+            execution_steps = [
+                TuringExecutionStep(
+                    step_number=step['step_number'],
+                    current_state=step['current_state'],
+                    tape_contents=step['tape_contents'],
+                    head_positions=step['head_positions'],
+                    symbols_read=step['symbols_read'],
+                    action_taken=step.get('action_taken')
+                )
+                for step in result['execution_steps']
+            ]
         
-        # Convertir les étapes au format Pydantic
-        execution_steps = [
-            TuringExecutionStep(
-                step_number=step['step_number'],
-                current_state=step['current_state'],
-                tape_contents=step['tape_contents'],
-                head_positions=step['head_positions'],
-                symbols_read=step['symbols_read'],
-                action_taken=step.get('action_taken')
+            return TuringMachineResponse(
+                success=result['success'],
+                accepted=result.get('accepted'),
+                final_tapes=result.get('final_tapes'),
+                final_state=result.get('final_state'),
+                execution_steps=execution_steps,
+                total_steps=result['total_steps'],
+                halted=result['halted'],
+                halt_reason=result.get('halt_reason'),
+                loop_detected=result.get('loop_detected', False),
+                loop_start=result.get('loop_start'),
+                loop_length=result.get('loop_length'),
+                execution_time=result['execution_time'],
+                message=result.get('message'),
+                num_tapes=result['num_tapes'],
+                trace=result.get('trace'),
+                animation_frames=result.get('animation_frames')
             )
-            for step in result['execution_steps']
-        ]
-        
-        return TuringMachineResponse(
-            success=result['success'],
-            accepted=result.get('accepted'),
-            final_tapes=result.get('final_tapes'),
-            final_state=result.get('final_state'),
-            execution_steps=execution_steps,
-            total_steps=result['total_steps'],
-            halted=result['halted'],
-            halt_reason=result.get('halt_reason'),
-            loop_detected=result.get('loop_detected', False),
-            execution_time=result['execution_time'],
-            message=result.get('message'),
-            num_tapes=result['num_tapes'],
-            animation_frames=result.get('animation_frames')
-        )
         
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Erreur de validation: {str(e)}"
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Erreur lors de la simulation: {str(e)}"
+            )
+    
+    return cached_response("turing/simulate", request, if_none_match, compute)
+
+@router.post("/turing/stream")
+async def stream_turing_machine(request: TuringStreamRequest):
+    """
+    Exécuter une machine de Turing en flux (SSE)
+    
+    La machine avance par lots de `batch_size` étapes; chaque lot produit un
+    événement `steps` (une étape sur `every`). Le lot suivant n'est calculé
+    qu'une fois le précédent transmis: un client lent ralentit l'exécution et
+    la mémoire de la session reste bornée. Le premier événement (`session`)
+    donne l'identifiant à utiliser avec `/turing/stream/{session_id}/pause`,
+    `/resume` et `/cancel`. Le dernier est `result` (ou `cancelled`, `error`).
+    Chaque étape étant enregistrée, le flux n'effectue pas de macro-pas.
+    """
+    try:
+        tm = build_turing_machine(request)
+        session = turing_streams.open()
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Erreur de validation: {str(e)}"
         )
-    except Exception as e:
+    except StreamLimitExceeded as e:
+        raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=str(e))
+    
+    async def stream():
+        try:
+            async for event, data in stream_execution(
+                tm, session,
+                max_steps=request.max_steps,
+                batch_size=request.batch_size,
+                every=request.every,
+                pause_timeout=settings.TURING_STREAM_PAUSE_TIMEOUT
+            ):
+                yield format_sse(event, data)
+        except Exception as e:
+            yield format_sse("error", {"detail": f"Erreur lors de la simulation: {str(e)}"})
+        finally:
+            # Fin normale, annulation ou déconnexion du client
+            turing_streams.close(session.session_id)
+    
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.post("/turing/stream/{session_id}/{action}", response_model=TuringStreamStatus)
+async def control_turing_stream(session_id: str, action: Literal["pause", "resume", "cancel"]):
+    """Mettre en pause, reprendre ou annuler une exécution en flux (effet entre deux lots)"""
+    try:
+        session = turing_streams.get(session_id)
+    except KeyError:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Erreur lors de la simulation: {str(e)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Session inconnue ou terminée: {session_id}"
         )
+    getattr(session, action)()
+    return TuringStreamStatus(**session.status())
+
+
+@router.post("/generate", response_model=GeneratedMatrixResponse)
+async def generate_test_matrix(request: MatrixGenerator, if_none_match: Optional[str] = Header(None)):
+    """
+    Générer une matrice de test d'après une spécification et une graine
+    
+    - **kind**: 'random', 'spd', 'hilbert', 'poisson2d', 'banded', 'conditioned'
+    - **n**: taille; **seed**: graine
+    - **bandwidth** ('banded'), **condition_number** ('conditioned')
+    
+    La même spécification peut être passée directement aux endpoints de
+    calcul (`{"matrix_a": {"generator": {...}}}`) sans transférer la matrice.
+    """
+    def compute():
+        try:
+            start_time = time.time()
+            A = generate_matrix(**request.model_dump())
+            return GeneratedMatrixResponse(
+                success=True,
+                kind=request.kind,
+                shape=list(A.shape),
+                matrix=numpy_to_list(A),
+                execution_time=time.time() - start_time,
+                message=f"Matrice '{request.kind}' {A.shape[0]}×{A.shape[1]} générée (graine {request.seed})"
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    return cached_response("generate", request, if_none_match, compute)
+
+@router.post("/upload", response_model=UploadResponse)
+async def upload_matrix(
+    request: Request,
+    format: Optional[Literal["csv", "mtx", "npy"]] = Query(None, description="Format (sinon d'après l'extension)")
+):
+    """
+    Importer une matrice depuis un fichier (multipart/form-data, champ `file`)
+    
+    - **CSV**: valeurs numériques séparées par ',' ';' ou tabulation
+    - **MatrixMarket** (.mtx): 'array' (dense) ou 'coordinate', général ou symétrique
+    - **NumPy** (.npy): tableau 2-D numérique
+    
+    Le corps est analysé au fil de la réception et écrit dans un tableau
+    préalloué en mémoire projetée; la limite de taille est vérifiée à chaque
+    morceau. L'`upload_id` renvoyé s'utilise ensuite dans n'importe quelle
+    opération: `{"matrix_a": {"upload_id": "..."}}`.
+    """
+    start_time = time.time()
+    max_bytes = settings.UPLOAD_MAX_BYTES
+    
+    content_type, params = parse_options_header(request.headers.get("content-type", ""))
+    if content_type != b"multipart/form-data" or b"boundary" not in params:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Requête multipart/form-data attendue (champ 'file')")
+    content_length = request.headers.get("content-length")
+    if content_length is not None and content_length.isdigit() and int(content_length) > max_bytes + 64 * 1024:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Fichier trop volumineux (limite: {max_bytes} octets)"
+        )
+    
+    part = {'headers': {}, 'field': b"", 'value': b""}
+    upload = {'session': None, 'active': False, 'result': None}
+    
+    def on_header_field(data, start, end):
+        part['field'] += data[start:end]
+    
+    def on_header_value(data, start, end):
+        part['value'] += data[start:end]
+    
+    def on_header_end():
+        part['headers'][part['field'].lower()] = part['value']
+        part['field'] = part['value'] = b""
+    
+    def on_headers_finished():
+        _, disposition = parse_options_header(part['headers'].get(b"content-disposition", b""))
+        upload['active'] = disposition.get(b"name") == b"file"
+        if not upload['active']:
+            return
+        if upload['session'] is not None:
+            raise UploadError("Un seul fichier par import")
+        filename = disposition.get(b"filename", b"").decode("utf-8", "replace")
+        file_format = format or infer_format(filename)
+        if file_format is None:
+            raise UploadError(f"Format non reconnu pour '{filename}' (préciser ?format=csv|mtx|npy)")
+        upload['session'] = upload_store.session(file_format, max_bytes, settings.MAX_MATRIX_SIZE)
+    
+    def on_part_data(data, start, end):
+        if upload['active']:
+            upload['session'].feed(data[start:end])
+    
+    def on_part_end():
+        if upload['active']:
+            upload['result'] = upload['session'].finish()
+            upload['active'] = False
+        part['headers'] = {}
+    
+    parser = MultipartParser(params[b"boundary"], {
+        'on_header_field': on_header_field,
+        'on_header_value': on_header_value,
+        'on_header_end': on_header_end,
+        'on_headers_finished': on_headers_finished,
+        'on_part_data': on_part_data,
+        'on_part_end': on_part_end,
+    })
+    
+    # Analyse et écriture du memmap hors de la boucle d'événements (les
+    # rappels du parseur, dont feed / finish, s'exécutent dans le threadpool)
+    try:
+        async for chunk in request.stream():
+            await run_in_threadpool(parser.write, chunk)
+        await run_in_threadpool(parser.finalize)
+        if upload['result'] is None:
+            raise UploadError("Aucun fichier reçu (champ 'file')")
+    except UploadTooLarge as e:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(e))
+    except (UploadError, ValueError) as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    finally:
+        # Toute interruption (déconnexion du client, erreur disque...): pas de fichier partiel
+        if upload['session'] is not None and upload['result'] is None:
+            upload['session'].abort()
+    
+    upload_id, shape = upload['result']
+    session = upload['session']
+    return UploadResponse(
+        success=True,
+        upload_id=upload_id,
+        format=session.format,
+        shape=list(shape),
+        bytes_received=session.bytes_received,
+        execution_time=time.time() - start_time,
+        message=f"Matrice {shape[0]}×{shape[1]} importée ({session.format})"
+    )
+
+@router.delete("/upload/{upload_id}")
+async def delete_upload(upload_id: str):
+    """Supprimer une matrice importée"""
+    try:
+        deleted = upload_store.delete(upload_id)
+    except UploadError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if not deleted:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Import inconnu ou expiré: {upload_id}")
+    return {"success": True, "upload_id": upload_id}
 
+@router.get("/engines")
+async def list_engines():
+    """Moteurs de calcul disponibles, opérations prises en charge et seuils de sélection automatique"""
+    return {"engines": engines.describe()}
 
 @router.get("/health")
 async def health_check():
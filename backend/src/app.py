@@ -2,13 +2,21 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from src.config import settings
-from src.api.routes import router
+from src.api.routes import router, shutdown_block_pool
+from contextlib import asynccontextmanager
 import time
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Arrêt propre: workers du pool des résolutions par blocs"""
+    yield
+    shutdown_block_pool()
+
 app = FastAPI(
     title=settings.API_TITLE,
     description=settings.API_DESCRIPTION,
     version="1.0.0",
+    lifespan=lifespan,
     docs_url="/docs",
     redoc_url="/redoc"
 )
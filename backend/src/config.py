@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import List, Optional
 
 class Settings(BaseSettings):
     # API Config
@@ -25,6 +25,57 @@ class Settings(BaseSettings):
     MAX_MATRIX_SIZE: int = 5000
     CALCULATION_TIMEOUT: int = 30
     
+    # Cache des réponses (endpoints déterministes)
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_TTL: int = 300
+    RESPONSE_CACHE_MAX_ENTRIES: int = 256
+    RESPONSE_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    
+    # Stockage persistant partagé entre workers (SQLite, désactivé si vide)
+    RESULT_STORE_PATH: Optional[str] = None
+    RESULT_STORE_TTL: int = 86400
+    RESULT_STORE_MAX_BYTES: int = 512 * 1024 * 1024
+    # Version des clés de cache, avec l'empreinte des schémas de réponse:
+    # à incrémenter quand le contenu des réponses change sans changer leur forme
+    RESULT_STORE_VERSION: str = "1"
+    
+    # Systèmes bloc-diagonaux: pool de processus pour les sous-systèmes
+    # (None: un worker par cœur, 0: résolution séquentielle)
+    BLOCK_SOLVE_WORKERS: Optional[int] = None
+    BLOCK_PARALLEL_MIN_SIZE: int = 128
+    
+    # Moteurs de calcul: plus grand n choisi automatiquement pour chaque
+    # moteur ('reference' puis 'numpy'; au-delà: 'lapack')
+    ENGINE_REFERENCE_MAX_SIZE: int = 50
+    ENGINE_NUMPY_MAX_SIZE: int = 200
+    
+    # Export des profils de solveurs (durées par phase, flops, mémoire):
+    # fonction 'module:fonction' appelée avec chaque échantillon (désactivé si vide)
+    METRICS_HOOK: Optional[str] = None
+    
+    # Analyse approchée par esquisses aléatoires au-delà de ce n (SVD complète
+    # sinon), avec ANALYSIS_SKETCH_RANK valeurs singulières dominantes
+    ANALYSIS_SKETCH_THRESHOLD: int = 1000
+    ANALYSIS_SKETCH_RANK: int = 10
+    
+    # Import de matrices par fichier (CSV, MatrixMarket, .npy)
+    UPLOAD_DIR: Optional[str] = None
+    UPLOAD_TTL: int = 3600
+    UPLOAD_MAX_BYTES: int = 256 * 1024 * 1024
+    
+    # Machines de Turing: capacité de la table d'empreintes de la détection
+    # de boucles en mémoire bornée (loop_detection='bounded')
+    TURING_LOOP_MEMORY: int = 4096
+    
+    # Exécution en flux (/turing/stream): sessions simultanées, taille
+    # maximale d'un lot et durée maximale d'une pause (secondes)
+    TURING_STREAM_MAX_SESSIONS: int = 32
+    TURING_STREAM_MAX_BATCH: int = 10000
+    TURING_STREAM_PAUSE_TIMEOUT: float = 300.0
+    
+    # Trace d'élimination (SSE): taille maximale de la fenêtre transmise
+    TRACE_MAX_VIEWPORT: int = 64
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
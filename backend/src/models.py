@@ -1,13 +1,93 @@
 from pydantic import BaseModel, Field, validator
-from typing import List, Optional, Literal
+from typing import Dict, Iterable, List, Optional, Literal, Tuple, Union
 from datetime import datetime
+from src.config import settings
+
+class MatrixGenerator(BaseModel):
+    """Spécification d'une matrice de test générée côté serveur"""
+    kind: Literal["random", "spd", "hilbert", "poisson2d", "banded", "conditioned"] = Field(
+        ..., description="Famille de matrices"
+    )
+    n: int = Field(..., ge=1, description="Taille n (matrice n×n; carré parfait pour 'poisson2d')")
+    seed: int = Field(default=0, description="Graine (générateurs aléatoires)")
+    bandwidth: Optional[int] = Field(None, ge=0, description="Demi-largeur de bande ('banded')")
+    condition_number: Optional[float] = Field(None, ge=1.0, description="Conditionnement visé ('conditioned')")
+    
+    @validator('n')
+    def validate_size(cls, v):
+        if v > settings.MAX_MATRIX_SIZE:
+            raise ValueError(f"Taille maximale: {settings.MAX_MATRIX_SIZE} (demandé: {v})")
+        return v
+    
+    @validator('bandwidth', always=True)
+    def validate_bandwidth(cls, v, values):
+        if v is not None and values.get('kind') != "banded":
+            raise ValueError("'bandwidth' n'est utilisé que par le générateur 'banded'")
+        return v
+    
+    @validator('condition_number', always=True)
+    def validate_condition_number(cls, v, values):
+        if v is not None and values.get('kind') != "conditioned":
+            raise ValueError("'condition_number' n'est utilisé que par le générateur 'conditioned'")
+        return v
+
+class VectorGenerator(BaseModel):
+    """Spécification d'un vecteur généré côté serveur"""
+    kind: Literal["random", "ones"] = Field(default="random", description="Famille de vecteurs")
+    n: int = Field(..., ge=1, description="Taille du vecteur")
+    seed: int = Field(default=0, description="Graine ('random')")
+    
+    @validator('n')
+    def validate_size(cls, v):
+        if v > settings.MAX_MATRIX_SIZE:
+            raise ValueError(f"Taille maximale: {settings.MAX_MATRIX_SIZE} (demandé: {v})")
+        return v
+
+class StructuredMatrix(BaseModel):
+    """Forme compacte d'une matrice de Toeplitz ou circulante"""
+    kind: Literal["toeplitz", "circulant"] = Field(..., description="Structure")
+    first_column: List[float] = Field(..., min_length=1, description="Première colonne c")
+    first_row: Optional[List[float]] = Field(
+        None, description="Première ligne r ('toeplitz', r[0] = c[0]; absente: symétrique)"
+    )
+    
+    @validator('first_column')
+    def validate_size(cls, v):
+        if len(v) > settings.MAX_MATRIX_SIZE:
+            raise ValueError(f"Taille maximale: {settings.MAX_MATRIX_SIZE} (demandé: {len(v)})")
+        return v
+    
+    @validator('first_row')
+    def validate_first_row(cls, v, values):
+        if v is None:
+            return v
+        if values.get('kind') == "circulant":
+            raise ValueError("Une matrice circulante est définie par sa seule première colonne")
+        first_column = values.get('first_column')
+        if first_column is not None:
+            if len(v) != len(first_column):
+                raise ValueError(
+                    f"La première ligne doit avoir {len(first_column)} éléments (actuellement {len(v)})"
+                )
+            if v[0] != first_column[0]:
+                raise ValueError("La première ligne et la première colonne doivent partager le coefficient diagonal")
+        return v
 
 class MatrixInput(BaseModel):
-    """Modèle pour l'entrée d'une matrice"""
-    data: List[List[float]] = Field(..., description="Matrice 2D")
+    """Modèle pour l'entrée d'une matrice (données littérales, générateur ou forme compacte)"""
+    # Les entiers restent des int Python (précision arbitraire) pour le mode exact
+    data: Optional[List[List[Union[int, float]]]] = Field(None, description="Matrice 2D")
+    generator: Optional[MatrixGenerator] = Field(None, description="Matrice générée côté serveur (à la place de data)")
+    structured: Optional[StructuredMatrix] = Field(
+        None, description="Matrice de Toeplitz / circulante par sa première colonne (et ligne)"
+    )
+    upload_id: Optional[str] = Field(None, description="Matrice importée par fichier (voir /upload)")
     
     @validator('data')
     def validate_matrix(cls, v):
+        if v is None:
+            return v
+        
         if not v:
             raise ValueError("La matrice ne peut pas être vide")
         
@@ -21,42 +101,169 @@ class MatrixInput(BaseModel):
             raise ValueError("Toutes les lignes doivent avoir la même longueur")
         
         return v
+    
+    @validator('upload_id', always=True)
+    def validate_source(cls, v, values):
+        if 'data' in values and 'generator' in values and 'structured' in values:
+            sources = [s for s in (values['data'], values['generator'], values['structured'], v) if s is not None]
+            if len(sources) != 1:
+                raise ValueError("Fournir exactement une source: 'data', 'generator', 'structured' ou 'upload_id'")
+        return v
+    
+    @property
+    def shape(self) -> Optional[Tuple[int, int]]:
+        """
+        Dimensions (lignes, colonnes) sans construire la matrice; None pour une
+        matrice importée (existence et dimensions vérifiées par la route)
+        """
+        if self.generator is not None:
+            return self.generator.n, self.generator.n
+        if self.structured is not None:
+            n = len(self.structured.first_column)
+            return n, n
+        if self.upload_id is not None:
+            return None
+        return len(self.data), len(self.data[0])
 
 class VectorInput(BaseModel):
-    """Modèle pour l'entrée d'un vecteur"""
-    data: List[float] = Field(..., description="Vecteur 1D")
+    """Modèle pour l'entrée d'un vecteur (données littérales ou générateur)"""
+    data: Optional[List[Union[int, float]]] = Field(None, description="Vecteur 1D")
+    generator: Optional[VectorGenerator] = Field(None, description="Vecteur généré côté serveur (à la place de data)")
     
     @validator('data')
     def validate_vector(cls, v):
+        if v is None:
+            return v
         if not v:
             raise ValueError("Le vecteur ne peut pas être vide")
         return v
+    
+    @validator('generator', always=True)
+    def validate_source(cls, v, values):
+        if 'data' in values and (values['data'] is None) == (v is None):
+            raise ValueError("Fournir soit 'data', soit 'generator'")
+        return v
+    
+    @property
+    def size(self) -> int:
+        """Taille sans générer le vecteur"""
+        return self.generator.n if self.generator is not None else len(self.data)
+
+class RationalNumber(BaseModel):
+    """Nombre rationnel exact (entiers en base 10, précision arbitraire)"""
+    numerator: str = Field(..., description="Numérateur")
+    denominator: str = Field(..., description="Dénominateur (> 0)")
+
+class ReorderingReport(BaseModel):
+    """Effet d'une renumérotation symétrique P·A·Pᵀ"""
+    method: str = Field(..., description="Renumérotation ('rcm', 'minimum_degree' ou 'none')")
+    permutation: List[int] = Field(..., description="Ordre des inconnues: ligne i de P·A·Pᵀ = ligne permutation[i] de A")
+    nnz: int = Field(..., description="Entrées non nulles du motif symétrisé de A")
+    bandwidth_before: int = Field(..., description="Demi-largeur de bande avant")
+    bandwidth_after: int = Field(..., description="Demi-largeur de bande après")
+    fill_before: int = Field(..., description="Remplissage prédit de L + U avant")
+    fill_after: int = Field(..., description="Remplissage prédit de L + U après")
+
+EngineName = Literal["reference", "numpy", "lapack"]
+
+class SolverProfileReport(BaseModel):
+    """Profil d'exécution d'un solveur"""
+    phases: Dict[str, float] = Field(..., description="Durée (s) par phase: pivoting, elimination, substitution, verification...")
+    flops: int = Field(..., description="Opérations flottantes (comptées ou estimées)")
+    gflops: Optional[float] = Field(None, description="Débit atteint (GFLOP/s)")
+    peak_bytes: int = Field(..., description="Pic des tableaux de travail alloués (octets)")
+
+ENGINE_DESCRIPTION = (
+    "Moteur imposé ('reference': Python pas à pas, 'numpy': LU par blocs, 'lapack': scipy.linalg); "
+    "par défaut choisi selon la taille"
+)
+
+# Au-delà de 2^53, un nombre JSON à virgule a pu être arrondi au décodage
+EXACT_FLOAT_LIMIT = 2 ** 53
+
+def check_exact_values(values: Iterable[Union[int, float]]):
+    """Refuser en mode exact les flottants dont la valeur écrite n'est plus garantie"""
+    for value in values:
+        if isinstance(value, float) and abs(value) > EXACT_FLOAT_LIMIT:
+            raise ValueError(
+                f"Valeur {value:g} imprécise en mode exact (flottant au-delà de 2^53): "
+                "l'écrire comme un entier, sans partie décimale ni exposant"
+            )
 
 class SolveRequest(BaseModel):
     """Requête pour résoudre un système Ax = b"""
-    matrix_a: MatrixInput = Field(..., description="Matrice A (n×n)")
+    matrix_a: MatrixInput = Field(..., description="Matrice A (n×n, ou m×n pour 'qr')")
     vector_b: VectorInput = Field(..., description="Vecteur b (n,)")
-    method: Literal["gauss", "lu"] = Field(
+    method: Literal["gauss", "lu", "qr"] = Field(
         default="gauss",
-        description="Méthode de résolution"
+        description="Méthode de résolution ('qr': moindres carrés, A rectangulaire acceptée)"
+    )
+    column_pivoting: bool = Field(
+        default=False,
+        description="Pivotage de colonnes révélateur de rang (méthode 'qr')"
+    )
+    exact: bool = Field(
+        default=False,
+        description="Arithmétique exacte (Bareiss): solution rationnelle exacte"
     )
+    reordering: Literal["none", "rcm", "minimum_degree"] = Field(
+        default="none",
+        description="Renumérotation avant factorisation ('rcm': largeur de bande, 'minimum_degree': remplissage)"
+    )
+    detect_structure: bool = Field(
+        default=True,
+        description="Résolution rapide des matrices de Toeplitz (Levinson), circulantes (FFT) "
+                    "et bloc-diagonales à une permutation près (sous-systèmes en parallèle)"
+    )
+    engine: Optional[EngineName] = Field(default=None, description=ENGINE_DESCRIPTION)
     
     @validator('vector_b')
     def validate_dimensions(cls, v, values):
-        if 'matrix_a' in values:
-            matrix_a = values['matrix_a']
-            n_rows = len(matrix_a.data)
-            n_cols = len(matrix_a.data[0]) if matrix_a.data else 0
+        if 'matrix_a' in values and values['matrix_a'].shape is not None:
+            n_rows = values['matrix_a'].shape[0]
             
-            if n_rows != n_cols:
-                raise ValueError(f"La matrice A doit être carrée (actuellement {n_rows}×{n_cols})")
+            if v.size != n_rows:
+                raise ValueError(
+                    f"Le vecteur b doit avoir {n_rows} éléments (actuellement {v.size})"
+                )
+        
+        return v
+    
+    @validator('method', always=True)
+    def validate_square(cls, v, values):
+        if v != "qr" and 'matrix_a' in values and values['matrix_a'].shape is not None:
+            n_rows, n_cols = values['matrix_a'].shape
             
-            if len(v.data) != n_rows:
+            if n_rows != n_cols:
                 raise ValueError(
-                    f"Le vecteur b doit avoir {n_rows} éléments (actuellement {len(v.data)})"
+                    f"La matrice A doit être carrée (actuellement {n_rows}×{n_cols}); "
+                    "utiliser la méthode 'qr' pour les moindres carrés"
                 )
         
         return v
+    
+    @validator('exact')
+    def validate_exact(cls, v, values):
+        if v and values.get('method') == "qr":
+            raise ValueError("Le mode exact n'est pas disponible pour la méthode 'qr'")
+        if v:
+            if 'matrix_a' in values and values['matrix_a'].data is not None:
+                check_exact_values(x for row in values['matrix_a'].data for x in row)
+            if 'vector_b' in values and values['vector_b'].data is not None:
+                check_exact_values(values['vector_b'].data)
+        return v
+    
+    @validator('reordering')
+    def validate_reordering(cls, v, values):
+        if v != "none" and (values.get('method') == "qr" or values.get('exact')):
+            raise ValueError("La renumérotation n'est disponible que pour les méthodes 'gauss' et 'lu'")
+        return v
+    
+    @validator('engine')
+    def validate_engine(cls, v, values):
+        if v not in (None, "reference") and (values.get('exact') or values.get('reordering', "none") != "none"):
+            raise ValueError("Le mode exact et la renumérotation n'existent que dans le moteur 'reference'")
+        return v
 
 class SolveResponse(BaseModel):
     """Réponse pour la résolution d'un système"""
@@ -67,41 +274,111 @@ class SolveResponse(BaseModel):
     execution_time: float = Field(..., description="Temps d'exécution (secondes)")
     matrix_condition: Optional[float] = Field(None, description="Nombre de conditionnement")
     determinant: Optional[float] = Field(None, description="Déterminant de A")
+    rank: Optional[int] = Field(None, description="Rang numérique de A (méthode 'qr')")
+    solution_exact: Optional[List[RationalNumber]] = Field(None, description="Solution exacte (mode exact)")
+    determinant_exact: Optional[RationalNumber] = Field(None, description="Déterminant exact (mode exact)")
+    reordering: Optional[ReorderingReport] = Field(None, description="Rapport de renumérotation")
+    structure: Optional[str] = Field(None, description="Structure exploitée ('toeplitz', 'circulant', 'block_diagonal')")
+    blocks: Optional[List[List[int]]] = Field(None, description="Indices des inconnues de chaque bloc indépendant")
+    engine: Optional[str] = Field(None, description="Moteur de calcul utilisé")
+    profile: Optional[SolverProfileReport] = Field(None, description="Profil d'exécution du solveur")
     message: Optional[str] = Field(None, description="Message d'information")
 
+class TraceViewport(BaseModel):
+    """Fenêtre de la matrice transmise pendant une trace (bornes exclusives en fin)"""
+    row_start: int = Field(default=0, ge=0)
+    row_end: Optional[int] = Field(None, ge=0)
+    col_start: int = Field(default=0, ge=0)
+    col_end: Optional[int] = Field(None, ge=0)
+
+class EliminationTraceRequest(BaseModel):
+    """Requête pour tracer pas à pas une élimination (flux SSE)"""
+    matrix_a: MatrixInput = Field(..., description="Matrice A (n×n)")
+    vector_b: Optional[VectorInput] = Field(None, description="Vecteur b (requis pour 'gauss')")
+    method: Literal["gauss", "lu"] = Field(default="gauss", description="Algorithme tracé")
+    viewport: Optional[TraceViewport] = Field(None, description="Fenêtre visible (défaut: coin supérieur gauche)")
+    
+    @validator('matrix_a')
+    def validate_square(cls, v):
+        if v.shape is not None and v.shape[0] != v.shape[1]:
+            raise ValueError(f"La matrice A doit être carrée (actuellement {v.shape[0]}×{v.shape[1]})")
+        return v
+    
+    @validator('method', always=True)
+    def validate_vector(cls, v, values):
+        vector_b = values.get('vector_b')
+        if v == "gauss":
+            if vector_b is None:
+                raise ValueError("Le vecteur b est requis pour la méthode 'gauss'")
+            shape = values['matrix_a'].shape if 'matrix_a' in values else None
+            if shape is not None and vector_b.size != shape[0]:
+                raise ValueError(
+                    f"Le vecteur b doit avoir {shape[0]} éléments "
+                    f"(actuellement {vector_b.size})"
+                )
+        return v
+
 class DecomposeLURequest(BaseModel):
     """Requête pour décomposition LU"""
     matrix_a: MatrixInput = Field(..., description="Matrice A à décomposer")
+    engine: Optional[EngineName] = Field(default=None, description=ENGINE_DESCRIPTION)
 
 class DecomposeLUResponse(BaseModel):
     """Réponse pour décomposition LU"""
     success: bool
     matrix_l: Optional[List[List[float]]] = Field(None, description="Matrice L")
     matrix_u: Optional[List[List[float]]] = Field(None, description="Matrice U")
+    engine: Optional[str] = Field(None, description="Moteur de calcul utilisé")
+    profile: Optional[SolverProfileReport] = Field(None, description="Profil d'exécution du solveur")
     execution_time: float
     message: Optional[str] = None
 
 class DeterminantRequest(BaseModel):
     """Requête pour calcul du déterminant"""
     matrix_a: MatrixInput = Field(..., description="Matrice A")
+    exact: bool = Field(default=False, description="Déterminant exact (entiers/rationnels)")
+    detect_structure: bool = Field(
+        default=True,
+        description="Déterminant rapide des matrices de Toeplitz (Levinson) et circulantes (FFT)"
+    )
+    engine: Optional[EngineName] = Field(default=None, description=ENGINE_DESCRIPTION)
+    
+    @validator('exact')
+    def validate_exact(cls, v, values):
+        if v and 'matrix_a' in values and values['matrix_a'].data is not None:
+            check_exact_values(x for row in values['matrix_a'].data for x in row)
+        return v
+    
+    @validator('engine')
+    def validate_engine(cls, v, values):
+        if v not in (None, "reference") and values.get('exact'):
+            raise ValueError("Le mode exact n'existe que dans le moteur 'reference'")
+        return v
 
 class DeterminantResponse(BaseModel):
     """Réponse pour calcul du déterminant"""
     success: bool
     determinant: Optional[float] = None
+    determinant_exact: Optional[RationalNumber] = Field(None, description="Déterminant exact (mode exact)")
+    structure: Optional[str] = Field(None, description="Structure exploitée ('toeplitz', 'circulant')")
     method: str = "lu_decomposition"
+    engine: Optional[str] = Field(None, description="Moteur de calcul utilisé")
+    profile: Optional[SolverProfileReport] = Field(None, description="Profil d'exécution du solveur")
     execution_time: float
     message: Optional[str] = None
 
 class InverseRequest(BaseModel):
     """Requête pour calcul de l'inverse"""
     matrix_a: MatrixInput = Field(..., description="Matrice A")
+    engine: Optional[EngineName] = Field(default=None, description=ENGINE_DESCRIPTION)
 
 class InverseResponse(BaseModel):
     """Réponse pour calcul de l'inverse"""
     success: bool
     matrix_inverse: Optional[List[List[float]]] = Field(None, description="Matrice A⁻¹")
     verification: Optional[float] = Field(None, description="||A·A⁻¹ - I||")
+    engine: Optional[str] = Field(None, description="Moteur de calcul utilisé")
+    profile: Optional[SolverProfileReport] = Field(None, description="Profil d'exécution du solveur")
     execution_time: float
     message: Optional[str] = None
 
@@ -109,6 +386,25 @@ class AnalysisRequest(BaseModel):
     """Requête pour analyse complète"""
     matrix_a: MatrixInput
     vector_b: Optional[VectorInput] = None
+    mode: Optional[Literal["exact", "approximate"]] = Field(
+        default=None,
+        description="'exact' (SVD complète) ou 'approximate' (esquisses aléatoires avec bornes); "
+                    "par défaut approché au-delà de ANALYSIS_SKETCH_THRESHOLD"
+    )
+
+class SpectrumEstimates(BaseModel):
+    """Estimations par esquisses aléatoires: intervalles [min, max] vrais simultanément avec la confiance indiquée"""
+    singular_values: List[float] = Field(..., description="Valeurs singulières dominantes (minorants)")
+    singular_value_error: float = Field(..., description="Erreur additive maximale de chaque valeur dominante")
+    largest_singular_value_bounds: List[float]
+    smallest_singular_value: Optional[float] = None
+    smallest_singular_value_bounds: Optional[List[float]] = None
+    condition_number_bounds: Optional[List[Optional[float]]] = None
+    rank_bounds: List[int]
+    confidence: float = Field(..., description="Probabilité que toutes les bornes soient vraies")
+    sketch_size: int
+    power_iterations: int
+    probes: int
 
 class AnalysisResponse(BaseModel):
     """Réponse pour analyse complète"""
@@ -120,10 +416,74 @@ class AnalysisResponse(BaseModel):
     is_positive_definite: Optional[bool] = None
     eigenvalues: Optional[List[float]] = None
     rank: Optional[int] = None
+    mode: str = Field(default="exact", description="Analyse 'exact' ou 'approximate'")
+    estimates: Optional[SpectrumEstimates] = Field(None, description="Bornes d'erreur (mode approché)")
     properties: dict = Field(default_factory=dict)
     recommendations: List[str] = Field(default_factory=list)
     execution_time: float
 
+class GeneratedMatrixResponse(BaseModel):
+    """Réponse pour la génération d'une matrice de test"""
+    success: bool
+    kind: str = Field(..., description="Famille de matrices")
+    shape: List[int] = Field(..., description="Dimensions [lignes, colonnes]")
+    matrix: List[List[float]] = Field(..., description="Matrice générée")
+    execution_time: float
+    message: Optional[str] = None
+
+class UploadResponse(BaseModel):
+    """Réponse pour l'import d'une matrice par fichier"""
+    success: bool
+    upload_id: str = Field(..., description="Identifiant à passer dans matrix_a.upload_id")
+    format: str = Field(..., description="Format lu ('csv', 'mtx', 'npy')")
+    shape: List[int] = Field(..., description="Dimensions [lignes, colonnes]")
+    bytes_received: int = Field(..., description="Taille du fichier reçu (octets)")
+    execution_time: float
+    message: Optional[str] = None
+
+class OperationsRequest(BaseModel):
+    """Requête pour plusieurs opérations sur une même matrice (factorisation partagée)"""
+    matrix_a: MatrixInput = Field(..., description="Matrice A (n×n)")
+    vector_b: Optional[VectorInput] = Field(None, description="Vecteur b (requis pour 'solve')")
+    operations: List[Literal["solve", "determinant", "inverse", "analyze"]] = Field(
+        ..., min_length=1, description="Opérations à effectuer"
+    )
+    
+    @validator('matrix_a')
+    def validate_square(cls, v):
+        if v.shape is not None and v.shape[0] != v.shape[1]:
+            raise ValueError(f"La matrice A doit être carrée (actuellement {v.shape[0]}×{v.shape[1]})")
+        return v
+    
+    @validator('operations')
+    def validate_operations(cls, v, values):
+        vector_b = values.get('vector_b')
+        if "solve" in v:
+            if vector_b is None:
+                raise ValueError("Le vecteur b est requis pour l'opération 'solve'")
+            shape = values['matrix_a'].shape if 'matrix_a' in values else None
+            if shape is not None and vector_b.size != shape[0]:
+                raise ValueError(
+                    f"Le vecteur b doit avoir {shape[0]} éléments "
+                    f"(actuellement {vector_b.size})"
+                )
+        # Chaque opération une seule fois, dans l'ordre demandé
+        return list(dict.fromkeys(v))
+
+class OperationsResponse(BaseModel):
+    """Réponse combinée: une sous-réponse par opération demandée"""
+    success: bool = Field(..., description="Toutes les opérations ont réussi")
+    solve: Optional[SolveResponse] = None
+    determinant: Optional[DeterminantResponse] = None
+    inverse: Optional[InverseResponse] = None
+    analyze: Optional[AnalysisResponse] = None
+    timings: Dict[str, float] = Field(
+        default_factory=dict,
+        description="Durées (s) des calculs partagés (lu_factorization, singular_values) et de chaque opération"
+    )
+    execution_time: float
+    message: Optional[str] = None
+
 
 # ============================================================================
 # TURING MACHINE MODELS
@@ -192,6 +552,25 @@ class TuringMachineRequest(BaseModel):
     head_position: Optional[int] = Field(default=0, ge=0, description="Position initiale de la tête (mono-ruban)")
     head_positions: Optional[List[int]] = Field(None, description="Positions initiales des têtes (multi-rubans)")
     detect_loops: bool = Field(default=True, description="Activer la détection de boucles infinies")
+    loop_detection: Literal["exact", "bounded"] = Field(
+        default="exact",
+        description="exact: toutes les configurations (arrêt dès la première répétition); "
+                    "bounded: mémoire bornée (Brent + table d'empreintes), arrêt légèrement différé"
+    )
+    loop_memory: int = Field(
+        default=settings.TURING_LOOP_MEMORY, ge=0, le=1000000,
+        description="Capacité de la table d'empreintes en mode bounded (0 = Brent seul)"
+    )
+    trace: Literal["none", "summary", "sampled", "full"] = Field(
+        default="full",
+        description="Étapes retournées: none (aucune), summary (configurations initiale et finale), "
+                    "sampled (échantillon), full (toutes); macro-pas seulement avec none ou summary"
+    )
+    sample_every: Optional[int] = Field(None, ge=1, description="Mode sampled: une étape sur N")
+    sample_frames: int = Field(
+        default=100, ge=2, le=10000,
+        description="Mode sampled sans sample_every: nombre d'étapes régulièrement espacées (première et dernière incluses)"
+    )
     
     @validator('initial_tapes')
     def validate_tapes(cls, v, values):
@@ -218,6 +597,26 @@ class TuringMachineRequest(BaseModel):
         return v
 
 
+class TuringStreamRequest(TuringMachineRequest):
+    """Requête d'exécution en flux (SSE); trace et sample_* sont sans effet"""
+    loop_detection: Literal["exact", "bounded"] = Field(
+        default="bounded",
+        description="bounded par défaut: mémoire de la session indépendante du nombre d'étapes"
+    )
+    batch_size: int = Field(
+        default=500, ge=1, le=settings.TURING_STREAM_MAX_BATCH,
+        description="Étapes exécutées par lot (un événement par lot)"
+    )
+    every: int = Field(default=1, ge=1, description="Transmettre une étape sur N")
+
+
+class TuringStreamStatus(BaseModel):
+    """État d'une session d'exécution en flux"""
+    session_id: str = Field(..., description="Identifiant de la session")
+    paused: bool = Field(False, description="Exécution en pause?")
+    cancelled: bool = Field(False, description="Exécution annulée?")
+
+
 class TuringExecutionStep(BaseModel):
     """Une étape d'exécution de la machine de Turing"""
     step_number: int = Field(..., description="Numéro de l'étape")
@@ -239,7 +638,10 @@ class TuringMachineResponse(BaseModel):
     halted: bool = Field(False, description="Machine arrêtée?")
     halt_reason: Optional[str] = Field(None, description="Raison de l'arrêt")
     loop_detected: bool = Field(False, description="Boucle infinie détectée?")
+    loop_start: Optional[int] = Field(None, description="Première étape du cycle détecté")
+    loop_length: Optional[int] = Field(None, description="Longueur du cycle détecté (étapes)")
     execution_time: float = Field(..., description="Temps d'exécution (secondes)")
     message: Optional[str] = Field(None, description="Message descriptif")
     num_tapes: int = Field(1, description="Nombre de rubans utilisés")
+    trace: Optional[str] = Field(None, description="Niveau de trace appliqué")
     animation_frames: Optional[List[dict]] = Field(None, description="Données pour animation")
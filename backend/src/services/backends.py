@@ -0,0 +1,339 @@
+"""
+Moteurs de calcul interchangeables et sélection automatique par taille
+'reference' (implémentation Python de MatrixSolver, pas à pas), 'numpy'
+(LU par blocs, mises à jour matrice-matrice) et 'lapack' (scipy.linalg).
+
+Chaque moteur déclare les opérations qu'il sait traiter; le registre choisit
+le premier moteur capable dont la taille limite de sélection automatique
+couvre n, sauf si le client en impose un.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+import time
+import warnings
+import numpy as np
+import scipy.linalg
+
+from src.services.factorization import LUFactorization, blocked_lu
+from src.services.matrix_solver import MatrixSolver
+from src.services.profiling import SolverProfile, lu_flops, triangular_flops
+from src.services.triangular import DEFAULT_BLOCK_SIZE
+
+# Opérations dispatchées: résolution ('gauss', 'lu', 'qr'), décomposition A = LU
+# sans pivotage, déterminant et inverse
+OPERATIONS = ("gauss", "lu", "qr", "lu_decomposition", "determinant", "inverse")
+
+
+class SolverBackend(ABC):
+    """
+    Interface commune des moteurs (mêmes signatures que MatrixSolver)
+
+    Toutes les opérations sont abstraites: un moteur incomplet échoue dès son
+    instanciation; une opération hors de capabilities lève ValueError.
+
+    Attributes:
+        name: identifiant exposé dans l'API
+        capabilities: opérations prises en charge
+        max_auto_size: plus grand n pour lequel le moteur est choisi
+            automatiquement (None: sans limite)
+    """
+
+    name = ""
+    capabilities: FrozenSet[str] = frozenset()
+
+    def __init__(self, tolerance: float = 1e-10, max_auto_size: Optional[int] = None):
+        self.tolerance = tolerance
+        self.max_auto_size = max_auto_size
+
+    def supports(self, operation: str) -> bool:
+        return operation in self.capabilities
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            'name': self.name,
+            'capabilities': sorted(self.capabilities),
+            'max_auto_size': self.max_auto_size
+        }
+
+    @abstractmethod
+    def solve(self, A: np.ndarray, b: np.ndarray, method: str = "gauss") -> Tuple[np.ndarray, Dict[str, Any]]:
+        """Résoudre Ax = b ('gauss' ou 'lu')"""
+
+    @abstractmethod
+    def least_squares(self, A: np.ndarray, b: np.ndarray, pivoting: bool = False) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """min ||Ax - b|| (A m×n)"""
+
+    @abstractmethod
+    def lu_decomposition(self, A: np.ndarray) -> Tuple[np.ndarray, np.ndarray, Dict[str, Any]]:
+        """Décomposition A = LU sans pivotage"""
+
+    @abstractmethod
+    def determinant(self, A: np.ndarray) -> Tuple[float, Dict[str, Any]]:
+        """Déterminant de A"""
+
+    @abstractmethod
+    def inverse(self, A: np.ndarray) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """Inverse de A et erreur de vérification"""
+
+    def _unsupported(self, operation: str):
+        raise ValueError(f"Le moteur '{self.name}' ne prend pas en charge l'opération '{operation}'")
+
+    def _info(self, start_time: float, method: str, profile: SolverProfile, **extra) -> Dict[str, Any]:
+        return profile.finish(
+            {**extra, 'execution_time': time.time() - start_time, 'method': method, 'engine': self.name}
+        )
+
+
+def _check_least_squares(m: int, n: int, rank: int, pivoting: bool):
+    """Mêmes conditions que la QR de référence lorsque le pivotage est désactivé"""
+    if not pivoting and m < n:
+        raise ValueError("Système sous-déterminé: activer le pivotage de colonnes")
+    if not pivoting and rank < n:
+        raise ValueError(
+            f"Matrice de rang déficient (rang {rank} < {n}): activer le pivotage de colonnes"
+        )
+
+
+def _singular_values_info(A: np.ndarray, x: np.ndarray, b: np.ndarray,
+                          rank: int, singular_values: np.ndarray) -> Dict[str, Any]:
+    return {
+        'rank': rank,
+        'residual_norm': float(np.linalg.norm(A @ x - b)),
+        'condition_number': float(singular_values[0] / singular_values[rank - 1]) if rank > 0 else None,
+        'permutation': None
+    }
+
+
+class ReferenceBackend(SolverBackend):
+    """Implémentation de référence: élimination de MatrixSolver (identique à la trace pas à pas)"""
+
+    name = "reference"
+    capabilities = frozenset(OPERATIONS)
+
+    def __init__(self, solver: MatrixSolver, max_auto_size: Optional[int] = None):
+        super().__init__(solver.tolerance, max_auto_size)
+        self.solver = solver
+
+    def solve(self, A, b, method="gauss"):
+        if method == "lu":
+            x, info = self.solver.solve_with_lu(A, b)
+        else:
+            x, info = self.solver.gauss_elimination(A, b)
+        return x, {**info, 'engine': self.name}
+
+    def least_squares(self, A, b, pivoting=False):
+        x, info = self.solver.least_squares(A, b, pivoting=pivoting)
+        return x, {**info, 'engine': self.name}
+
+    def lu_decomposition(self, A):
+        L, U, info = self.solver.lu_decomposition(A)
+        return L, U, {**info, 'engine': self.name}
+
+    def determinant(self, A):
+        det, info = self.solver.determinant(A)
+        return det, {**info, 'engine': self.name}
+
+    def inverse(self, A):
+        A_inv, info = self.solver.inverse(A)
+        return A_inv, {**info, 'engine': self.name}
+
+
+class NumpyBackend(SolverBackend):
+    """Moteur vectorisé NumPy: LU par blocs et moindres carrés numpy.linalg"""
+
+    name = "numpy"
+    capabilities = frozenset(OPERATIONS)
+
+    def __init__(self, tolerance: float = 1e-10, max_auto_size: Optional[int] = None,
+                 block_size: int = DEFAULT_BLOCK_SIZE):
+        super().__init__(tolerance, max_auto_size)
+        self.block_size = block_size
+
+    def _factor(self, A: np.ndarray, profile: SolverProfile, pivoting: bool = True) -> LUFactorization:
+        with profile.phase('factorization', flops=lu_flops(A.shape[0])):
+            factorization = blocked_lu(A, pivoting=pivoting, tolerance=self.tolerance, block_size=self.block_size)
+            profile.allocate(factorization.lu)
+        return factorization
+
+    def _solve(self, factorization: LUFactorization, B: np.ndarray, profile: SolverProfile) -> np.ndarray:
+        if factorization.singular:
+            raise ValueError("Matrice singulière détectée (pivot ≈ 0)")
+        k = 1 if B.ndim == 1 else B.shape[1]
+        with profile.phase('substitution', flops=2 * triangular_flops(factorization.n, k)):
+            X = factorization.solve(B)
+            profile.allocate(X)
+        return X
+
+    def solve(self, A, b, method="gauss"):
+        start_time = time.time()
+        profile = SolverProfile('numpy_blocked_lu', A.shape[0])
+        x = self._solve(self._factor(A, profile), b, profile)
+        return x, self._info(start_time, 'numpy_blocked_lu', profile)
+
+    def least_squares(self, A, b, pivoting=False):
+        start_time = time.time()
+        m, n = A.shape
+        profile = SolverProfile('numpy_lstsq', n)
+        # SVD (gelsd): de l'ordre de 4mn² + 8n³ (estimation)
+        with profile.phase('factorization', flops=4.0 * m * n * n + 8.0 * n ** 3):
+            x, _, rank, singular_values = np.linalg.lstsq(A, b, rcond=self.tolerance)
+            profile.allocate(np.empty((m, n)))
+        _check_least_squares(m, n, int(rank), pivoting)
+        with profile.phase('verification', flops=2.0 * m * n):
+            info = _singular_values_info(A, x, b, int(rank), singular_values)
+        return x, self._info(start_time, 'numpy_lstsq', profile, **info)
+
+    def lu_decomposition(self, A):
+        start_time = time.time()
+        profile = SolverProfile('numpy_blocked_lu', A.shape[0])
+        factorization = self._factor(A, profile, pivoting=False)
+        with profile.phase('setup'):
+            L, U = factorization.L, factorization.U
+            profile.allocate(L, U)
+        return L, U, self._info(start_time, 'numpy_blocked_lu', profile)
+
+    def determinant(self, A):
+        start_time = time.time()
+        profile = SolverProfile('numpy_blocked_lu_determinant', A.shape[0])
+        factorization = self._factor(A, profile)
+        with profile.phase('product', flops=A.shape[0]):
+            det = factorization.determinant()
+        return det, self._info(start_time, 'numpy_blocked_lu_determinant', profile)
+
+    def inverse(self, A):
+        start_time = time.time()
+        n = A.shape[0]
+        profile = SolverProfile('numpy_blocked_lu_inverse', n)
+        A_inv = self._solve(self._factor(A, profile), np.eye(n), profile)
+        with profile.phase('verification', flops=2.0 * n ** 3):
+            verification_error = float(np.linalg.norm(A @ A_inv - np.eye(n)))
+        return A_inv, self._info(
+            start_time, 'numpy_blocked_lu_inverse', profile, verification_error=verification_error
+        )
+
+
+class LapackBackend(SolverBackend):
+    """
+    Moteur LAPACK via scipy.linalg (getrf/getrs, gelsd)
+
+    getrf pivote toujours: la décomposition A = LU sans pivotage n'est pas proposée.
+    """
+
+    name = "lapack"
+    capabilities = frozenset(OPERATIONS) - {"lu_decomposition"}
+
+    def _factor(self, A: np.ndarray, profile: SolverProfile) -> Tuple[np.ndarray, np.ndarray]:
+        with profile.phase('factorization', flops=lu_flops(A.shape[0])):
+            with warnings.catch_warnings():
+                # Pivot exactement nul: signalé ci-dessous avec la tolérance du service
+                warnings.simplefilter("ignore", scipy.linalg.LinAlgWarning)
+                lu, piv = scipy.linalg.lu_factor(A, check_finite=False)
+            profile.allocate(lu, piv)
+        return lu, piv
+
+    def _solve(self, lu: np.ndarray, piv: np.ndarray, B: np.ndarray, profile: SolverProfile) -> np.ndarray:
+        with profile.phase('pivoting'):
+            diagonal = np.abs(np.diag(lu))
+            if diagonal.size and diagonal.min() < self.tolerance:
+                raise ValueError(f"Matrice singulière détectée (pivot {int(np.argmin(diagonal)) + 1} ≈ 0)")
+        k = 1 if B.ndim == 1 else B.shape[1]
+        with profile.phase('substitution', flops=2 * triangular_flops(lu.shape[0], k)):
+            X = scipy.linalg.lu_solve((lu, piv), B, check_finite=False)
+            profile.allocate(X)
+        return X
+
+    def solve(self, A, b, method="gauss"):
+        start_time = time.time()
+        profile = SolverProfile('lapack_getrf', A.shape[0])
+        x = self._solve(*self._factor(A, profile), b, profile)
+        return x, self._info(start_time, 'lapack_getrf', profile)
+
+    def least_squares(self, A, b, pivoting=False):
+        start_time = time.time()
+        m, n = A.shape
+        profile = SolverProfile('lapack_gelsd', n)
+        with profile.phase('factorization', flops=4.0 * m * n * n + 8.0 * n ** 3):
+            x, _, rank, singular_values = scipy.linalg.lstsq(
+                A, b, cond=self.tolerance, lapack_driver='gelsd', check_finite=False
+            )
+            profile.allocate(np.empty((m, n)))
+        _check_least_squares(m, n, int(rank), pivoting)
+        with profile.phase('verification', flops=2.0 * m * n):
+            info = _singular_values_info(A, x, b, int(rank), singular_values)
+        return x, self._info(start_time, 'lapack_gelsd', profile, **info)
+
+    def lu_decomposition(self, A):
+        self._unsupported("lu_decomposition")
+
+    def determinant(self, A):
+        start_time = time.time()
+        profile = SolverProfile('lapack_getrf_determinant', A.shape[0])
+        lu, piv = self._factor(A, profile)
+        with profile.phase('product', flops=A.shape[0]):
+            # piv[i] != i: échange de lignes lors de l'étape i
+            sign = -1.0 if np.count_nonzero(piv != np.arange(piv.size)) % 2 else 1.0
+            det = float(sign * np.prod(np.diag(lu)))
+        return det, self._info(start_time, 'lapack_getrf_determinant', profile)
+
+    def inverse(self, A):
+        start_time = time.time()
+        n = A.shape[0]
+        profile = SolverProfile('lapack_getrs_inverse', n)
+        A_inv = self._solve(*self._factor(A, profile), np.eye(n), profile)
+        with profile.phase('verification', flops=2.0 * n ** 3):
+            verification_error = float(np.linalg.norm(A @ A_inv - np.eye(n)))
+        return A_inv, self._info(
+            start_time, 'lapack_getrs_inverse', profile, verification_error=verification_error
+        )
+
+
+class BackendRegistry:
+    """Moteurs disponibles, par ordre de préférence pour la sélection automatique"""
+
+    def __init__(self, backends: List[SolverBackend]):
+        self._backends: Dict[str, SolverBackend] = {backend.name: backend for backend in backends}
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._backends)
+
+    def describe(self) -> List[Dict[str, Any]]:
+        return [backend.describe() for backend in self._backends.values()]
+
+    def get(self, name: str) -> SolverBackend:
+        if name not in self._backends:
+            raise ValueError(f"Moteur inconnu: {name}")
+        return self._backends[name]
+
+    def select(self, operation: str, n: int, engine: Optional[str] = None) -> SolverBackend:
+        """
+        Choisir le moteur d'une requête
+
+        Moteur imposé: utilisé s'il prend en charge l'opération (ValueError
+        sinon). Sélection automatique: premier moteur capable dont
+        max_auto_size couvre n, à défaut le dernier moteur capable.
+        """
+        if engine is not None:
+            backend = self.get(engine)
+            if not backend.supports(operation):
+                backend._unsupported(operation)
+            return backend
+
+        capable = [backend for backend in self._backends.values() if backend.supports(operation)]
+        if not capable:
+            raise ValueError(f"Aucun moteur ne prend en charge l'opération '{operation}'")
+        for backend in capable:
+            if backend.max_auto_size is None or n <= backend.max_auto_size:
+                return backend
+        return capable[-1]
+
+
+def default_registry(solver: MatrixSolver, reference_max_size: Optional[int] = None,
+                     numpy_max_size: Optional[int] = None) -> BackendRegistry:
+    """Registre reference → numpy → lapack avec les seuils de sélection automatique"""
+    return BackendRegistry([
+        ReferenceBackend(solver, max_auto_size=reference_max_size),
+        NumpyBackend(solver.tolerance, max_auto_size=numpy_max_size),
+        LapackBackend(solver.tolerance)
+    ])
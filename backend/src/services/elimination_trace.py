@@ -0,0 +1,137 @@
+"""
+Trace pas à pas de l'élimination de Gauss et de la décomposition LU
+Les étapes sont émises au fur et à mesure du calcul, sous forme de diffs compacts
+"""
+
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from dataclasses import dataclass
+import time
+import numpy as np
+
+from src.services.matrix_solver import MatrixSolver
+from src.services.triangular import back_substitution
+
+
+@dataclass
+class Viewport:
+    """Fenêtre (lignes × colonnes) de la matrice transmise au client"""
+    row_start: int
+    row_end: int
+    col_start: int
+    col_end: int
+
+    @classmethod
+    def clamp(cls, rows: int, cols: int, max_size: int,
+              row_start: int = 0, row_end: Optional[int] = None,
+              col_start: int = 0, col_end: Optional[int] = None) -> "Viewport":
+        """Construire une fenêtre valide, bornée à max_size lignes et colonnes"""
+        row_start = min(max(row_start, 0), rows)
+        col_start = min(max(col_start, 0), cols)
+        row_end = rows if row_end is None else min(max(row_end, row_start), rows)
+        col_end = cols if col_end is None else min(max(col_end, col_start), cols)
+        return cls(
+            row_start=row_start,
+            row_end=min(row_end, row_start + max_size),
+            col_start=col_start,
+            col_end=min(col_end, col_start + max_size)
+        )
+
+    def rows_in(self, rows) -> List[int]:
+        """Filtrer les indices de lignes visibles"""
+        return [r for r in rows if self.row_start <= r < self.row_end]
+
+    def to_dict(self) -> Dict[str, int]:
+        return {
+            'row_start': self.row_start,
+            'row_end': self.row_end,
+            'col_start': self.col_start,
+            'col_end': self.col_end
+        }
+
+
+class EliminationTracer:
+    """
+    Producteur d'événements de trace pour MatrixSolver
+
+    Chaque événement est un couple (nom, données). Seules les lignes modifiées
+    et visibles dans la fenêtre sont transmises, ce qui borne la taille de
+    chaque événement à max_viewport × max_viewport valeurs quel que soit n.
+    """
+
+    def __init__(self, solver: MatrixSolver, max_viewport: int = 64):
+        self.solver = solver
+        self.max_viewport = max_viewport
+
+    def _rows(self, M: np.ndarray, rows: List[int], viewport: Viewport) -> Dict[str, List[float]]:
+        cols = slice(viewport.col_start, viewport.col_end)
+        return {str(r): M[r, cols].tolist() for r in viewport.rows_in(rows)}
+
+    def trace_gauss(self, A: np.ndarray, b: np.ndarray,
+                    viewport: Optional[Dict[str, int]] = None) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Tracer la résolution de Ax = b par élimination de Gauss (matrice augmentée)"""
+        start_time = time.time()
+        n = len(b)
+        M = np.hstack([A.astype(float), b.astype(float).reshape(n, -1)])
+        view = Viewport.clamp(n, M.shape[1], self.max_viewport, **(viewport or {}))
+
+        yield 'init', {
+            'method': 'gauss',
+            'shape': list(M.shape),
+            'viewport': view.to_dict(),
+            'rows': self._rows(M, range(n), view)
+        }
+
+        try:
+            for kind, i, detail in self.solver._gauss_forward_steps(M, n):
+                if kind == 'pivot':
+                    yield 'pivot', {
+                        'step': i,
+                        'pivot_row': detail,
+                        'pivot_value': float(M[i, i]),
+                        'rows': self._rows(M, sorted({i, detail}) if detail != i else [], view)
+                    }
+                else:
+                    yield 'eliminate', {'step': i, 'rows': self._rows(M, detail, view)}
+
+            x = back_substitution(M[:, :n], M[:, n:]).ravel()
+        except ValueError as e:
+            yield 'error', {'detail': str(e)}
+            return
+
+        yield 'result', {
+            'solution': x[view.row_start:view.row_end].tolist(),
+            'solution_offset': view.row_start,
+            'residual_error': float(np.linalg.norm(A @ x - b)),
+            'execution_time': time.time() - start_time
+        }
+
+    def trace_lu(self, A: np.ndarray,
+                 viewport: Optional[Dict[str, int]] = None) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Tracer la décomposition LU (les facteurs de L sont envoyés par colonne)"""
+        start_time = time.time()
+        n = A.shape[0]
+        L = np.eye(n)
+        U = A.copy().astype(float)
+        view = Viewport.clamp(n, n, self.max_viewport, **(viewport or {}))
+
+        yield 'init', {
+            'method': 'lu',
+            'shape': [n, n],
+            'viewport': view.to_dict(),
+            'rows': self._rows(U, range(n), view)
+        }
+
+        try:
+            for _, i, changed in self.solver._lu_steps(L, U):
+                event = {'step': i, 'rows': self._rows(U, changed, view)}
+                if view.col_start <= i < view.col_end:
+                    event['l_column'] = {str(r): float(L[r, i]) for r in view.rows_in(changed)}
+                yield 'eliminate', event
+        except ValueError as e:
+            yield 'error', {'detail': str(e)}
+            return
+
+        yield 'result', {
+            'determinant': float(np.prod(np.diag(U))),
+            'execution_time': time.time() - start_time
+        }
@@ -0,0 +1,288 @@
+"""
+Arithmétique exacte pour matrices entières / rationnelles
+Élimination de Bareiss (sans fractions) et déterminant modulaire (restes chinois)
+"""
+
+from typing import List, Sequence, Tuple
+from fractions import Fraction
+from math import gcd, isqrt, log2
+import numpy as np
+
+# Au-delà de cette taille de déterminant (bits, borne de Hadamard), le calcul
+# modulaire est plus rapide que Bareiss dont les entiers intermédiaires grossissent
+MODULAR_MIN_BITS = 2048
+
+# Premiers < 2^31: les produits de deux résidus tiennent dans un int64
+_PRIME_LIMIT = 2 ** 31
+
+# Nombre maximal d'éléments int64 éliminés simultanément (tous premiers confondus)
+_BATCH_ELEMENTS = 4 * 1024 * 1024
+
+
+def to_fraction(value) -> Fraction:
+    """
+    Convertir une valeur (entier, flottant) en rationnel exact
+
+    Les flottants sont lus via leur représentation décimale la plus courte
+    (0.1 → 1/10), c'est-à-dire la valeur saisie par l'utilisateur.
+    """
+    if isinstance(value, (int, np.integer)):
+        return Fraction(int(value))
+    value = float(value)
+    if not np.isfinite(value):
+        raise ValueError(f"Valeur non finie: {value}")
+    return Fraction(repr(value))
+
+
+def to_integer_rows(rows: Sequence[Sequence]) -> Tuple[np.ndarray, List[int]]:
+    """
+    Mettre chaque ligne à l'échelle entière (PPCM des dénominateurs)
+
+    Returns:
+        (M, échelles): M entière (tableau d'objets int), M[i] = échelle[i] × ligne i
+    """
+    fractions = [[to_fraction(v) for v in row] for row in rows]
+    scales = []
+    M = np.empty((len(fractions), len(fractions[0]) if fractions else 0), dtype=object)
+    for i, row in enumerate(fractions):
+        lcm = 1
+        for f in row:
+            lcm = lcm * f.denominator // gcd(lcm, f.denominator)
+        scales.append(lcm)
+        M[i] = [f.numerator * (lcm // f.denominator) for f in row]
+    return M, scales
+
+
+def bareiss_eliminate(M: np.ndarray, n: int) -> Tuple[np.ndarray, int]:
+    """
+    Élimination avant de Bareiss en place sur les n premières colonnes
+
+    Toutes les divisions sont exactes: les coefficients intermédiaires sont
+    des mineurs de la matrice, leur taille reste bornée par Hadamard.
+
+    Returns:
+        (M triangulaire supérieure, signe des permutations); M[n-1, n-1]·signe
+        vaut le déterminant (0 si singulière)
+    """
+    sign = 1
+    previous = 1
+    for k in range(n):
+        if M[k, k] == 0:
+            candidates = [i for i in range(k + 1, n) if M[i, k] != 0]
+            if not candidates:
+                M[k:, k:n] = 0
+                return M, 0
+            i = candidates[0]
+            M[[k, i]] = M[[i, k]]
+            sign = -sign
+        if k + 1 < n:
+            pivot = M[k, k]
+            M[k + 1:, k + 1:] = (M[k + 1:, k + 1:] * pivot - np.outer(M[k + 1:, k], M[k, k + 1:])) // previous
+            M[k + 1:, k] = 0
+            previous = pivot
+    return M, sign
+
+
+def bareiss_determinant(M: np.ndarray) -> int:
+    """Déterminant exact d'une matrice entière par Bareiss"""
+    n = M.shape[0]
+    if n == 0:
+        return 1
+    U, sign = bareiss_eliminate(M.copy(), n)
+    return sign * int(U[n - 1, n - 1]) if sign else 0
+
+
+def _primes_below(limit: int):
+    """Premiers décroissants sous limit (Miller-Rabin déterministe pour < 3.3e24)"""
+    def is_prime(p):
+        if p < 2:
+            return False
+        for small in (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37):
+            if p % small == 0:
+                return p == small
+        d, s = p - 1, 0
+        while d % 2 == 0:
+            d //= 2
+            s += 1
+        for a in (2, 3, 5, 7, 11, 13, 17):
+            x = pow(a, d, p)
+            if x in (1, p - 1):
+                continue
+            for _ in range(s - 1):
+                x = x * x % p
+                if x == p - 1:
+                    break
+            else:
+                return False
+        return True
+
+    candidate = limit - 1
+    while candidate > 2:
+        if is_prime(candidate):
+            yield candidate
+        candidate -= 2 if candidate % 2 else 1
+
+
+def _mod_pow(base: np.ndarray, exponent: np.ndarray, modulus: np.ndarray) -> np.ndarray:
+    """Exponentiation modulaire vectorisée (résidus < 2^31)"""
+    result = np.ones_like(base)
+    base = base % modulus
+    exponent = exponent.copy()
+    while np.any(exponent > 0):
+        odd = (exponent & 1).astype(bool)
+        result[odd] = result[odd] * base[odd] % modulus[odd]
+        base = base * base % modulus
+        exponent >>= 1
+    return result
+
+
+def determinants_mod_primes(M: np.ndarray, primes: Sequence[int]) -> List[int]:
+    """
+    Déterminants modulo plusieurs premiers, éliminés simultanément
+
+    Les premiers forment un lot (P × n × n en int64): chaque étape
+    d'élimination est une seule opération vectorisée pour tout le lot.
+    """
+    P = np.array(primes, dtype=np.int64)
+    A = np.stack([np.array((M % p).tolist(), dtype=np.int64) for p in primes])
+    n = A.shape[1]
+    batch = np.arange(len(primes))
+    p2 = P[:, None]
+    p3 = P[:, None, None]
+    det = np.ones(len(primes), dtype=np.int64)
+
+    for k in range(n):
+        nonzero = A[:, k:, k] != 0
+        has_pivot = nonzero.any(axis=1)
+        det[~has_pivot] = 0
+
+        pivot_rows = k + nonzero.argmax(axis=1)
+        swap = batch[has_pivot & (pivot_rows != k)]
+        if swap.size:
+            rows = pivot_rows[swap]
+            A[swap, k], A[swap, rows] = A[swap, rows].copy(), A[swap, k].copy()
+            det[swap] = (P[swap] - det[swap]) % P[swap]
+
+        pivots = np.where(has_pivot, A[:, k, k], 1)
+        det = det * pivots % P
+        if k + 1 < n:
+            inverses = _mod_pow(pivots, P - 2, P)
+            factors = A[:, k + 1:, k] * inverses[:, None] % p2
+            A[:, k + 1:, k:] = (A[:, k + 1:, k:] - factors[:, :, None] * A[:, None, k, k:] % p3) % p3
+
+    return [int(d) for d in det]
+
+
+def determinant_mod_p(M: np.ndarray, p: int) -> int:
+    """Déterminant modulo p"""
+    return determinants_mod_primes(M, [p])[0]
+
+
+def hadamard_bound_bits(M: np.ndarray) -> int:
+    """Nombre de bits majorant |det(M)| (borne de Hadamard)"""
+    bits = 0.0
+    for row in M:
+        norm2 = sum(int(v) * int(v) for v in row)
+        if norm2 == 0:
+            return 0
+        bits += log2(isqrt(norm2) + 1)
+    return int(bits) + 1
+
+
+def modular_determinant(M: np.ndarray) -> int:
+    """
+    Déterminant exact par calcul modulaire et reconstruction par restes chinois
+
+    Le nombre de premiers est fixé par la borne de Hadamard: chaque premier
+    coûte une élimination O(n³) en arithmétique machine vectorisée.
+    """
+    n = M.shape[0]
+    if n == 0:
+        return 1
+    bound_bits = hadamard_bound_bits(M)
+    if bound_bits == 0:
+        return 0
+
+    # Nombre de premiers nécessaire (chacun apporte ≥ 30 bits)
+    count = (bound_bits + 2) // 30 + 1
+    primes_iter = _primes_below(_PRIME_LIMIT)
+    primes = [next(primes_iter) for _ in range(count)]
+
+    # Lots bornés en mémoire (~32 Mo d'int64 par lot)
+    batch_size = max(1, _BATCH_ELEMENTS // max(n * n, 1))
+    residue, modulus = 0, 1
+    for start in range(0, count, batch_size):
+        chunk = primes[start:start + batch_size]
+        for p, r in zip(chunk, determinants_mod_primes(M, chunk)):
+            # Restes chinois incrémentaux
+            t = (r - residue) * pow(modulus, -1, p) % p
+            residue += modulus * t
+            modulus *= p
+
+    # Représentant symétrique: |det| < modulus / 2
+    return residue - modulus if residue > modulus // 2 else residue
+
+
+def exact_determinant(rows: Sequence[Sequence], method: str = "auto") -> Tuple[Fraction, str]:
+    """
+    Déterminant exact d'une matrice rationnelle
+
+    Returns:
+        (déterminant, méthode utilisée: 'bareiss' ou 'modular_crt')
+    """
+    M, scales = to_integer_rows(rows)
+    n = M.shape[0]
+    if M.shape[1] != n:
+        raise ValueError(f"La matrice doit être carrée (actuellement {M.shape[0]}×{M.shape[1]})")
+
+    if method == "auto":
+        method = "modular_crt" if hadamard_bound_bits(M) > MODULAR_MIN_BITS else "bareiss"
+    if method == "bareiss":
+        det = bareiss_determinant(M)
+    elif method == "modular_crt":
+        det = modular_determinant(M)
+    else:
+        raise ValueError(f"Méthode inconnue: {method}")
+
+    denominator = 1
+    for s in scales:
+        denominator *= s
+    return Fraction(det, denominator), method
+
+
+def exact_solve(rows: Sequence[Sequence], b: Sequence) -> Tuple[List[Fraction], Fraction]:
+    """
+    Résoudre Ax = b exactement (Bareiss sur la matrice augmentée)
+
+    Mettre une ligne de [A | b] à l'échelle ne change pas x. Après
+    l'élimination, d = det(M) et y = d·x est entier (Cramer): la substitution
+    arrière se fait en entiers avec des divisions exactes.
+
+    Returns:
+        (solution x, déterminant de A)
+    """
+    n = len(rows)
+    if len(b) != n:
+        raise ValueError(f"Le vecteur b doit avoir {n} éléments (actuellement {len(b)})")
+
+    augmented = [list(row) + [b_i] for row, b_i in zip(rows, b)]
+    M, scales = to_integer_rows(augmented)
+    U, sign = bareiss_eliminate(M, n)
+    if sign == 0:
+        raise ValueError("Matrice singulière: pas de solution exacte unique")
+
+    d = int(U[n - 1, n - 1])
+    y = [0] * n
+    for i in range(n - 1, -1, -1):
+        acc = d * int(U[i, n])
+        for j in range(i + 1, n):
+            acc -= int(U[i, j]) * y[j]
+        y[i] = acc // int(U[i, i])
+
+    x = [Fraction(y_i, d) for y_i in y]
+
+    denominator = 1
+    for s in scales:
+        denominator *= s
+    determinant = Fraction(sign * d, denominator)
+    return x, determinant
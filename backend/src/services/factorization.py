@@ -0,0 +1,179 @@
+"""
+Factorisation LU avec pivotage partiel réutilisable (P·A = L·U)
+Une seule factorisation O(n³) sert ensuite à résoudre, calculer le
+déterminant ou l'inverse en O(n²) par second membre.
+"""
+
+from typing import Callable, Dict, Optional
+import time
+import numpy as np
+
+from src.services.triangular import DEFAULT_BLOCK_SIZE, forward_substitution, back_substitution
+
+
+class LUFactorization:
+    """
+    Facteurs L et U stockés dans un seul tableau (L sous la diagonale, unité implicite)
+
+    Attributes:
+        lu: facteurs compactés (n×n)
+        perm: ligne i de P·A = ligne perm[i] de A
+        sign: signature de la permutation (±1)
+        singular: un pivot est inférieur à la tolérance
+    """
+
+    def __init__(self, lu: np.ndarray, perm: np.ndarray, sign: int, singular: bool):
+        self.lu = lu
+        self.perm = perm
+        self.sign = sign
+        self.singular = singular
+
+    @property
+    def n(self) -> int:
+        return self.lu.shape[0]
+
+    @property
+    def L(self) -> np.ndarray:
+        return np.tril(self.lu, -1) + np.eye(self.n)
+
+    @property
+    def U(self) -> np.ndarray:
+        return np.triu(self.lu)
+
+    def determinant(self) -> float:
+        """det(A) = signe(P) × prod(diag(U))"""
+        return float(self.sign * np.prod(np.diag(self.lu)))
+
+    def solve(self, b: np.ndarray) -> np.ndarray:
+        """Résoudre Ax = b (b vecteur ou matrice n×k) par deux substitutions"""
+        if self.singular:
+            raise ValueError("Matrice singulière: la factorisation LU ne permet pas de résoudre")
+        y = forward_substitution(self.lu, np.asarray(b, dtype=float)[self.perm], unit_diagonal=True)
+        return back_substitution(self.lu, y)
+
+    def solve_transpose(self, b: np.ndarray) -> np.ndarray:
+        """Résoudre Aᵀx = b: Aᵀ = Uᵀ·Lᵀ·P, sans former Aᵀ"""
+        if self.singular:
+            raise ValueError("Matrice singulière: la factorisation LU ne permet pas de résoudre")
+        z = forward_substitution(self.lu.T, np.asarray(b, dtype=float))
+        w = back_substitution(self.lu.T, z, unit_diagonal=True)
+        x = np.empty_like(w)
+        x[self.perm] = w
+        return x
+
+    def inverse(self) -> np.ndarray:
+        """A⁻¹ en résolvant AX = I à partir des facteurs"""
+        return self.solve(np.eye(self.n))
+
+
+def lu_factor(A: np.ndarray, tolerance: float = 1e-10) -> LUFactorization:
+    """
+    Factoriser P·A = L·U avec pivotage partiel
+
+    Une matrice singulière est factorisée jusqu'au bout (déterminant nul
+    disponible); seule la résolution échoue ensuite.
+    """
+    lu = np.array(A, dtype=float)
+    n = lu.shape[0]
+    perm = np.arange(n)
+    sign = 1
+    singular = False
+
+    for i in range(n):
+        max_row = i + int(np.argmax(np.abs(lu[i:, i])))
+        if max_row != i:
+            lu[[i, max_row]] = lu[[max_row, i]]
+            perm[[i, max_row]] = perm[[max_row, i]]
+            sign = -sign
+
+        if np.abs(lu[i, i]) < tolerance:
+            singular = True
+            continue
+
+        # Lignes/colonnes structurellement nulles ignorées
+        rows = i + 1 + np.flatnonzero(lu[i + 1:, i])
+        if rows.size:
+            cols = i + 1 + np.flatnonzero(lu[i, i + 1:])
+            lu[rows, i] /= lu[i, i]
+            lu[np.ix_(rows, cols)] -= np.outer(lu[rows, i], lu[i, cols])
+
+    return LUFactorization(lu, perm, sign, singular)
+
+
+def blocked_lu(A: np.ndarray, pivoting: bool = True, tolerance: float = 1e-10,
+               block_size: int = DEFAULT_BLOCK_SIZE) -> LUFactorization:
+    """
+    Factorisation LU par blocs de colonnes (variante « right-looking »)
+
+    Chaque panneau de block_size colonnes est factorisé colonne par colonne;
+    le bloc U₁₂ = L₁₁⁻¹·A₁₂ est obtenu par substitution puis le complément
+    A₂₂ -= L₂₁·U₁₂ est mis à jour par un seul produit matrice-matrice, ce qui
+    concentre l'essentiel du calcul dans BLAS 3.
+
+    Sans pivotage, un pivot nul avant la dernière colonne lève ValueError
+    (comme MatrixSolver.lu_decomposition).
+    """
+    lu = np.array(A, dtype=float)
+    n = lu.shape[0]
+    perm = np.arange(n)
+    sign = 1
+    singular = False
+
+    for k in range(0, n, block_size):
+        end = min(k + block_size, n)
+        for j in range(k, end):
+            if pivoting:
+                p = j + int(np.argmax(np.abs(lu[j:, j])))
+                if p != j:
+                    lu[[j, p]] = lu[[p, j]]
+                    perm[[j, p]] = perm[[p, j]]
+                    sign = -sign
+
+            if np.abs(lu[j, j]) < tolerance:
+                if not pivoting and j + 1 < n:
+                    raise ValueError(f"Impossible de décomposer: pivot {j+1} ≈ 0")
+                singular = True
+                continue
+
+            lu[j + 1:, j] /= lu[j, j]
+            lu[j + 1:, j + 1:end] -= np.outer(lu[j + 1:, j], lu[j, j + 1:end])
+
+        if end < n:
+            lu[k:end, end:] = forward_substitution(lu[k:end, k:end], lu[k:end, end:], unit_diagonal=True)
+            lu[end:, end:] -= lu[end:, k:end] @ lu[k:end, end:]
+
+    return LUFactorization(lu, perm, sign, singular)
+
+
+class SharedFactorization:
+    """
+    Résultats intermédiaires communs à plusieurs opérations sur une même matrice
+
+    La factorisation LU et les valeurs singulières sont calculées à la
+    première demande puis réutilisées; leur durée est relevée dans timings.
+    """
+
+    def __init__(self, A: np.ndarray, tolerance: float = 1e-10,
+                 factor: Callable[..., LUFactorization] = lu_factor):
+        self.A = A
+        self.tolerance = tolerance
+        self.factor = factor
+        self.timings: Dict[str, float] = {}
+        self._lu: Optional[LUFactorization] = None
+        self._singular_values: Optional[np.ndarray] = None
+
+    @property
+    def lu(self) -> LUFactorization:
+        if self._lu is None:
+            start = time.time()
+            self._lu = self.factor(self.A, tolerance=self.tolerance)
+            self.timings['lu_factorization'] = time.time() - start
+        return self._lu
+
+    @property
+    def singular_values(self) -> np.ndarray:
+        if self._singular_values is None:
+            start = time.time()
+            self._singular_values = np.linalg.svd(self.A, compute_uv=False)
+            self.timings['singular_values'] = time.time() - start
+        return self._singular_values
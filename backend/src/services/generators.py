@@ -0,0 +1,103 @@
+"""
+Générateurs de matrices de test (côté serveur, déterministes par graine)
+Aléatoire dense, SPD, Hilbert, Poisson 2-D, bande et conditionnement imposé.
+"""
+
+from typing import Optional
+from math import isqrt
+import numpy as np
+
+MATRIX_KINDS = ("random", "spd", "hilbert", "poisson2d", "banded", "conditioned")
+VECTOR_KINDS = ("random", "ones")
+
+
+def random_dense(n: int, seed: int = 0) -> np.ndarray:
+    """Matrice dense à coefficients gaussiens N(0, 1)"""
+    return np.random.default_rng(seed).standard_normal((n, n))
+
+
+def spd(n: int, seed: int = 0) -> np.ndarray:
+    """Matrice symétrique définie positive M·Mᵀ/n + I"""
+    M = np.random.default_rng(seed).standard_normal((n, n))
+    return M @ M.T / n + np.eye(n)
+
+
+def hilbert(n: int) -> np.ndarray:
+    """Matrice de Hilbert H[i, j] = 1 / (i + j + 1), très mal conditionnée"""
+    i = np.arange(n)
+    return 1.0 / (i[:, None] + i[None, :] + 1.0)
+
+
+def poisson2d(n: int) -> np.ndarray:
+    """
+    Laplacien 2-D à 5 points sur une grille m×m (n = m²)
+
+    4 sur la diagonale, -1 pour les voisins de grille (ligne et colonne).
+    """
+    m = isqrt(n)
+    if m * m != n:
+        raise ValueError(f"Poisson 2-D: n doit être un carré parfait (actuellement {n})")
+    A = 4.0 * np.eye(n)
+    i = np.arange(n - 1)
+    # Voisins horizontaux, sauf en fin de ligne de grille
+    horizontal = i[(i + 1) % m != 0]
+    A[horizontal, horizontal + 1] = A[horizontal + 1, horizontal] = -1.0
+    # Voisins verticaux
+    j = np.arange(n - m)
+    A[j, j + m] = A[j + m, j] = -1.0
+    return A
+
+
+def banded(n: int, bandwidth: int, seed: int = 0) -> np.ndarray:
+    """Matrice bande aléatoire (demi-largeur bandwidth), à diagonale strictement dominante"""
+    A = np.random.default_rng(seed).standard_normal((n, n))
+    i, j = np.indices((n, n))
+    A[np.abs(i - j) > bandwidth] = 0.0
+    np.fill_diagonal(A, 0.0)
+    A[np.diag_indices(n)] = np.abs(A).sum(axis=1) + 1.0
+    return A
+
+
+def conditioned(n: int, condition_number: float, seed: int = 0) -> np.ndarray:
+    """
+    Matrice U·diag(σ)·Vᵀ de conditionnement imposé
+
+    U, V orthogonales aléatoires; σ répartis géométriquement de 1 à 1/κ.
+    """
+    rng = np.random.default_rng(seed)
+    U, _ = np.linalg.qr(rng.standard_normal((n, n)))
+    V, _ = np.linalg.qr(rng.standard_normal((n, n)))
+    sigma = np.logspace(0.0, -np.log10(condition_number), n)
+    return (U * sigma) @ V.T
+
+
+def generate_matrix(
+    kind: str,
+    n: int,
+    seed: int = 0,
+    bandwidth: Optional[int] = None,
+    condition_number: Optional[float] = None
+) -> np.ndarray:
+    """Générer une matrice n×n d'après sa spécification"""
+    if kind == "random":
+        return random_dense(n, seed)
+    if kind == "spd":
+        return spd(n, seed)
+    if kind == "hilbert":
+        return hilbert(n)
+    if kind == "poisson2d":
+        return poisson2d(n)
+    if kind == "banded":
+        return banded(n, bandwidth if bandwidth is not None else 1, seed)
+    if kind == "conditioned":
+        return conditioned(n, condition_number if condition_number is not None else 1e3, seed)
+    raise ValueError(f"Générateur inconnu: {kind}")
+
+
+def generate_vector(kind: str, n: int, seed: int = 0) -> np.ndarray:
+    """Générer un vecteur de taille n ('random': N(0, 1), 'ones')"""
+    if kind == "random":
+        return np.random.default_rng(seed).standard_normal(n)
+    if kind == "ones":
+        return np.ones(n)
+    raise ValueError(f"Générateur inconnu: {kind}")
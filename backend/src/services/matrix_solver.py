@@ -1,10 +1,32 @@
 import numpy as np
-from typing import Tuple, Optional, Dict, Any
+from typing import Tuple, Optional, Dict, Any, Iterator, List
+from fractions import Fraction
 import time
+from src.services.triangular import forward_substitution, back_substitution
+from src.services import qr
+from src.services import exact
+from src.services.reordering import block_components, compute_ordering
+from src.services.factorization import SharedFactorization, blocked_lu
+from src.services.sketching import estimate_spectrum
+from src.services import structured
+from src.services.profiling import SolverProfile, qr_flops, triangular_flops
+
+# Phase du profil correspondant à chaque événement des générateurs d'élimination
+STEP_PHASES = {'pivot': 'pivoting', 'eliminate': 'elimination'}
+
+def pivot_determinant(pivots: np.ndarray, swaps: int = 0) -> float:
+    """Déterminant d'une matrice factorisée: produit des pivots, signé par les échanges de lignes"""
+    with np.errstate(over='ignore', under='ignore'):
+        determinant = float(np.prod(pivots))
+    return -determinant if swaps % 2 else determinant
+
 
 class MatrixSolver:
     """Classe principale pour résoudre les systèmes linéaires"""
     
+    # Moteur de référence (voir backends.ReferenceBackend): nom reporté dans les profils
+    engine = "reference"
+    
     def __init__(self, tolerance: float = 1e-10):
         self.tolerance = tolerance
     
@@ -12,23 +34,124 @@ class MatrixSolver:
         """
         Résoudre Ax = b par élimination gaussienne avec pivotage partiel
         
+        b peut être un vecteur (n,) ou une matrice (n×k) de seconds membres.
+        
         Returns:
             solution: vecteur x
             info: dictionnaire avec informations supplémentaires
         """
         start_time = time.time()
+        profile = SolverProfile('gauss_elimination', len(b), engine=self.engine)
+        
+        x, determinant = self._gauss_solve(A, b, profile)
         
-        n = len(b)
-        A = A.copy().astype(float)
-        b = b.copy().astype(float)
+        execution_time = time.time() - start_time
+        
+        info = {
+            'determinant': determinant,
+            'execution_time': execution_time,
+            'method': 'gauss_elimination'
+        }
         
-        # Matrice augmentée
-        M = np.hstack([A, b.reshape(-1, 1)])
+        return x, profile.finish(info)
+    
+    def _gauss_solve(self, A: np.ndarray, b: np.ndarray, profile: SolverProfile) -> Tuple[np.ndarray, float]:
+        """
+        Élimination avant puis substitution arrière, mesurées dans profile
+
+        Returns:
+            solution, déterminant de A (produit des pivots, signe des échanges)
+        """
+        with profile.phase('setup'):
+            n = len(b)
+            # Matrice augmentée (un ou plusieurs seconds membres)
+            M = np.hstack([np.asarray(A, dtype=float), np.asarray(b, dtype=float).reshape(n, -1)])
+            profile.allocate(M)
         
         # Phase 1: Élimination avant
+        swaps = self._profile_steps(self._gauss_forward_steps(M, n), profile, M)
+        determinant = pivot_determinant(np.diagonal(M[:, :n]), swaps)
+        
+        # Phase 2: Substitution arrière
+        k = M.shape[1] - n
+        with profile.phase('substitution', flops=triangular_flops(n, k)):
+            x = back_substitution(M[:, :n], M[:, n:])
+            profile.allocate(x)
+        if np.ndim(b) == 1:
+            x = x.ravel()
+        return x, determinant
+    
+    def _profile_steps(self, steps: Iterator[Tuple[str, int, Any]], profile: SolverProfile,
+                       pivot_rows: np.ndarray) -> int:
+        """
+        Consommer les étapes d'un générateur d'élimination en ventilant leur
+        durée par phase (pivotage / élimination)
+        
+        Flops comptés sur les opérations effectuées: pour chaque ligne
+        modifiée, une division et 2 opérations par colonne non nulle de la
+        ligne pivot.
+
+        Returns:
+            nombre d'échanges de lignes (signe du déterminant)
+        """
+        swaps = 0
+        last = time.perf_counter()
+        for event, i, payload in steps:
+            elapsed = time.perf_counter() - last
+            flops = 0.0
+            if event == 'eliminate' and payload:
+                flops = len(payload) * (1 + 2 * np.count_nonzero(pivot_rows[i, i:]))
+            elif event == 'pivot' and payload != i:
+                swaps += 1
+            profile.add(STEP_PHASES[event], elapsed, flops)
+            last = time.perf_counter()
+        return swaps
+    
+    def _lu_factors(self, A: np.ndarray, profile: SolverProfile) -> Tuple[np.ndarray, np.ndarray]:
+        """Décomposition A = LU (sans pivotage) mesurée dans profile"""
+        with profile.phase('setup'):
+            n = A.shape[0]
+            L = np.eye(n)
+            U = np.array(A, dtype=float)
+            profile.allocate(L, U)
+        
+        self._profile_steps(self._lu_steps(L, U), profile, U)
+        return L, U
+    
+    def lu_decomposition(self, A: np.ndarray) -> Tuple[np.ndarray, np.ndarray, Dict[str, Any]]:
+        """
+        Décomposition LU de A = LU
+        
+        Returns:
+            L: matrice triangulaire inférieure
+            U: matrice triangulaire supérieure
+            info: informations supplémentaires
+        """
+        start_time = time.time()
+        profile = SolverProfile('lu_decomposition', A.shape[0], engine=self.engine)
+        
+        L, U = self._lu_factors(A, profile)
+        
+        execution_time = time.time() - start_time
+        
+        info = {
+            'execution_time': execution_time,
+            'method': 'lu_decomposition'
+        }
+        
+        return L, U, profile.finish(info)
+    
+    def _gauss_forward_steps(self, M: np.ndarray, n: int) -> Iterator[Tuple[str, int, Any]]:
+        """
+        Élimination avant en place sur la matrice augmentée M
+        
+        Générateur: produit un événement après chaque pivotage
+        ('pivot', i, ligne_pivot) et chaque élimination ('eliminate', i,
+        lignes_modifiées), ce qui permet de tracer le calcul pas à pas.
+        """
         for i in range(n):
             # Pivotage partiel
-            max_row = i + np.argmax(np.abs(M[i:, i]))
+            max_row = i + int(np.argmax(np.abs(M[i:, i])))
             
             if max_row != i:
                 M[[i, max_row]] = M[[max_row, i]]
@@ -37,103 +160,277 @@ class MatrixSolver:
             if np.abs(M[i, i]) < self.tolerance:
                 raise ValueError(f"Matrice singulière détectée (pivot {i+1} ≈ 0)")
             
-            # Élimination
-            for k in range(i + 1, n):
-                factor = M[k, i] / M[i, i]
-                M[k, i:] -= factor * M[i, i:]
+            yield 'pivot', i, max_row
+            
+            # Élimination: seules les lignes non nulles dans la colonne du
+            # pivot et les colonnes non nulles de la ligne pivot changent
+            rows = i + 1 + np.flatnonzero(M[i + 1:, i])
+            if rows.size:
+                cols = i + np.flatnonzero(M[i, i:])
+                factors = M[rows, i] / M[i, i]
+                M[np.ix_(rows, cols)] -= np.outer(factors, M[i, cols])
+            
+            yield 'eliminate', i, rows.tolist()
+    
+    def _lu_steps(self, L: np.ndarray, U: np.ndarray) -> Iterator[Tuple[str, int, Any]]:
+        """
+        Décomposition LU (sans pivotage) en place sur L et U
         
-        # Phase 2: Substitution arrière
-        x = np.zeros(n)
-        for i in range(n - 1, -1, -1):
-            x[i] = M[i, -1]
-            for j in range(i + 1, n):
-                x[i] -= M[i, j] * x[j]
-            x[i] /= M[i, i]
+        Générateur: produit ('eliminate', i, lignes_modifiées) après chaque
+        colonne éliminée.
+        """
+        n = U.shape[0]
+        for i in range(n):
+            if i + 1 < n and np.abs(U[i, i]) < self.tolerance:
+                raise ValueError(f"Impossible de décomposer: pivot {i+1} ≈ 0")
+            
+            # Lignes/colonnes structurellement nulles ignorées (matrices bande ou creuses)
+            rows = i + 1 + np.flatnonzero(U[i + 1:, i])
+            if rows.size:
+                cols = i + np.flatnonzero(U[i, i:])
+                factors = U[rows, i] / U[i, i]
+                L[rows, i] = factors
+                U[np.ix_(rows, cols)] -= np.outer(factors, U[i, cols])
+            
+            yield 'eliminate', i, rows.tolist()
+    
+    def solve_with_lu(self, A: np.ndarray, b: np.ndarray) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """Résoudre Ax = b en utilisant la décomposition LU"""
+        start_time = time.time()
+        n = A.shape[0]
+        profile = SolverProfile('lu_solver', n, engine=self.engine)
+        
+        L, U = self._lu_factors(A, profile)
+        
+        k = 1 if np.ndim(b) == 1 else np.shape(b)[1]
+        with profile.phase('substitution', flops=2 * triangular_flops(n, k)):
+            # Résoudre Ly = b (forward substitution, diagonale unité)
+            y = forward_substitution(L, np.asarray(b, dtype=float), unit_diagonal=True)
+            
+            # Résoudre Ux = y (backward substitution)
+            x = back_substitution(U, y)
+            profile.allocate(y, x)
         
         execution_time = time.time() - start_time
         
         info = {
+            'L': L,
+            'U': U,
+            'determinant': pivot_determinant(np.diagonal(U)),
             'execution_time': execution_time,
-            'method': 'gauss_elimination'
+            'method': 'lu_solver'
+        }
+        
+        return x, profile.finish(info)
+    
+    def reordered_solve(self, A: np.ndarray, b: np.ndarray, method: str = "gauss",
+                        reordering: str = "rcm") -> Tuple[np.ndarray, Dict[str, Any]]:
+        """
+        Résoudre Ax = b sur le système renuméroté (P·A·Pᵀ)(P·x) = P·b
+        
+        Args:
+            method: 'gauss' ou 'lu'
+            reordering: 'rcm' (largeur de bande), 'minimum_degree' (remplissage) ou 'none'
+        
+        Returns:
+            solution x (ordre d'origine), info avec le rapport de renumérotation
+        """
+        start_time = time.time()
+        
+        ordering = compute_ordering(A, reordering, tolerance=0.0)
+        perm = ordering['permutation']
+        ordering_time = time.time() - start_time
+        
+        A_perm = A[np.ix_(perm, perm)]
+        b_perm = np.asarray(b)[perm]
+        if method == "gauss":
+            x_perm, solve_info = self.gauss_elimination(A_perm, b_perm)
+        elif method == "lu":
+            x_perm, solve_info = self.solve_with_lu(A_perm, b_perm)
+        else:
+            raise ValueError(f"Méthode inconnue: {method}")
+        
+        x = np.empty_like(x_perm)
+        x[perm] = x_perm
+        
+        execution_time = time.time() - start_time
+        
+        info = {
+            **solve_info,
+            'reordering': {
+                **ordering,
+                'permutation': perm.tolist(),
+                'ordering_time': ordering_time
+            },
+            'execution_time': execution_time
         }
         
         return x, info
     
-    def lu_decomposition(self, A: np.ndarray) -> Tuple[np.ndarray, np.ndarray, Dict[str, Any]]:
+    def block_solve(self, A: np.ndarray, b: np.ndarray, method: str = "gauss",
+                    blocks: Optional[List[np.ndarray]] = None, pool=None,
+                    parallel_min_size: int = 128) -> Tuple[np.ndarray, Dict[str, Any]]:
         """
-        Décomposition LU de A = LU
+        Résoudre Ax = b bloc par bloc (A bloc-diagonale à une permutation près)
+        
+        Les blocs sont les composantes connexes du graphe de A: chaque
+        sous-système A[bloc, bloc]·x[bloc] = b[bloc] est indépendant.
+        
+        Args:
+            blocks: indices de chaque bloc (calculés si absents)
+            pool: pool de workers exposant solve_many (ex: SharedMemorySolverPool);
+                utilisé si le plus grand bloc atteint parallel_min_size
         
         Returns:
-            L: matrice triangulaire inférieure
-            U: matrice triangulaire supérieure
-            info: informations supplémentaires
+            solution x assemblée, info avec les blocs et le déterminant
+            (produit de ceux des blocs, issus de leurs pivots). Le
+            conditionnement n'est pas calculé (SVD plus coûteuse que la
+            résolution): condition_number vaut None, voir analyze_matrix.
         """
         start_time = time.time()
         
-        n = A.shape[0]
-        L = np.eye(n)
-        U = A.copy().astype(float)
+        if blocks is None:
+            blocks = block_components(A)
+        systems = [(A[np.ix_(block, block)], b[block]) for block in blocks]
+        
+        parallel = pool is not None and len(blocks) > 1 and max(len(block) for block in blocks) >= parallel_min_size
+        if parallel:
+            results = pool.solve_many(systems, method=method)
+        elif method == "gauss":
+            results = [self.gauss_elimination(A_k, b_k) for A_k, b_k in systems]
+        elif method == "lu":
+            results = [self.solve_with_lu(A_k, b_k) for A_k, b_k in systems]
+        else:
+            raise ValueError(f"Méthode inconnue: {method}")
         
-        for i in range(n):
-            for k in range(i + 1, n):
-                if np.abs(U[i, i]) < self.tolerance:
-                    raise ValueError(f"Impossible de décomposer: pivot {i+1} ≈ 0")
-                
-                factor = U[k, i] / U[i, i]
-                L[k, i] = factor
-                U[k, i:] -= factor * U[i, i:]
+        x = np.empty(len(b))
+        # det(A) = Π det(A_k) (permutation symétrique)
+        determinant = 1.0
+        for block, (x_k, block_info) in zip(blocks, results):
+            x[block] = x_k
+            determinant *= block_info['determinant']
         
         execution_time = time.time() - start_time
         
         info = {
+            'blocks': [block.tolist() for block in blocks],
+            'parallel': parallel,
+            'determinant': float(determinant),
+            'condition_number': None,
             'execution_time': execution_time,
-            'method': 'lu_decomposition'
+            'method': f'block_diagonal_{method}'
         }
         
-        return L, U, info
+        return x, info
     
-    def solve_with_lu(self, A: np.ndarray, b: np.ndarray) -> Tuple[np.ndarray, Dict[str, Any]]:
-        """Résoudre Ax = b en utilisant la décomposition LU"""
-        start_time = time.time()
+    def structured_solve(self, kind: str, c: np.ndarray, r: np.ndarray,
+                         b: np.ndarray) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """
+        Résoudre Tx = b pour T circulante ou de Toeplitz (première colonne c, première ligne r)
         
-        L, U, lu_info = self.lu_decomposition(A)
+        - 'circulant': diagonalisation par FFT, O(n log n); le conditionnement
+          (|λ| max / |λ| min) et le déterminant sont exacts et gratuits
+        - 'toeplitz': récurrence de Levinson, O(n²); repli sur l'élimination
+          de Gauss si une sous-matrice principale est singulière ou si la
+          récurrence est instable
+        """
+        start_time = time.time()
         
-        # Résoudre Ly = b (forward substitution)
-        n = len(b)
-        y = np.zeros(n)
-        for i in range(n):
-            y[i] = b[i]
-            for j in range(i):
-                y[i] -= L[i, j] * y[j]
-            y[i] /= L[i, i]
-        
-        # Résoudre Ux = y (backward substitution)
-        x = np.zeros(n)
-        for i in range(n - 1, -1, -1):
-            x[i] = y[i]
-            for j in range(i + 1, n):
-                x[i] -= U[i, j] * x[j]
-            x[i] /= U[i, i]
+        condition_number = None
+        if kind == "circulant":
+            x, eigenvalues = structured.circulant_solve(c, b, self.tolerance)
+            magnitudes = np.abs(eigenvalues)
+            condition_number = float(magnitudes.max() / magnitudes.min())
+            with np.errstate(over='ignore'):
+                det = float(np.prod(eigenvalues).real)
+            method = 'circulant_fft'
+        elif kind == "toeplitz":
+            try:
+                x, det = structured.toeplitz_solve(c, r, b, self.tolerance)
+                method = 'toeplitz_levinson'
+            except ValueError:
+                A = structured.to_dense(c, r)
+                x, _ = self.gauss_elimination(A, b)
+                det = float(np.linalg.det(A))
+                method = 'toeplitz_dense_fallback'
+        else:
+            raise ValueError(f"Structure inconnue: {kind}")
         
         execution_time = time.time() - start_time
         
         info = {
-            'L': L,
-            'U': U,
+            'determinant': det,
+            'condition_number': condition_number,
             'execution_time': execution_time,
-            'method': 'lu_solver'
+            'method': method
         }
         
         return x, info
     
+    def structured_determinant(self, kind: str, c: np.ndarray, r: np.ndarray) -> Tuple[float, Dict[str, Any]]:
+        """Déterminant d'une matrice circulante (FFT) ou de Toeplitz (Levinson, repli LU)"""
+        start_time = time.time()
+        
+        if kind == "circulant":
+            det = structured.circulant_determinant(c)
+            method = 'circulant_fft'
+        elif kind == "toeplitz":
+            try:
+                det = structured.toeplitz_determinant(c, r, self.tolerance)
+                method = 'toeplitz_levinson'
+            except ValueError:
+                det = SharedFactorization(structured.to_dense(c, r), self.tolerance).lu.determinant()
+                method = 'toeplitz_dense_fallback'
+        else:
+            raise ValueError(f"Structure inconnue: {kind}")
+        
+        execution_time = time.time() - start_time
+        
+        info = {
+            'execution_time': execution_time,
+            'method': method
+        }
+        
+        return det, info
+    
+    def least_squares(self, A: np.ndarray, b: np.ndarray, pivoting: bool = False) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """
+        Résoudre min ||Ax - b|| (A m×n quelconque) par QR de Householder par blocs
+        
+        Args:
+            pivoting: pivotage de colonnes révélateur de rang (systèmes de rang
+                déficient ou sous-déterminés)
+        """
+        start_time = time.time()
+        m, n = A.shape
+        profile = SolverProfile('householder_qr', n, engine=self.engine)
+        
+        # Factorisation, application de Qᵀ (4mn) et substitution: noyau unique
+        with profile.phase('factorization', flops=qr_flops(m, n) + 4.0 * m * n + triangular_flops(n)):
+            x, qr_info = qr.least_squares(A, b, pivoting=pivoting, rcond=self.tolerance)
+        # Copie factorisée de A et second membre transformé
+        profile.allocate(np.empty((m, n)), np.empty(m))
+        
+        execution_time = time.time() - start_time
+        
+        info = {
+            **qr_info,
+            'execution_time': execution_time,
+            'method': 'householder_qr_pivoting' if pivoting else 'householder_qr'
+        }
+        
+        return x, profile.finish(info)
+    
     def determinant(self, A: np.ndarray) -> Tuple[float, Dict[str, Any]]:
         """Calculer le déterminant via décomposition LU"""
         start_time = time.time()
+        profile = SolverProfile('lu_determinant', A.shape[0], engine=self.engine)
         
-        L, U, lu_info = self.lu_decomposition(A)
+        L, U = self._lu_factors(A, profile)
         
         # det(A) = det(L) × det(U) = 1 × prod(diag(U))
-        det = np.prod(np.diag(U))
+        with profile.phase('product', flops=A.shape[0]):
+            det = np.prod(np.diag(U))
         
         execution_time = time.time() - start_time
         
@@ -142,22 +439,53 @@ class MatrixSolver:
             'method': 'lu_determinant'
         }
         
-        return float(det), info
+        return float(det), profile.finish(info)
+    
+    def exact_determinant(self, A) -> Tuple[Fraction, Dict[str, Any]]:
+        """
+        Déterminant exact (entiers/rationnels) par élimination de Bareiss,
+        ou par calcul modulaire + restes chinois pour les grands coefficients
+        """
+        start_time = time.time()
+        
+        det, method = exact.exact_determinant(A)
+        
+        execution_time = time.time() - start_time
+        
+        info = {
+            'execution_time': execution_time,
+            'method': f'exact_{method}'
+        }
+        
+        return det, info
+    
+    def exact_solve(self, A, b) -> Tuple[List[Fraction], Dict[str, Any]]:
+        """Résoudre Ax = b exactement (Bareiss sans fractions)"""
+        start_time = time.time()
+        
+        x, det = exact.exact_solve(A, b)
+        
+        execution_time = time.time() - start_time
+        
+        info = {
+            'determinant': det,
+            'execution_time': execution_time,
+            'method': 'exact_bareiss'
+        }
+        
+        return x, info
     
     def inverse(self, A: np.ndarray) -> Tuple[np.ndarray, Dict[str, Any]]:
-        """Calculer l'inverse de A en résolvant n systèmes"""
+        """Calculer l'inverse de A en résolvant AX = I (n seconds membres à la fois)"""
         start_time = time.time()
         
         n = A.shape[0]
-        A_inv = np.zeros_like(A, dtype=float)
-        
-        for i in range(n):
-            e_i = np.zeros(n)
-            e_i[i] = 1.0
-            A_inv[:, i], _ = self.gauss_elimination(A, e_i)
+        profile = SolverProfile('inverse_gauss', n, engine=self.engine)
+        A_inv, _ = self._gauss_solve(A, np.eye(n), profile)
         
         # Vérification
-        identity_check = np.linalg.norm(A @ A_inv - np.eye(n))
+        with profile.phase('verification', flops=2.0 * n ** 3):
+            identity_check = np.linalg.norm(A @ A_inv - np.eye(n))
         
         execution_time = time.time() - start_time
         
@@ -167,35 +495,65 @@ class MatrixSolver:
             'method': 'inverse_gauss'
         }
         
-        return A_inv, info
+        return A_inv, profile.finish(info)
     
-    def analyze_matrix(self, A: np.ndarray) -> Dict[str, Any]:
-        """Analyse complète d'une matrice"""
+    def analyze_matrix(self, A: np.ndarray, shared: Optional[SharedFactorization] = None,
+                       mode: str = "exact", sketch_rank: int = 10) -> Dict[str, Any]:
+        """
+        Analyse complète d'une matrice
+        
+        Args:
+            shared: factorisation LU / valeurs singulières déjà calculées pour
+                cette matrice (réutilisées au lieu d'être recalculées)
+            mode: 'exact' (SVD complète, valeurs propres) ou 'approximate'
+                (esquisses aléatoires: conditionnement, rang et sketch_rank
+                valeurs singulières dominantes encadrés, sans SVD ni valeurs propres)
+        """
         start_time = time.time()
         
         analysis = {
             'shape': A.shape,
             'is_square': A.shape[0] == A.shape[1],
+            'mode': mode,
         }
         
         if not analysis['is_square']:
             analysis['execution_time'] = time.time() - start_time
             return analysis
         
-        # Déterminant
+        approximate = mode == "approximate"
+        if shared is None and approximate:
+            # LU par blocs (BLAS 3): réutilisée par les itérations inverses de l'esquisse
+            shared = SharedFactorization(A, self.tolerance, factor=blocked_lu)
+        elif shared is None:
+            shared = SharedFactorization(A, self.tolerance)
+        
+        # Déterminant (LU avec pivotage partiel)
         try:
-            det, _ = self.determinant(A)
+            det = shared.lu.determinant()
             analysis['determinant'] = det
-            analysis['is_singular'] = abs(det) < self.tolerance
+            analysis['is_singular'] = shared.lu.singular or abs(det) < self.tolerance
         except Exception as e:
             analysis['determinant'] = None
             analysis['is_singular'] = True
         
-        # Nombre de conditionnement
-        try:
-            analysis['condition_number'] = float(np.linalg.cond(A))
-        except:
-            analysis['condition_number'] = None
+        # Conditionnement et rang: estimations encadrées par esquisses aléatoires
+        # ou une seule décomposition en valeurs singulières
+        if approximate:
+            estimates = estimate_spectrum(A, shared.lu, rank=sketch_rank)
+            analysis['estimates'] = estimates
+            analysis['condition_number'] = estimates['condition_number']
+            analysis['rank'] = estimates['rank']
+        else:
+            try:
+                s = shared.singular_values
+                with np.errstate(divide='ignore'):
+                    analysis['condition_number'] = float(s[0] / s[-1]) if s.size else 1.0
+                threshold = s.max(initial=0.0) * max(A.shape) * np.finfo(float).eps
+                analysis['rank'] = int(np.count_nonzero(s > threshold))
+            except:
+                analysis['condition_number'] = None
+                analysis['rank'] = None
         
         # Symétrie
         analysis['is_symmetric'] = np.allclose(A, A.T, atol=self.tolerance)
@@ -208,25 +566,20 @@ class MatrixSolver:
             except:
                 analysis['is_positive_definite'] = False
         
-        # Valeurs propres
+        # Valeurs propres (spectre complet O(n³): omis en mode approché)
         try:
-            eigenvalues = np.linalg.eigvals(A)
-            analysis['eigenvalues'] = eigenvalues.real.tolist()
+            eigenvalues = None if approximate else np.linalg.eigvals(A)
+            analysis['eigenvalues'] = eigenvalues.real.tolist() if eigenvalues is not None else None
         except:
             analysis['eigenvalues'] = None
         
-        # Rang
-        try:
-            analysis['rank'] = int(np.linalg.matrix_rank(A))
-        except:
-            analysis['rank'] = None
-        
-        # Recommandations
+        # Recommandations (conditionnement inconnu: matrice singulière en mode approché)
         recommendations = []
+        condition_number = analysis.get('condition_number')
         
-        if analysis.get('condition_number', 0) > 1e6:
+        if condition_number is None or condition_number > 1e6:
             recommendations.append("⚠️ Matrice mal conditionnée")
-        elif analysis.get('condition_number', 0) > 100:
+        elif condition_number > 100:
             recommendations.append("⚠️ Matrice moyennement conditionnée")
         else:
             recommendations.append("✓ Matrice bien conditionnée")
@@ -0,0 +1,110 @@
+"""
+Profil d'exécution des solveurs: durée par phase, flops, débit et mémoire
+Chaque méthode instrumentée ajoute info['profile']; un hook optionnel reçoit
+aussi chaque échantillon (export vers un pipeline de métriques).
+"""
+
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+import importlib
+import time
+import warnings
+import numpy as np
+
+MetricsHook = Callable[[Dict[str, Any]], None]
+
+_metrics_hook: Optional[MetricsHook] = None
+
+
+def set_metrics_hook(hook: Optional[MetricsHook]):
+    """Installer (ou retirer avec None) le hook appelé pour chaque échantillon"""
+    global _metrics_hook
+    _metrics_hook = hook
+
+
+def load_metrics_hook(path: str) -> MetricsHook:
+    """Importer un hook désigné par 'module:fonction' (ex: METRICS_HOOK)"""
+    module_name, _, attribute = path.partition(":")
+    if not attribute:
+        raise ValueError(f"Hook de métriques invalide (attendu 'module:fonction'): {path}")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+class SolverProfile:
+    """
+    Mesures d'une exécution de solveur
+
+    Les flops sont comptés d'après les opérations effectivement réalisées
+    (lignes et colonnes éliminées) ou estimés par les formules classiques
+    pour les noyaux externes. peak_bytes est le maximum des octets des
+    tableaux de travail alloués simultanément (hors données d'entrée).
+    engine nomme le moteur dans l'échantillon si info ne le précise pas.
+    """
+
+    def __init__(self, operation: str, n: int, engine: Optional[str] = None):
+        self.operation = operation
+        self.n = n
+        self.engine = engine
+        self.phases: Dict[str, float] = {}
+        self.flops = 0.0
+        self.live_bytes = 0
+        self.peak_bytes = 0
+        self._start = time.perf_counter()
+
+    def add(self, phase: str, seconds: float, flops: float = 0.0):
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+        self.flops += flops
+
+    @contextmanager
+    def phase(self, name: str, flops: float = 0.0) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start, flops)
+
+    def allocate(self, *arrays: np.ndarray):
+        self.live_bytes += sum(array.nbytes for array in arrays)
+        self.peak_bytes = max(self.peak_bytes, self.live_bytes)
+
+    def report(self) -> Dict[str, Any]:
+        elapsed = time.perf_counter() - self._start
+        return {
+            'phases': dict(self.phases),
+            'flops': int(self.flops),
+            'gflops': float(self.flops / elapsed / 1e9) if elapsed > 0 and self.flops else None,
+            'peak_bytes': int(self.peak_bytes)
+        }
+
+    def finish(self, info: Dict[str, Any]) -> Dict[str, Any]:
+        """Ajouter le profil à info et l'envoyer au hook de métriques"""
+        info['profile'] = self.report()
+        if _metrics_hook is not None:
+            sample = {
+                'operation': self.operation,
+                'n': self.n,
+                'engine': info.get('engine', self.engine),
+                'execution_time': info.get('execution_time'),
+                **info['profile']
+            }
+            try:
+                _metrics_hook(sample)
+            except Exception as e:
+                # L'export des métriques ne doit jamais faire échouer un calcul
+                warnings.warn(f"Hook de métriques en échec: {e}", RuntimeWarning)
+        return info
+
+
+def lu_flops(n: int) -> float:
+    """Factorisation LU dense: 2n³/3"""
+    return 2.0 * n ** 3 / 3.0
+
+
+def triangular_flops(n: int, k: int = 1) -> float:
+    """Une substitution triangulaire par second membre: n²"""
+    return float(n * n * k)
+
+
+def qr_flops(m: int, n: int) -> float:
+    """QR de Householder: 2mn² - 2n³/3"""
+    return 2.0 * m * n * n - 2.0 * n ** 3 / 3.0
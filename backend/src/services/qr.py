@@ -0,0 +1,217 @@
+"""
+Factorisation QR de Householder par blocs (représentation WY compacte)
+Utilisée pour les moindres carrés et les systèmes rectangulaires
+"""
+
+from typing import List, Optional, Tuple
+from dataclasses import dataclass, field
+import numpy as np
+
+from src.services.triangular import back_substitution
+
+DEFAULT_BLOCK_SIZE = 32
+
+# Seuil de recalcul des normes de colonnes (pivotage)
+_NORM_TOLERANCE = np.sqrt(np.finfo(float).eps)
+
+
+def householder_vector(x: np.ndarray) -> Tuple[np.ndarray, float, float]:
+    """
+    Calculer le réflecteur H = I - tau·v·vᵀ tel que H·x = beta·e1 (v[0] = 1)
+
+    Returns:
+        (v, tau, beta)
+    """
+    v = x.astype(float, copy=True)
+    alpha = v[0]
+    sigma = float(v[1:] @ v[1:]) if len(v) > 1 else 0.0
+
+    if sigma == 0.0:
+        v[0] = 1.0
+        return v, 0.0, float(alpha)
+
+    beta = -np.copysign(np.sqrt(alpha * alpha + sigma), alpha)
+    tau = (beta - alpha) / beta
+    v[1:] /= (alpha - beta)
+    v[0] = 1.0
+    return v, float(tau), float(beta)
+
+
+def _form_t(V: np.ndarray, tau: np.ndarray) -> np.ndarray:
+    """
+    Construire le facteur triangulaire T de la représentation WY compacte
+
+    H1·H2···Hk = I - V·T·Vᵀ (accumulation colonne par colonne, comme xLARFT)
+    """
+    k = len(tau)
+    T = np.zeros((k, k))
+    for j in range(k):
+        T[j, j] = tau[j]
+        if j > 0:
+            T[:j, j] = -tau[j] * (T[:j, :j] @ (V[:, :j].T @ V[:, j]))
+    return T
+
+
+@dataclass
+class QRFactorization:
+    """
+    Résultat de la factorisation A·P = Q·R
+
+    - qr: R dans le triangle supérieur, vecteurs de Householder sous la diagonale
+    - blocks: (début, T) pour chaque bloc de réflecteurs (Q = Π (I - V·T·Vᵀ))
+    - perm: permutation des colonnes (None sans pivotage)
+    """
+    qr: np.ndarray
+    tau: np.ndarray
+    blocks: List[Tuple[int, np.ndarray]] = field(default_factory=list)
+    perm: Optional[np.ndarray] = None
+
+    @property
+    def R(self) -> np.ndarray:
+        k = min(self.qr.shape)
+        return np.triu(self.qr[:k, :])
+
+    def _block_v(self, start: int, width: int) -> np.ndarray:
+        V = np.tril(self.qr[start:, start:start + width], -1)
+        V[np.arange(width), np.arange(width)] = 1.0
+        return V
+
+    def apply_qt(self, B: np.ndarray) -> np.ndarray:
+        """Calculer Qᵀ·B bloc par bloc (mises à jour matrice-matrice)"""
+        C = np.array(B, dtype=float, copy=True)
+        for start, T in self.blocks:
+            V = self._block_v(start, T.shape[0])
+            C[start:] -= V @ (T.T @ (V.T @ C[start:]))
+        return C
+
+    def rank(self, rcond: float) -> int:
+        """Rang numérique: nombre de |R[i,i]| > rcond·max|R[i,i]|"""
+        diag = np.abs(np.diag(self.qr))
+        if diag.size == 0 or diag.max() == 0.0:
+            return 0
+        return int(np.sum(diag > rcond * diag.max()))
+
+
+def householder_qr(
+    A: np.ndarray,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    pivoting: bool = False
+) -> QRFactorization:
+    """
+    Factorisation QR de Householder par blocs
+
+    Sans pivotage, chaque panneau de block_size colonnes est factorisé puis
+    appliqué à la matrice restante sous forme WY compacte (produits
+    matrice-matrice). Avec pivotage de colonnes (révélateur de rang), la
+    colonne de plus grande norme résiduelle est choisie à chaque étape; les
+    normes sont mises à jour par soustraction et recalculées en cas
+    d'annulation, et chaque réflecteur est appliqué immédiatement à toutes les
+    colonnes restantes (le choix du pivot en dépend). Q reste stocké par blocs.
+    """
+    QR = np.array(A, dtype=float, copy=True)
+    m, n = QR.shape
+    k_max = min(m, n)
+    tau = np.zeros(k_max)
+    blocks: List[Tuple[int, np.ndarray]] = []
+    perm = np.arange(n) if pivoting else None
+
+    if pivoting:
+        norms = np.linalg.norm(QR, axis=0)
+        ref_norms = norms.copy()
+
+    for start in range(0, k_max, block_size):
+        stop = min(start + block_size, k_max)
+
+        for j in range(start, stop):
+            if pivoting:
+                p = j + int(np.argmax(norms[j:]))
+                if p != j:
+                    QR[:, [j, p]] = QR[:, [p, j]]
+                    perm[[j, p]] = perm[[p, j]]
+                    norms[[j, p]] = norms[[p, j]]
+                    ref_norms[[j, p]] = ref_norms[[p, j]]
+
+            v, tau[j], beta = householder_vector(QR[j:, j])
+            QR[j, j] = beta
+            QR[j + 1:, j] = v[1:]
+
+            # Mise à jour des colonnes restantes du panneau (ou de toute la
+            # matrice en mode pivotage)
+            last = n if pivoting else stop
+            if tau[j] != 0.0 and j + 1 < last:
+                C = QR[j:, j + 1:last]
+                C -= tau[j] * np.outer(v, v @ C)
+
+            if pivoting and j + 1 < n:
+                # Mise à jour des normes partielles (LAPACK Working Note 176):
+                # recalcul explicite lorsque l'annulation rend l'estimation peu fiable
+                cols = slice(j + 1, n)
+                active = norms[cols] > 0
+                ratio = np.zeros(n - j - 1)
+                ratio[active] = np.abs(QR[j, cols][active]) / norms[cols][active]
+                temp = np.maximum(0.0, 1.0 - ratio ** 2)
+                drift = np.zeros(n - j - 1)
+                drift[active] = temp[active] * (norms[cols][active] / ref_norms[cols][active]) ** 2
+                norms[cols] *= np.sqrt(temp)
+                for c in np.nonzero(active & (drift <= _NORM_TOLERANCE))[0] + j + 1:
+                    norms[c] = ref_norms[c] = np.linalg.norm(QR[j + 1:, c])
+
+        V = np.tril(QR[start:, start:stop], -1)
+        V[np.arange(stop - start), np.arange(stop - start)] = 1.0
+        T = _form_t(V, tau[start:stop])
+        blocks.append((start, T))
+
+        # Mise à jour WY de la matrice restante: A ← (I - V·Tᵀ·Vᵀ)·A
+        if not pivoting and stop < n:
+            C = QR[start:, stop:]
+            C -= V @ (T.T @ (V.T @ C))
+
+    return QRFactorization(qr=QR, tau=tau, blocks=blocks, perm=perm)
+
+
+def least_squares(
+    A: np.ndarray,
+    b: np.ndarray,
+    pivoting: bool = False,
+    rcond: float = 1e-12,
+    block_size: int = DEFAULT_BLOCK_SIZE
+) -> Tuple[np.ndarray, dict]:
+    """
+    Résoudre min ||Ax - b|| par QR de Householder (sans équations normales)
+
+    Avec pivotage, le rang numérique est déterminé par R et la solution
+    basique (composantes hors rang nulles) est renvoyée; sans pivotage, A doit
+    être de rang plein en colonnes (m ≥ n).
+    """
+    m, n = A.shape
+    if len(b) != m:
+        raise ValueError(f"Le vecteur b doit avoir {m} éléments (actuellement {len(b)})")
+    if not pivoting and m < n:
+        raise ValueError("Système sous-déterminé: activer le pivotage de colonnes")
+
+    factorization = householder_qr(A, block_size=block_size, pivoting=pivoting)
+    rank = factorization.rank(rcond)
+    if not pivoting and rank < n:
+        raise ValueError(
+            f"Matrice de rang déficient (rang {rank} < {n}): activer le pivotage de colonnes"
+        )
+
+    c = factorization.apply_qt(np.asarray(b, dtype=float))
+    z = np.zeros(n)
+    if rank > 0:
+        z[:rank] = back_substitution(factorization.qr[:rank, :rank], c[:rank])
+
+    if pivoting:
+        x = np.zeros(n)
+        x[factorization.perm] = z
+    else:
+        x = z
+
+    R_rank = factorization.qr[:rank, :rank]
+    info = {
+        'rank': rank,
+        'residual_norm': float(np.linalg.norm(c[rank:])) if m > rank else 0.0,
+        'condition_number': float(np.linalg.cond(np.triu(R_rank))) if rank > 0 else None,
+        'permutation': factorization.perm.tolist() if pivoting else None
+    }
+    return x, info
@@ -0,0 +1,136 @@
+"""
+Cache de réponses pour les endpoints déterministes
+Les réponses sérialisées sont indexées par un hash canonique de la requête validée
+"""
+
+from typing import Dict, Optional
+from collections import OrderedDict
+from dataclasses import dataclass
+import hashlib
+import json
+import threading
+import time
+
+
+def canonical_hash(namespace: str, payload: dict) -> str:
+    """
+    Calculer un hash canonique (SHA-256) d'une requête validée
+
+    Les clés sont triées et les séparateurs fixés, de sorte que deux requêtes
+    équivalentes produisent toujours le même hash.
+    """
+    canonical = json.dumps(payload, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    digest = hashlib.sha256()
+    digest.update(namespace.encode('utf-8'))
+    digest.update(b'\x00')
+    digest.update(canonical.encode('utf-8'))
+    return digest.hexdigest()
+
+
+def schema_version(*models) -> str:
+    """
+    Empreinte des schémas JSON de modèles pydantic
+
+    Change dès qu'un champ est ajouté, retiré ou retypé: incluse dans les
+    clés de cache, elle invalide les réponses produites par un ancien schéma.
+    """
+    schemas = {model.__name__: model.model_json_schema() for model in models}
+    return canonical_hash("schema", schemas)[:16]
+
+
+def make_etag(key: str) -> str:
+    """Construire un ETag fort à partir d'une clé de cache"""
+    return f'"{key[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Vérifier si l'en-tête If-None-Match correspond à l'ETag"""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(',')]
+    if '*' in candidates:
+        return True
+    # Comparaison faible (RFC 7232): ignorer le préfixe W/
+    return any(tag.removeprefix('W/') == etag for tag in candidates)
+
+
+@dataclass
+class CacheEntry:
+    """Entrée du cache: corps JSON déjà sérialisé"""
+    body: bytes
+    etag: str
+    expires_at: float
+
+
+class ResponseCache:
+    """
+    Cache LRU borné avec expiration (TTL)
+
+    - Taille bornée en nombre d'entrées et en octets
+    - Éviction LRU lorsque l'une des limites est dépassée
+    - Sûr pour un usage multi-thread (endpoints exécutés dans le threadpool)
+    """
+
+    def __init__(self, ttl: float = 300.0, max_entries: int = 256, max_bytes: int = 64 * 1024 * 1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Récupérer une entrée valide (None si absente ou expirée)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry.expires_at <= time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: str, body: bytes) -> CacheEntry:
+        """Insérer une réponse sérialisée et appliquer l'éviction"""
+        entry = CacheEntry(body=body, etag=make_etag(key), expires_at=time.monotonic() + self.ttl)
+        if len(body) > self.max_bytes:
+            # Trop volumineux pour être mis en cache
+            return entry
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self._size += len(body)
+            while self._entries and (len(self._entries) > self.max_entries or self._size > self.max_bytes):
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+        return entry
+
+    def clear(self):
+        """Vider le cache"""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Statistiques du cache"""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self._size,
+                'hits': self.hits,
+                'misses': self.misses
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key)
+        self._size -= len(entry.body)
@@ -0,0 +1,158 @@
+"""
+Stockage persistant des résultats calculés, partagé entre processus
+Base SQLite locale (mode WAL): les workers uvicorn et les redémarrages réutilisent les
+factorisations, analyses et simulations déjà calculées.
+"""
+
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+import os
+import sqlite3
+import threading
+import time
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_results_accessed ON results (accessed_at);
+CREATE INDEX IF NOT EXISTS idx_results_expires ON results (expires_at);
+CREATE TABLE IF NOT EXISTS totals (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    bytes INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO totals (id, bytes) SELECT 1, COALESCE(SUM(size), 0) FROM results;
+"""
+
+
+class ResultStore:
+    """
+    Stockage clé/valeur persistant avec expiration et taille bornée
+
+    - Clés: hash de contenu (voir response_cache.canonical_hash)
+    - Valeurs: octets (réponses JSON sérialisées)
+    - Éviction: entrées expirées d'abord, puis les moins récemment lues,
+      jusqu'à repasser sous la taille maximale
+    - Taille totale tenue dans la table totals, mise à jour dans la même
+      transaction que chaque écriture: une écriture ne parcourt que les
+      entrées expirées ou évincées (index sur expires_at et accessed_at)
+    - Une connexion par thread; SQLite gère la concurrence entre processus
+    """
+
+    def __init__(self, path: str, ttl: float = 86400.0, max_bytes: int = 512 * 1024 * 1024):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        connection = self._connection()
+        connection.executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Lire une valeur non expirée (None sinon)"""
+        now = time.time()
+        connection = self._connection()
+        row = connection.execute(
+            "SELECT value FROM results WHERE key = ? AND expires_at > ?", (key, now)
+        ).fetchone()
+        if row is None:
+            return None
+        connection.execute("UPDATE results SET accessed_at = ? WHERE key = ?", (now, key))
+        return bytes(row[0])
+
+    def put(self, key: str, value: bytes, kind: str = "result"):
+        """Enregistrer une valeur puis appliquer l'éviction si nécessaire"""
+        if len(value) > self.max_bytes:
+            return
+        now = time.time()
+        connection = self._connection()
+        with self._transaction(connection):
+            row = connection.execute("SELECT size FROM results WHERE key = ?", (key,)).fetchone()
+            connection.execute(
+                "INSERT OR REPLACE INTO results (key, kind, value, size, created_at, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, kind, sqlite3.Binary(value), len(value), now, now + self.ttl, now)
+            )
+            self._add_bytes(connection, len(value) - (row[0] if row else 0))
+            self._evict(connection, now)
+
+    def _evict(self, connection: sqlite3.Connection, now: float):
+        expired = connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM results WHERE expires_at <= ?", (now,)
+        ).fetchone()[0]
+        if expired:
+            connection.execute("DELETE FROM results WHERE expires_at <= ?", (now,))
+            self._add_bytes(connection, -expired)
+        total = self.total_bytes(connection)
+        if total <= self.max_bytes:
+            return
+        # Supprimer les moins récemment lues jusqu'à 90% de la limite
+        excess = total - int(self.max_bytes * 0.9)
+        freed = 0
+        victims = []
+        for key, size in connection.execute("SELECT key, size FROM results ORDER BY accessed_at ASC"):
+            victims.append((key,))
+            freed += size
+            if freed >= excess:
+                break
+        connection.executemany("DELETE FROM results WHERE key = ?", victims)
+        self._add_bytes(connection, -freed)
+
+    @contextmanager
+    def _transaction(self, connection: sqlite3.Connection) -> Iterator[None]:
+        """Transaction d'écriture (verrou pris dès le début: total cohérent entre processus)"""
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    @staticmethod
+    def _add_bytes(connection: sqlite3.Connection, delta: int):
+        if delta:
+            connection.execute("UPDATE totals SET bytes = bytes + ? WHERE id = 1", (delta,))
+
+    def total_bytes(self, connection: Optional[sqlite3.Connection] = None) -> int:
+        """Taille totale des valeurs stockées (compteur, sans parcours de la table)"""
+        connection = connection or self._connection()
+        return connection.execute("SELECT bytes FROM totals WHERE id = 1").fetchone()[0]
+
+    def delete(self, key: str):
+        connection = self._connection()
+        with self._transaction(connection):
+            row = connection.execute("SELECT size FROM results WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                connection.execute("DELETE FROM results WHERE key = ?", (key,))
+                self._add_bytes(connection, -row[0])
+
+    def clear(self):
+        connection = self._connection()
+        with self._transaction(connection):
+            connection.execute("DELETE FROM results")
+            connection.execute("UPDATE totals SET bytes = 0 WHERE id = 1")
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Nombre d'entrées et taille totale, par type de résultat"""
+        rows = self._connection().execute(
+            "SELECT kind, COUNT(*), COALESCE(SUM(size), 0) FROM results GROUP BY kind"
+        ).fetchall()
+        return {kind: {'entries': count, 'bytes': size} for kind, count, size in rows}
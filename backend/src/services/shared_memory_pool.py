@@ -0,0 +1,224 @@
+"""
+Transport des matrices vers des processus de calcul via multiprocessing.shared_memory
+Les matrices sont écrites une seule fois dans des segments partagés; les workers s'y
+attachent sans copie pour factoriser ou résoudre, et écrivent leurs résultats de la
+même façon.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from concurrent.futures import ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+import secrets
+import numpy as np
+
+from src.services.matrix_solver import MatrixSolver
+
+
+@dataclass(frozen=True)
+class SharedArrayHandle:
+    """Descripteur picklable d'un tableau placé en mémoire partagée"""
+    name: str
+    shape: Tuple[int, ...]
+    dtype: str
+
+    @property
+    def nbytes(self) -> int:
+        return int(np.prod(self.shape, dtype=np.int64)) * np.dtype(self.dtype).itemsize
+
+
+def _as_array(segment: shared_memory.SharedMemory, handle: SharedArrayHandle) -> np.ndarray:
+    return np.ndarray(handle.shape, dtype=handle.dtype, buffer=segment.buf)
+
+
+def _close_quietly(segment: shared_memory.SharedMemory):
+    """
+    Fermer un segment même si des vues NumPy existent encore
+
+    Une exception peut garder des vues vivantes (via la traceback): le mapping
+    est alors libéré à la fin du processus, le nom étant supprimé par le parent.
+    """
+    try:
+        segment.close()
+    except BufferError:
+        pass
+
+
+class SharedArrayArena:
+    """
+    Propriétaire des segments de mémoire partagée d'un calcul
+
+    Le processus parent crée tous les segments (entrées et sorties) et les
+    supprime à la sortie du contexte, y compris si un worker plante: aucun
+    segment n'est créé côté worker, donc rien ne peut fuir. Si le parent
+    lui-même meurt, le resource_tracker de multiprocessing supprime les segments
+    enregistrés.
+    """
+
+    def __init__(self, prefix: str = "opm"):
+        self.prefix = prefix
+        self._segments: Dict[str, shared_memory.SharedMemory] = {}
+
+    def empty(self, shape: Sequence[int], dtype: Any = np.float64) -> SharedArrayHandle:
+        """Allouer un tableau non initialisé (ex: emplacement d'un résultat)"""
+        handle_dtype = np.dtype(dtype).str
+        shape = tuple(int(d) for d in shape)
+        size = max(int(np.prod(shape, dtype=np.int64)) * np.dtype(dtype).itemsize, 1)
+        name = f"{self.prefix}_{secrets.token_hex(8)}"
+        segment = shared_memory.SharedMemory(name=name, create=True, size=size)
+        self._segments[segment.name] = segment
+        return SharedArrayHandle(name=segment.name, shape=shape, dtype=handle_dtype)
+
+    def put(self, array: np.ndarray) -> SharedArrayHandle:
+        """Copier un tableau dans un nouveau segment (unique copie côté parent)"""
+        array = np.asarray(array)
+        handle = self.empty(array.shape, array.dtype)
+        self.view(handle)[...] = array
+        return handle
+
+    def view(self, handle: SharedArrayHandle) -> np.ndarray:
+        """Vue NumPy (sans copie) d'un segment de l'arène"""
+        return _as_array(self._segments[handle.name], handle)
+
+    def release(self):
+        """Fermer et supprimer tous les segments"""
+        for name, segment in list(self._segments.items()):
+            _close_quietly(segment)
+            try:
+                segment.unlink()
+            except FileNotFoundError:
+                pass
+            del self._segments[name]
+
+    def __len__(self) -> int:
+        return len(self._segments)
+
+    def __enter__(self) -> "SharedArrayArena":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+
+
+def _compute(operation: str, tolerance: float, inputs: List[np.ndarray], outputs: List[np.ndarray]) -> Dict[str, Any]:
+    """Exécuter une opération de MatrixSolver sur des vues partagées"""
+    solver = MatrixSolver(tolerance=tolerance)
+
+    if operation == "gauss":
+        x, info = solver.gauss_elimination(inputs[0], inputs[1])
+        outputs[0][...] = x
+    elif operation == "lu":
+        x, info = solver.solve_with_lu(inputs[0], inputs[1])
+        outputs[0][...] = x
+        info = {k: v for k, v in info.items() if k not in ('L', 'U')}
+    elif operation == "decompose_lu":
+        L, U, info = solver.lu_decomposition(inputs[0])
+        outputs[0][...] = L
+        outputs[1][...] = U
+    elif operation == "inverse":
+        A_inv, info = solver.inverse(inputs[0])
+        outputs[0][...] = A_inv
+    elif operation == "determinant":
+        det, info = solver.determinant(inputs[0])
+        info = {**info, 'determinant': det}
+    else:
+        raise ValueError(f"Opération inconnue: {operation}")
+
+    return info
+
+
+def _run_shared_task(
+    operation: str,
+    tolerance: float,
+    input_handles: List[SharedArrayHandle],
+    output_handles: List[SharedArrayHandle]
+) -> Dict[str, Any]:
+    """
+    Point d'entrée d'un worker: s'attacher aux segments, calculer, se détacher
+
+    Seul le dictionnaire info (petit) transite par pickle.
+    """
+    segments = [shared_memory.SharedMemory(name=h.name) for h in (*input_handles, *output_handles)]
+    try:
+        arrays = [_as_array(s, h) for s, h in zip(segments, (*input_handles, *output_handles))]
+        inputs, outputs = arrays[:len(input_handles)], arrays[len(input_handles):]
+        del arrays
+        return _compute(operation, tolerance, inputs, outputs)
+    finally:
+        inputs = outputs = None
+        for segment in segments:
+            _close_quietly(segment)
+
+
+class SharedMemorySolverPool:
+    """
+    Pool de processus exécutant MatrixSolver sur des matrices en mémoire partagée
+
+    Usage:
+        with SharedMemorySolverPool(max_workers=4) as pool:
+            x, info = pool.solve(A, b)
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, tolerance: float = 1e-10, mp_context=None):
+        self.tolerance = tolerance
+        self._executor = ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context)
+
+    def _run(self, operation: str, inputs: List[SharedArrayHandle], outputs: List[SharedArrayHandle]):
+        return self._executor.submit(_run_shared_task, operation, self.tolerance, inputs, outputs)
+
+    def solve(self, A: np.ndarray, b: np.ndarray, method: str = "gauss") -> Tuple[np.ndarray, Dict[str, Any]]:
+        """Résoudre Ax = b dans un worker ('gauss' ou 'lu')"""
+        return self.solve_many([(A, b)], method=method)[0]
+
+    def solve_many(self, systems: Sequence[Tuple[np.ndarray, np.ndarray]],
+                   method: str = "gauss") -> List[Tuple[np.ndarray, Dict[str, Any]]]:
+        """Résoudre plusieurs systèmes indépendants en parallèle"""
+        if method not in ("gauss", "lu"):
+            raise ValueError(f"Méthode inconnue: {method}")
+
+        with SharedArrayArena() as arena:
+            jobs = []
+            try:
+                for A, b in systems:
+                    inputs = [arena.put(np.asarray(A, dtype=float)), arena.put(np.asarray(b, dtype=float))]
+                    outputs = [arena.empty(np.shape(b))]
+                    jobs.append((self._run(method, inputs, outputs), outputs[0]))
+            finally:
+                # Ne libérer les segments qu'une fois tous les workers terminés
+                wait([future for future, _ in jobs])
+
+            results = []
+            for future, out in jobs:
+                info = future.result()
+                results.append((arena.view(out).copy(), info))
+            return results
+
+    def lu_decomposition(self, A: np.ndarray) -> Tuple[np.ndarray, np.ndarray, Dict[str, Any]]:
+        """Décomposition LU dans un worker"""
+        n = A.shape[0]
+        with SharedArrayArena() as arena:
+            outputs = [arena.empty((n, n)), arena.empty((n, n))]
+            info = self._run("decompose_lu", [arena.put(np.asarray(A, dtype=float))], outputs).result()
+            return arena.view(outputs[0]).copy(), arena.view(outputs[1]).copy(), info
+
+    def inverse(self, A: np.ndarray) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """Inverse dans un worker"""
+        with SharedArrayArena() as arena:
+            outputs = [arena.empty(A.shape)]
+            info = self._run("inverse", [arena.put(np.asarray(A, dtype=float))], outputs).result()
+            return arena.view(outputs[0]).copy(), info
+
+    def determinant(self, A: np.ndarray) -> Tuple[float, Dict[str, Any]]:
+        """Déterminant dans un worker"""
+        with SharedArrayArena() as arena:
+            info = self._run("determinant", [arena.put(np.asarray(A, dtype=float))], []).result()
+            return info.pop('determinant'), info
+
+    def shutdown(self, wait: bool = True):
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def __enter__(self) -> "SharedMemorySolverPool":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.shutdown()
@@ -0,0 +1,180 @@
+"""
+Analyse approchée des grandes matrices par esquisses aléatoires
+Valeurs singulières dominantes (recherche d'image aléatoire avec itérations de
+puissance), plus petite valeur singulière (itération inverse sur la LU),
+conditionnement et rang numérique, avec des bornes d'erreur explicites.
+
+Les bornes probabilistes reposent sur le lemme de Halko–Martinsson–Tropp
+(SIAM Review 2011, lemme 4.1): pour r vecteurs gaussiens ωᵢ,
+||B|| ≤ α·√(2/π)·maxᵢ ||B·ωᵢ|| sauf avec une probabilité α⁻ʳ.
+Les minorations (valeurs de Ritz) sont déterministes.
+"""
+
+from typing import Any, Dict, Optional, Tuple
+import numpy as np
+
+from src.services.factorization import LUFactorization
+
+# Facteur α du lemme et nombre de vecteurs de test: chaque borne échoue avec
+# une probabilité α⁻ʳ = 10⁻⁶
+DEFAULT_ALPHA = 10.0
+DEFAULT_PROBES = 6
+# Itérations de puissance pour encadrer ||A|| et ||A⁻¹||: la borne supérieure
+# dépasse la valeur vraie d'un facteur au plus (α·√(2/π))^(1/2q)
+NORM_ITERATIONS = 8
+
+
+def _probe_factor(alpha: float) -> float:
+    return alpha * np.sqrt(2.0 / np.pi)
+
+
+def range_finder(A: np.ndarray, size: int, power_iterations: int,
+                 rng: np.random.Generator) -> np.ndarray:
+    """
+    Base orthonormée Q (n×size) approchant l'image dominante de A
+
+    Itérations de sous-espace (A·Aᵀ)^q·A·Ω, réorthonormalisées à chaque
+    application pour ne pas perdre les directions de faible énergie.
+    """
+    Q, _ = np.linalg.qr(A @ rng.standard_normal((A.shape[1], size)))
+    for _ in range(power_iterations):
+        Z, _ = np.linalg.qr(A.T @ Q)
+        Q, _ = np.linalg.qr(A @ Z)
+    return Q
+
+
+def _power_norm(apply, n: int, iterations: int, probes: int, alpha: float,
+                rng: np.random.Generator) -> Tuple[float, np.ndarray]:
+    """
+    Itération de puissance par blocs sur B = apply (symétrique positive)
+
+    Returns:
+        (majorant probabiliste de ||B||^(1/iterations), base des itérés)
+    """
+    Y = rng.standard_normal((n, probes))
+    log_scale = 0.0
+    for _ in range(iterations):
+        Y = apply(Y)
+        # Renormalisation commune: les rapports entre colonnes sont conservés
+        scale = np.linalg.norm(Y, axis=0).max()
+        if scale == 0.0:
+            return 0.0, Y
+        log_scale += np.log(scale)
+        Y /= scale
+    log_bound = np.log(_probe_factor(alpha)) + log_scale + np.log(np.linalg.norm(Y, axis=0).max())
+    return float(np.exp(log_bound / iterations)), Y
+
+
+def residual_bound(A: np.ndarray, Q: np.ndarray, probes: int, alpha: float,
+                   rng: np.random.Generator, iterations: int = NORM_ITERATIONS) -> float:
+    """
+    Majorant probabiliste de ||(I - Q·Qᵀ)·A|| (probabilité d'échec α⁻ʳ)
+
+    Itération de puissance sur P·A·Aᵀ·P (P = I - Q·Qᵀ): un seul produit
+    ||P·A·ω|| approcherait la norme de Frobenius, bien plus grande que la
+    norme 2 lorsque le spectre est plat.
+    """
+    def project(Y):
+        return Y - Q @ (Q.T @ Y)
+
+    bound, _ = _power_norm(lambda Y: project(A @ (A.T @ project(Y))), A.shape[0], iterations, probes, alpha, rng)
+    return float(np.sqrt(bound))
+
+
+def estimate_spectrum(
+    A: np.ndarray,
+    lu: Optional[LUFactorization] = None,
+    rank: int = 10,
+    oversampling: int = 10,
+    power_iterations: int = 2,
+    probes: int = DEFAULT_PROBES,
+    alpha: float = DEFAULT_ALPHA,
+    seed: int = 0
+) -> Dict[str, Any]:
+    """
+    Estimer valeurs singulières dominantes, σ_min, conditionnement et rang
+
+    Coût O(n²·(rank + oversampling)·power_iterations) plus O(n²) par solve
+    avec la LU fournie, au lieu des O(n³) d'une SVD complète.
+
+    Args:
+        lu: factorisation de A (σ_min et conditionnement si non singulière)
+        rank: nombre de valeurs singulières dominantes estimées
+
+    Returns:
+        dictionnaire: estimations ponctuelles, intervalles [min, max] et
+        niveau de confiance (toutes les bornes vraies simultanément)
+    """
+    n = A.shape[0]
+    rng = np.random.default_rng(seed)
+    size = min(rank + oversampling, n)
+    failure_events = 0
+
+    # Valeurs singulières dominantes: σᵢ(QᵀA) ≤ σᵢ(A) ≤ σᵢ(QᵀA) + ||(I - QQᵀ)A|| (Weyl)
+    Q = range_finder(A, size, power_iterations, rng)
+    s = np.linalg.svd(Q.T @ A, compute_uv=False)
+    error = residual_bound(A, Q, probes, alpha, rng)
+    failure_events += 1
+
+    # ||A||: majorant par itération de puissance sur AᵀA, minorant de Ritz
+    # sur les itérés (plus précis que s[0] lorsque le spectre est plat)
+    power_bound, Y = _power_norm(lambda Y: A.T @ (A @ Y), n, NORM_ITERATIONS, probes, alpha, rng)
+    failure_events += 1
+    V, _ = np.linalg.qr(Y)
+    sigma_max = max(float(s[0]) if s.size else 0.0, float(np.linalg.norm(A @ V, 2)))
+    sigma_max_bounds = [sigma_max, min(sigma_max + error, float(np.sqrt(power_bound)))]
+
+    # σ_min = 1/||A⁻¹||: itération inverse sur (AᵀA)⁻¹ = A⁻¹·A⁻ᵀ
+    sigma_min = sigma_min_bounds = None
+    if lu is not None and not lu.singular:
+        inverse_bound, Y = _power_norm(
+            lambda Y: lu.solve(lu.solve_transpose(Y)), n, NORM_ITERATIONS, probes, alpha, rng
+        )
+        failure_events += 1
+        # Ritz: σ_min(A·V) ≥ σ_min(A) pour V orthonormée (majorant déterministe)
+        V, _ = np.linalg.qr(Y)
+        sigma_min = float(np.linalg.svd(A @ V, compute_uv=False)[-1])
+        lower = 1.0 / np.sqrt(inverse_bound) if inverse_bound > 0 else 0.0
+        sigma_min_bounds = [min(float(lower), sigma_min), sigma_min]
+
+    condition_number = condition_bounds = None
+    if sigma_min is not None and sigma_min > 0.0:
+        condition_number = sigma_max / sigma_min
+        condition_bounds = [
+            sigma_max_bounds[0] / sigma_min_bounds[1],
+            sigma_max_bounds[1] / sigma_min_bounds[0] if sigma_min_bounds[0] > 0 else None
+        ]
+
+    # Rang numérique au même seuil que l'analyse exacte: σ > σ_max·n·ε
+    threshold = sigma_max * n * np.finfo(float).eps
+    if sigma_min_bounds is not None and sigma_min_bounds[0] > threshold:
+        rank_bounds = [n, n]
+    else:
+        upper = n
+        if error <= threshold:
+            # σ_{size+1} ≤ ||(I - QQᵀ)A|| ≤ seuil et σᵢ ≤ sᵢ + erreur
+            upper = int(np.count_nonzero(s + error > threshold))
+        elif sigma_min_bounds is not None and sigma_min_bounds[1] <= threshold:
+            upper = n - 1
+        rank_bounds = [min(int(np.count_nonzero(s > threshold)), upper), upper]
+    # Estimation ponctuelle seulement si l'esquisse capture tout le spectre utile
+    if rank_bounds[0] == rank_bounds[1] or error <= threshold:
+        numerical_rank = rank_bounds[0]
+    else:
+        numerical_rank = None
+
+    return {
+        'singular_values': s[:rank].tolist(),
+        'singular_value_error': error,
+        'largest_singular_value_bounds': sigma_max_bounds,
+        'smallest_singular_value': sigma_min,
+        'smallest_singular_value_bounds': sigma_min_bounds,
+        'condition_number': condition_number,
+        'condition_number_bounds': condition_bounds,
+        'rank': numerical_rank,
+        'rank_bounds': rank_bounds,
+        'confidence': 1.0 - failure_events * alpha ** (-probes),
+        'sketch_size': size,
+        'power_iterations': power_iterations,
+        'probes': probes
+    }
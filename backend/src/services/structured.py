@@ -0,0 +1,178 @@
+"""
+Systèmes de Toeplitz et circulants
+Détection de structure, produit matrice-vecteur par FFT, résolution circulante
+par diagonalisation FFT en O(n log n) et résolution de Toeplitz par Levinson en O(n²).
+
+Une matrice de Toeplitz est entièrement décrite par sa première colonne c et
+sa première ligne r (r[0] = c[0]): T[i, j] = c[i - j] si i ≥ j, r[j - i] sinon.
+Une matrice circulante est une Toeplitz où r[k] = c[n - k].
+"""
+
+from typing import Optional, Tuple
+import numpy as np
+from scipy.linalg import toeplitz as dense_toeplitz
+
+# En dessous de cette taille, la détection automatique n'apporte rien (O(n³) négligeable)
+DETECT_MIN_SIZE = 16
+
+
+def circulant_row(c: np.ndarray) -> np.ndarray:
+    """Première ligne d'une matrice circulante de première colonne c"""
+    return np.roll(c[::-1], 1)
+
+
+def to_dense(c: np.ndarray, r: Optional[np.ndarray] = None) -> np.ndarray:
+    """Matrice de Toeplitz dense (r absent: symétrique)"""
+    return dense_toeplitz(c, c if r is None else r)
+
+
+def detect_structure(A: np.ndarray, tolerance: float = 0.0) -> Optional[str]:
+    """
+    Détecter une structure circulante ou de Toeplitz (O(n²))
+
+    Returns:
+        'circulant', 'toeplitz' ou None
+    """
+    n, m = A.shape
+    if n != m or n < 2:
+        return None
+    if not np.allclose(A[1:, 1:], A[:-1, :-1], rtol=0.0, atol=tolerance):
+        return None
+    if np.allclose(A[0], circulant_row(A[:, 0]), rtol=0.0, atol=tolerance):
+        return 'circulant'
+    return 'toeplitz'
+
+
+def toeplitz_matvec(c: np.ndarray, r: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """
+    Produit T·x en O(n log n) par plongement dans une circulante de taille 2n
+
+    La circulante de première colonne [c, 0, r[n-1], ..., r[1]] contient T
+    dans son bloc supérieur gauche.
+    """
+    n = c.shape[0]
+    embedding = np.concatenate([c, [0.0], r[:0:-1]])
+    padded = np.concatenate([x, np.zeros(n)])
+    y = np.fft.ifft(np.fft.fft(embedding) * np.fft.fft(padded))[:n]
+    return y.real if np.isrealobj(c) and np.isrealobj(r) and np.isrealobj(x) else y
+
+
+def circulant_eigenvalues(c: np.ndarray) -> np.ndarray:
+    """Valeurs propres d'une circulante: transformée de Fourier de sa première colonne"""
+    return np.fft.fft(c)
+
+
+def circulant_solve(c: np.ndarray, b: np.ndarray, tolerance: float = 1e-10) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Résoudre C·x = b (C circulante) en O(n log n)
+
+    C = F⁻¹·diag(λ)·F: x = ifft(fft(b) / λ).
+
+    Returns:
+        (x, valeurs propres λ)
+    """
+    eigenvalues = circulant_eigenvalues(c)
+    magnitudes = np.abs(eigenvalues)
+    if magnitudes.min() <= tolerance * max(magnitudes.max(), 1.0):
+        raise ValueError("Matrice circulante singulière (valeur propre ≈ 0)")
+    x = np.fft.ifft(np.fft.fft(b) / eigenvalues)
+    if np.isrealobj(c) and np.isrealobj(b):
+        x = x.real
+    return x, eigenvalues
+
+
+def circulant_determinant(c: np.ndarray) -> float:
+    """det(C) = produit des valeurs propres (réel pour c réel)"""
+    with np.errstate(over='ignore'):
+        return float(np.prod(circulant_eigenvalues(c)).real)
+
+
+def levinson(c: np.ndarray, r: np.ndarray, b: Optional[np.ndarray] = None,
+             tolerance: float = 1e-10, max_growth: Optional[float] = None) -> Tuple[Optional[np.ndarray], float]:
+    """
+    Récurrence de Levinson pour T Toeplitz quelconque (non symétrique)
+
+    Les vecteurs avant f et arrière g vérifient T_k·f = e₁ et T_k·g = e_k
+    pour chaque sous-matrice principale T_k; la solution est étendue d'un
+    élément à chaque étape. f[0] = det(T_{k-1}) / det(T_k), d'où
+    det(T) = Π 1/f⁽ᵏ⁾[0] sans calcul supplémentaire.
+
+    Exige des sous-matrices principales inversibles (sinon ValueError);
+    moins stable que Gauss avec pivotage pour les matrices indéfinies.
+    max_growth borne l'estimation ||T||·max(||f||₁, ||g||₁) du conditionnement
+    des sous-matrices principales (ValueError au-delà).
+
+    Returns:
+        (x ou None si b absent, déterminant)
+    """
+    n = c.shape[0]
+    if abs(c[0]) < tolerance:
+        raise ValueError("Levinson: sous-matrice principale singulière (t₀ ≈ 0)")
+
+    f = np.array([1.0 / c[0]])
+    g = f.copy()
+    x = None if b is None else np.array([b[0] / c[0]])
+    log_det = np.log(abs(c[0]))
+    sign = np.sign(c[0])
+    # ||T||₁ majorée par la somme des coefficients distincts
+    norm = np.abs(c).sum() + np.abs(r).sum()
+    if max_growth is not None and norm * abs(f[0]) > max_growth:
+        raise ValueError("Levinson instable: premier pivot trop petit")
+
+    for k in range(1, n):
+        # Erreurs des vecteurs prolongés par un zéro: dernière / première ligne
+        ef = c[k:0:-1] @ f
+        eb = r[1:k + 1] @ g
+        denom = 1.0 - ef * eb
+        if abs(denom) < tolerance:
+            raise ValueError(f"Levinson: sous-matrice principale {k + 1} singulière")
+
+        f_ext = np.append(f, 0.0)
+        g_ext = np.insert(g, 0, 0.0)
+        f = (f_ext - ef * g_ext) / denom
+        g = (g_ext - eb * f_ext) / denom
+        if max_growth is not None and norm * max(np.abs(f).sum(), np.abs(g).sum()) > max_growth:
+            raise ValueError(f"Levinson instable: sous-matrice principale {k + 1} mal conditionnée")
+
+        if x is not None:
+            ex = c[k:0:-1] @ x
+            x = np.append(x, 0.0) + (b[k] - ex) * g
+
+        # det(T_{k+1}) = det(T_k) / f[0]
+        log_det -= np.log(abs(f[0]))
+        sign *= np.sign(f[0])
+
+    with np.errstate(over='ignore'):
+        return x, float(sign * np.exp(log_det))
+
+
+def toeplitz_determinant(c: np.ndarray, r: np.ndarray, tolerance: float = 1e-10) -> float:
+    """
+    det(T) par Levinson, refusé si la récurrence est instable
+
+    Sans second membre, pas de résidu à contrôler: la croissance des vecteurs
+    f et g est bornée à 1/√ε (même seuil que le résidu de toeplitz_solve);
+    au-delà, ValueError et l'appelant revient à une factorisation dense.
+    """
+    _, det = levinson(c, r, tolerance=tolerance, max_growth=1.0 / np.sqrt(np.finfo(float).eps))
+    return det
+
+
+def toeplitz_solve(c: np.ndarray, r: np.ndarray, b: np.ndarray,
+                   tolerance: float = 1e-10) -> Tuple[np.ndarray, float]:
+    """
+    Résoudre T·x = b par Levinson avec contrôle du résidu (produit FFT)
+
+    Un résidu relatif supérieur à √ε signale une instabilité de la
+    récurrence: l'appelant doit alors revenir à une factorisation dense.
+
+    Returns:
+        (x, déterminant)
+    """
+    x, det = levinson(c, r, b, tolerance)
+    residual = np.linalg.norm(toeplitz_matvec(c, r, x) - b)
+    # ||T|| majoré par la somme des coefficients distincts
+    scale = np.linalg.norm(b) + (np.abs(c).sum() + np.abs(r).sum()) * np.linalg.norm(x) + np.finfo(float).tiny
+    if not np.isfinite(residual) or residual > np.sqrt(np.finfo(float).eps) * scale:
+        raise ValueError("Levinson instable pour cette matrice (résidu trop grand)")
+    return x, det
@@ -0,0 +1,106 @@
+"""
+Noyaux de résolution triangulaire (substitution avant / arrière)
+Partagés par tous les solveurs de MatrixSolver
+"""
+
+from typing import Literal
+import numpy as np
+
+# Taille de bloc par défaut pour la variante par blocs de colonnes
+DEFAULT_BLOCK_SIZE = 64
+
+Variant = Literal["auto", "row", "blocked"]
+
+
+def _solve_rows(T: np.ndarray, X: np.ndarray, lower: bool, unit_diagonal: bool, start: int, stop: int):
+    """
+    Variante vectorisée par lignes, en place sur X[start:stop]
+
+    Chaque ligne est un produit scalaire (ou matrice-vecteur si plusieurs
+    seconds membres) avec les inconnues déjà calculées du bloc.
+    """
+    if lower:
+        for i in range(start, stop):
+            if i > start:
+                X[i] -= T[i, start:i] @ X[start:i]
+            if not unit_diagonal:
+                X[i] /= T[i, i]
+    else:
+        for i in range(stop - 1, start - 1, -1):
+            if i + 1 < stop:
+                X[i] -= T[i, i + 1:stop] @ X[i + 1:stop]
+            if not unit_diagonal:
+                X[i] /= T[i, i]
+
+
+def solve_triangular(
+    T: np.ndarray,
+    B: np.ndarray,
+    lower: bool = False,
+    unit_diagonal: bool = False,
+    variant: Variant = "auto",
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    tolerance: float = 0.0
+) -> np.ndarray:
+    """
+    Résoudre T X = B avec T triangulaire
+
+    Args:
+        T: matrice triangulaire (n×n); seul le triangle utile est lu
+        B: second membre (n,) ou plusieurs seconds membres (n×k)
+        lower: T triangulaire inférieure (substitution avant) sinon supérieure
+        unit_diagonal: diagonale implicitement égale à 1 (non lue)
+        variant: 'row' (vectorisée par lignes), 'blocked' (blocs de colonnes,
+            mises à jour matrice-matrice) ou 'auto'
+        block_size: taille des blocs pour la variante 'blocked'
+        tolerance: seuil en dessous duquel un pivot diagonal est considéré nul
+
+    Returns:
+        X de même forme que B
+    """
+    n = T.shape[0]
+    if T.ndim != 2 or T.shape[1] != n:
+        raise ValueError(f"La matrice triangulaire doit être carrée (actuellement {T.shape})")
+    if B.shape[0] != n:
+        raise ValueError(f"Le second membre doit avoir {n} lignes (actuellement {B.shape[0]})")
+
+    if not unit_diagonal:
+        diag = np.abs(np.diag(T))
+        if n and diag.min() <= tolerance:
+            i = int(np.argmin(diag))
+            raise ValueError(f"Matrice singulière détectée (pivot {i+1} ≈ 0)")
+
+    X = np.array(B, dtype=np.result_type(T, B, float), copy=True)
+
+    if variant == "auto":
+        variant = "blocked" if n > 2 * block_size else "row"
+
+    if variant == "row":
+        _solve_rows(T, X, lower, unit_diagonal, 0, n)
+    elif variant == "blocked":
+        if lower:
+            for start in range(0, n, block_size):
+                stop = min(start + block_size, n)
+                _solve_rows(T, X, lower, unit_diagonal, start, stop)
+                if stop < n:
+                    X[stop:] -= T[stop:, start:stop] @ X[start:stop]
+        else:
+            for stop in range(n, 0, -block_size):
+                start = max(stop - block_size, 0)
+                _solve_rows(T, X, lower, unit_diagonal, start, stop)
+                if start > 0:
+                    X[:start] -= T[:start, start:stop] @ X[start:stop]
+    else:
+        raise ValueError(f"Variante inconnue: {variant}")
+
+    return X
+
+
+def forward_substitution(L: np.ndarray, b: np.ndarray, unit_diagonal: bool = False, **kwargs) -> np.ndarray:
+    """Résoudre Ly = b (L triangulaire inférieure)"""
+    return solve_triangular(L, b, lower=True, unit_diagonal=unit_diagonal, **kwargs)
+
+
+def back_substitution(U: np.ndarray, b: np.ndarray, unit_diagonal: bool = False, **kwargs) -> np.ndarray:
+    """Résoudre Ux = b (U triangulaire supérieure)"""
+    return solve_triangular(U, b, lower=False, unit_diagonal=unit_diagonal, **kwargs)
@@ -0,0 +1,112 @@
+"""
+Détection de cycles des machines de Turing à partir des empreintes de configuration
+Deux stratégies: table exacte (toutes les empreintes) ou mémoire bornée
+(algorithme de Brent et table d'échantillons de taille fixe).
+
+Une stratégie ne fait que proposer des étapes candidates (même empreinte);
+la machine confirme ensuite en comparant les configurations complètes.
+"""
+
+from typing import Dict, Hashable, List, Optional
+
+# Capacité par défaut de la table d'échantillons (mode borné)
+DEFAULT_LOOP_MEMORY = 4096
+
+
+class ExactLoopDetector:
+    """
+    Toutes les empreintes rencontrées: boucle signalée dès la première
+    répétition; la mémoire croît avec le nombre d'étapes
+    """
+
+    # L'étape candidate est la première occurrence: début du cycle exact
+    first_repeat = True
+
+    def __init__(self):
+        self.table: Dict[Hashable, List[int]] = {}
+
+    def observe(self, key: Hashable, step: int) -> Optional[List[int]]:
+        """Enregistrer l'empreinte de l'étape step; étapes antérieures de même empreinte"""
+        seen = self.table.setdefault(key, [])
+        candidates = seen.copy() if seen else None
+        seen.append(step)
+        return candidates
+
+    def lookup(self, key: Hashable) -> List[int]:
+        """Étapes déjà enregistrées avec cette empreinte (sans enregistrer)"""
+        return self.table.get(key, [])
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+
+class BoundedLoopDetector:
+    """
+    Détection de cycle en mémoire bornée
+
+    - Brent: une empreinte de référence, remplacée par la courante aux
+      étapes 0, 1, 3, 7, 15... (intervalles doublés); un cycle de longueur λ
+      commençant à l'étape μ est détecté au plus tard à l'étape
+      2·max(μ + 1, λ) + λ.
+    - Table optionnelle de capacity empreintes échantillonnées toutes les
+      stride étapes; pleine, stride double et seuls les échantillons
+      multiples du nouveau pas sont conservés. Un cycle est alors aussi
+      détecté au plus stride + λ étapes après son début.
+
+    La répétition trouvée n'est pas forcément la première: longueur et début
+    exacts du cycle sont recalculés par la machine.
+    """
+
+    first_repeat = False
+
+    def __init__(self, capacity: int = DEFAULT_LOOP_MEMORY):
+        self.capacity = capacity
+        self.table: Dict[Hashable, int] = {}
+        self.stride = 1
+        self.reference: Optional[Hashable] = None
+        self.reference_step = 0
+        self.power = 1
+
+    def observe(self, key: Hashable, step: int) -> Optional[List[int]]:
+        candidates = None
+        if key == self.reference:
+            candidates = [self.reference_step]
+        elif key in self.table:
+            candidates = [self.table[key]]
+
+        if self.reference is None or step - self.reference_step == self.power:
+            if self.reference is not None:
+                self.power *= 2
+            self.reference, self.reference_step = key, step
+
+        if self.capacity and step % self.stride == 0:
+            self.table.setdefault(key, step)
+            if len(self.table) > self.capacity:
+                self.stride *= 2
+                self.table = {k: s for k, s in self.table.items() if s % self.stride == 0}
+        return candidates
+
+    def __len__(self) -> int:
+        return len(self.table) + 1
+
+
+def create_loop_detector(mode: str, memory: int = DEFAULT_LOOP_MEMORY):
+    """Stratégie de détection: 'exact' ou 'bounded' (memory: capacité de la table, 0 = Brent seul)"""
+    if mode == "exact":
+        return ExactLoopDetector()
+    if mode == "bounded":
+        return BoundedLoopDetector(memory)
+    raise ValueError(f"Mode de détection de boucles inconnu: {mode}")
+
+
+def divisors(n: int) -> List[int]:
+    """Diviseurs de n par ordre croissant"""
+    small, large = [], []
+    d = 1
+    while d * d <= n:
+        if n % d == 0:
+            small.append(d)
+            if d * d != n:
+                large.append(n // d)
+        d += 1
+    return small + large[::-1]
@@ -5,58 +5,386 @@ Auteur: OPM Solver Pro
 Année: 2024
 """
 
-from typing import Dict, List, Tuple, Optional, Any, Set
+from typing import Dict, Iterable, Iterator, List, Tuple, Optional, Any
+import copy
 import time
 from dataclasses import dataclass
 
+from src.services.turing_loops import DEFAULT_LOOP_MEMORY, create_loop_detector, divisors
+from src.services.turing_trace import DEFAULT_KEYFRAME_INTERVAL, ExecutionTrace, display_cells
+
+MOVES = {'L': -1, 'R': 1, 'N': 0}
+
+# Nombre maximal d'entrées de la table dense (états × combinaisons de
+# symboles lus); au-delà, table creuse indexée par le même code entier
+DENSE_TABLE_LIMIT = 1 << 20
+
+# Capacité initiale minimale du tampon d'un ruban (cellules)
+MIN_TAPE_CAPACITY = 64
+
+# Empreinte polynomiale des rubans: Σ code(p)·B^p mod M (M premier de Mersenne)
+HASH_MODULUS = (1 << 61) - 1
+HASH_BASE = 0x2545F4914F6CDD1D % HASH_MODULUS
+HASH_BASE_INVERSE = pow(HASH_BASE, -1, HASH_MODULUS)
+# 1/(B - 1): somme géométrique Σ_{j<k} B^j = (B^k - 1)/(B - 1) d'un balayage
+HASH_GEOMETRIC = pow(HASH_BASE - 1, -1, HASH_MODULUS)
+
+# Recherche du début d'un cycle: pas des blocs rejoués avant l'affinage étape par étape
+LOOP_SEARCH_CHUNK = 1024
+
+# Niveaux de trace: aucune, résumé (configurations initiale et finale),
+# échantillonnée (une étape sur N ou N étapes régulièrement espacées), complète
+TRACE_MODES = ("none", "summary", "sampled", "full")
+DEFAULT_SAMPLE_FRAMES = 100
+
+# Issues d'une étape sans transition appliquée (sinon: index de la règle)
+ACCEPTED = -1
+LOOP = -2
+NO_TRANSITION = -3
+
+HALT_REASONS = {
+    ACCEPTED: ("Accepted", "Accepted"),
+    LOOP: ("Infinite loop detected", "Infinite loop detected"),
+    NO_TRANSITION: ("No transition", "Rejected (no transition)"),
+}
+
+
+class _SparseTable(dict):
+    """Table creuse: une clé absente vaut None, comme une case vide de la table dense"""
+
+    def __missing__(self, key):
+        return None
+
+
+class CompiledProgram:
+    """
+    Table de transitions compilée en entiers
+
+    États et symboles sont numérotés (le blanc vaut 0, au plus 256 symboles). La transition de
+    (état, symboles lus) est rangée à l'indice état × radix + code, où code
+    écrit les symboles lus en base len(symbols). Une entrée contient
+    (état suivant, écriture(s), déplacement(s), index de règle); les
+    descriptions textuelles ne sont produites qu'à la lecture de l'historique.
+    """
+
+    def __init__(
+        self,
+        num_tapes: int,
+        blank_symbol: str,
+        initial_state: str,
+        final_states: List[str],
+        transitions: Dict[Tuple, Tuple],
+        tapes: List[str]
+    ):
+        self.num_tapes = num_tapes
+        self.states: List[str] = []
+        self.state_index: Dict[str, int] = {}
+        self.symbols: List[str] = []
+        self.symbol_index: Dict[str, int] = {}
+
+        self.intern_symbol(blank_symbol)
+        self.intern_state(initial_state)
+        for state in final_states:
+            self.intern_state(state)
+        for tape in tapes:
+            for symbol in tape:
+                self.intern_symbol(symbol)
+
+        # Règles normalisées: (clé, (état suivant, écritures, directions))
+        self.rules: List[Tuple[Tuple, Tuple]] = []
+        for key, (next_state, writes, directions) in transitions.items():
+            if num_tapes == 1:
+                writes, directions = (writes,), (directions,)
+            self.intern_state(key[0])
+            self.intern_state(next_state)
+            for symbol in (*key[1:], *writes):
+                self.intern_symbol(symbol)
+            self.rules.append((key, (next_state, tuple(writes), tuple(directions))))
+
+        if len(self.symbols) > 256:
+            raise ValueError("Au plus 256 symboles distincts par machine (une cellule = un octet)")
+        # Décodage d'un segment de ruban (octets lus en latin-1) vers les symboles
+        self.translation = dict(enumerate(self.symbols))
+
+        final = set(final_states)
+        self.final = [state in final for state in self.states]
+        self.base = len(self.symbols)
+        self.radix = self.base ** num_tapes
+
+        size = len(self.states) * self.radix
+        self.table = [None] * size if size <= DENSE_TABLE_LIMIT else _SparseTable()
+        for rule, (key, (next_state, writes, directions)) in enumerate(self.rules):
+            index = self.state_index[key[0]] * self.radix + self.encode(
+                [self.symbol_index[symbol] for symbol in key[1:]]
+            )
+            write_codes = tuple(self.symbol_index[symbol] for symbol in writes)
+            moves = tuple(MOVES.get(direction, 0) for direction in directions)
+            if num_tapes == 1:
+                self.table[index] = (self.state_index[next_state], write_codes[0], moves[0], rule)
+            else:
+                self.table[index] = (self.state_index[next_state], write_codes, moves, rule)
+
+    def intern_state(self, state: str) -> int:
+        if state not in self.state_index:
+            self.state_index[state] = len(self.states)
+            self.states.append(state)
+        return self.state_index[state]
+
+    def intern_symbol(self, symbol: str) -> int:
+        if symbol not in self.symbol_index:
+            self.symbol_index[symbol] = len(self.symbols)
+            self.symbols.append(symbol)
+        return self.symbol_index[symbol]
+
+    def encode(self, codes: List[int]) -> int:
+        """Code des symboles lus: Σ codes[i] × base^i"""
+        code = 0
+        for symbol in reversed(codes):
+            code = code * self.base + symbol
+        return code
+
+    def describe(self, outcome: int, state: int, reads: Tuple[int, ...]) -> str:
+        """Description textuelle d'une étape (générée à la demande)"""
+        if outcome == ACCEPTED:
+            return f"✓ Accepté dans l'état {self.states[state]}"
+        if outcome == LOOP:
+            return "⚠ Boucle infinie détectée (configuration répétée)"
+        if outcome == NO_TRANSITION:
+            current_symbols = [self.symbols[symbol] for symbol in reads]
+            return f"✗ Aucune transition pour ({self.states[state]}, {current_symbols})"
+
+        _, (next_state, writes, directions) = self.rules[outcome]
+        if self.num_tapes == 1:
+            return f"Écrire '{writes[0]}', mouvement {directions[0]}, état → {next_state}"
+        writes_text = ', '.join(f"R{i}:'{s}'" for i, s in enumerate(writes))
+        moves_text = ', '.join(f"R{i}:{d}" for i, d in enumerate(directions))
+        return f"Écrire [{writes_text}], mouvements [{moves_text}], état → {next_state}"
+
 
-@dataclass
 class TapeState:
-    """État d'un ruban à un moment donné"""
-    content: List[str]
-    head_position: int
+    """
+    Ruban bidirectionnel: une cellule = un octet (symbole interné, 0 = blanc)
+
+    La cellule logique p est rangée à buffer[origin + p]. Quand la tête sort
+    du tampon, celui-ci double de taille du côté concerné: l'extension est en
+    O(1) amorti aux deux extrémités. [start, end) délimite, en indices du
+    tampon, les cellules écrites; la taille du ruban se lit donc en O(1).
+
+    L'empreinte F = Σ code(p)·B^p (mod M) est mise à jour en O(1) par
+    écriture, avec B^tête et B^-tête par déplacement: F·B^-tête identifie le
+    contenu vu depuis la tête, indépendamment des translations et des blancs.
+    None tant qu'elle n'est pas maintenue (recalculée à la demande).
+    """
+
+    def __init__(self, cells: bytes, head_position: int = 0):
+        capacity = max(MIN_TAPE_CAPACITY, 2 * max(len(cells), head_position + 1))
+        self.buffer = bytearray(capacity)
+        self.origin = capacity // 4
+        self.buffer[self.origin:self.origin + len(cells)] = cells
+        self.start = self.origin
+        self.end = self.origin + len(cells)
+        self.index = self.origin
+        self.fingerprint: Optional[int] = None
+        self.power = self.inverse_power = 1
+        self.head_position = head_position
+
+    @property
+    def head_position(self) -> int:
+        """Position logique de la tête (0 = première cellule du ruban initial)"""
+        return self.index - self.origin
+
+    @head_position.setter
+    def head_position(self, position: int):
+        self.index = self.origin + position
+        if not 0 <= self.index < len(self.buffer):
+            self._shift(self.grow(self.index))
+
+    @property
+    def size(self) -> int:
+        """Nombre de cellules écrites (initiales comprises)"""
+        return self.end - self.start
+
+    @property
+    def content(self) -> bytes:
+        return bytes(self.buffer[self.start:self.end])
+
+    def grow(self, index: int) -> int:
+        """
+        Doubler le tampon pour que index (indice du tampon) soit valide
+
+        Returns:
+            décalage appliqué aux indices existants (extension à gauche)
+        """
+        capacity = len(self.buffer)
+        if index < 0:
+            shift = max(capacity, -index)
+            self.buffer[:0] = bytes(shift)
+            self.origin += shift
+            return shift
+        if index >= capacity:
+            self.buffer.extend(bytes(max(capacity, index - capacity + 1)))
+        return 0
+
+    def rehash(self):
+        """Recalculer empreinte et puissances de la tête (O(taille))"""
+        fingerprint = 0
+        for symbol in reversed(self.buffer[self.start:self.end]):
+            fingerprint = (fingerprint * HASH_BASE + symbol) % HASH_MODULUS
+        first = self.start - self.origin
+        self.fingerprint = fingerprint * pow(HASH_BASE, first, HASH_MODULUS) % HASH_MODULUS
+        self.power = pow(HASH_BASE, self.head_position, HASH_MODULUS)
+        self.inverse_power = pow(HASH_BASE_INVERSE, self.head_position, HASH_MODULUS)
+
+    def relative_fingerprint(self) -> int:
+        """Empreinte du contenu relatif à la tête"""
+        if self.fingerprint is None:
+            self.rehash()
+        return self.fingerprint * self.inverse_power % HASH_MODULUS
+
+    def _shift(self, shift: int):
+        self.index += shift
+        self.start += shift
+        self.end += shift
     
-    def get_symbol(self) -> str:
+    def get_symbol(self) -> int:
         """Lire le symbole sous la tête"""
-        if 0 <= self.head_position < len(self.content):
-            return self.content[self.head_position]
-        return '_'  # Symbole blanc par défaut
+        return self.buffer[self.index]
     
-    def write_symbol(self, symbol: str):
+    def write_symbol(self, symbol: int):
         """Écrire un symbole sous la tête"""
-        if self.head_position < 0:
-            # Étendre à gauche
-            self.content.insert(0, symbol)
-            self.head_position = 0
-        elif self.head_position >= len(self.content):
-            # Étendre à droite
-            self.content.extend(['_'] * (self.head_position - len(self.content) + 1))
-            self.content[self.head_position] = symbol
-        else:
-            self.content[self.head_position] = symbol
-    
-    def move_head(self, direction: str):
-        """Déplacer la tête"""
-        if direction == 'L':
-            self.head_position -= 1
-        elif direction == 'R':
-            self.head_position += 1
-        # 'N' = pas de mouvement
+        if self.fingerprint is not None:
+            self.fingerprint = (self.fingerprint + (symbol - self.buffer[self.index]) * self.power) % HASH_MODULUS
+        self.buffer[self.index] = symbol
+        if self.index < self.start:
+            self.start = self.index
+        elif self.index >= self.end:
+            self.end = self.index + 1
     
-    def to_string(self, blank: str = '_') -> str:
-        """Convertir le ruban en chaîne"""
-        # Trim les blancs aux extrémités
-        content = self.content.copy()
-        while content and content[0] == blank:
-            content.pop(0)
-            self.head_position -= 1
-        while content and content[-1] == blank:
-            content.pop()
-        
-        if not content:
-            return blank
-        
-        return ''.join(content)
+    def move_head(self, move: int):
+        """Déplacer la tête (-1 = gauche, +1 = droite, 0 = aucun)"""
+        self.index += move
+        if not 0 <= self.index < len(self.buffer):
+            self._shift(self.grow(self.index))
+        if self.fingerprint is not None and move:
+            if move > 0:
+                self.power = self.power * HASH_BASE % HASH_MODULUS
+                self.inverse_power = self.inverse_power * HASH_BASE_INVERSE % HASH_MODULUS
+            else:
+                self.power = self.power * HASH_BASE_INVERSE % HASH_MODULUS
+                self.inverse_power = self.inverse_power * HASH_BASE % HASH_MODULUS
+
+    def sweep(self, symbol: int, write: int, move: int, budget: int, max_size: int, complete: bool = False) -> int:
+        """
+        Macro-pas: répéter la règle (q, symbol) → (q, write, move) qui vient
+        d'être appliquée, tant que la tête lit symbol
+
+        Le nombre de répétitions est borné par budget et par la taille
+        maximale du ruban (vérifiée avant chaque étape, comme pas à pas); la
+        plage est repérée et réécrite par des opérations sur les octets. Une
+        règle sans déplacement qui réécrit son symbole se répète jusqu'au
+        budget. L'empreinte, si elle est maintenue, est mise à jour en O(log
+        count) (somme géométrique des puissances de la plage).
+
+        Args:
+            complete: détection de boucles en cours: la plage doit être
+                parcourue jusqu'au bout (sinon l'exécution reprend pas à pas).
+                Seul un balayage de blancs au-delà des cellules écrites peut
+                être interrompu: ses configurations sont toutes distinctes,
+                sauf ruban entièrement blanc laissé blanc (refusé, la boucle
+                est alors signalée à l'étape suivante).
+
+        Returns:
+            nombre d'étapes effectuées (0 si la tête ne lit plus symbol ou
+            si le balayage est refusé)
+        """
+        index, start, end = self.index, self.start, self.end
+        if budget <= 0 or end - start > max_size or self.buffer[index] != symbol:
+            return 0
+        if move == 0:
+            return budget if write == symbol and not complete else 0
+
+        run = bytes((symbol,))
+        if move > 0:
+            # Répétition j (1..count) en index + j - 1: span ≤ max_size avant chacune
+            count = min(budget, max_size + start - index + 1)
+            window = self.buffer[index:index + count]
+            length = len(window) - len(window.lstrip(run))
+            # Blancs jusqu'aux cellules jamais écrites (à droite de end)
+            unbounded = symbol == 0 and index + length >= end
+            if length == len(window) and symbol == 0:
+                # Au-delà du tampon: blancs
+                length = count
+            following = index + min(count, length)
+        else:
+            count = min(budget, max_size - end + index + 2)
+            window = self.buffer[max(0, index - count + 1):index + 1]
+            length = len(window) - len(window.rstrip(run))
+            unbounded = symbol == 0 and index - length < start
+            if length == len(window) and symbol == 0:
+                length = count
+            following = index - min(count, length)
+        count = min(count, length)
+
+        if complete:
+            if unbounded:
+                if write == 0 and self.fingerprint == 0:
+                    return 0
+            elif 0 <= following < len(self.buffer) and self.buffer[following] == symbol:
+                # Plage interrompue par le budget ou la taille maximale
+                return 0
+        if self.fingerprint is not None:
+            self._sweep_fingerprint(symbol, write, move, count)
+
+        if move > 0:
+            self.grow(index + count)
+            self.buffer[index:index + count] = bytes((write,)) * count
+            self.index = index + count
+            self.end = max(end, index + count)
+        else:
+            head = index - count
+            if head < 0:
+                shift = self.grow(head)
+                self._shift(shift)
+                head += shift
+            self.buffer[head + 1:head + 1 + count] = bytes((write,)) * count
+            self.index = head
+            self.start = min(self.start, head + 1)
+        return count
+
+    def _sweep_fingerprint(self, symbol: int, write: int, move: int, count: int):
+        """Empreinte après réécriture de count cellules parcourues dans le sens move"""
+        step = pow(HASH_BASE, count, HASH_MODULUS)
+        step_inverse = pow(HASH_BASE_INVERSE, count, HASH_MODULUS)
+        geometric = (step - 1) * HASH_GEOMETRIC % HASH_MODULUS
+        if move > 0:
+            # Cellules tête .. tête + count - 1
+            changed = self.power * geometric
+            self.power = self.power * step % HASH_MODULUS
+            self.inverse_power = self.inverse_power * step_inverse % HASH_MODULUS
+        else:
+            # Cellules tête - count + 1 .. tête
+            self.power = self.power * step_inverse % HASH_MODULUS
+            self.inverse_power = self.inverse_power * step % HASH_MODULUS
+            changed = self.power * HASH_BASE % HASH_MODULUS * geometric
+        self.fingerprint = (self.fingerprint + (write - symbol) * changed) % HASH_MODULUS
+
+    def display(self, translation: Dict[int, str]) -> Tuple[str, int]:
+        """
+        Contenu sans les blancs aux extrémités et position de la tête
+        relative à son premier caractère (ruban vide: un blanc sous la tête)
+
+        Args:
+            translation: code interné -> symbole (CompiledProgram.translation)
+        """
+        return display_cells(self.buffer[self.start:self.end], self.index - self.start, translation)
+
+    def snapshot(self) -> Tuple[bytes, int]:
+        """Cellules écrites et indice de la tête dans celles-ci (image de trace)"""
+        return bytes(self.buffer[self.start:self.end]), self.index - self.start
+
+    def to_string(self, translation: Dict[int, str]) -> str:
+        """Convertir le ruban en chaîne (blancs aux extrémités retirés)"""
+        return self.display(translation)[0]
 
 
 class TuringMachine:
@@ -68,6 +396,11 @@ class TuringMachine:
     - Détection de boucles infinies (configuration répétée)
     - Exécution step-by-step avec historique complet
     - Gestion automatique de l'extension des rubans
+    - Table de transitions compilée en entiers (boucle d'exécution sans
+      construction de clés ni de chaînes)
+    - Macro-pas: une règle (q, a) → (q, b, D) est appliquée d'un bloc sur
+      toute la plage de a sous la tête (exécution sans historique, avec ou
+      sans détection exacte des boucles)
     """
     
     def __init__(
@@ -79,7 +412,11 @@ class TuringMachine:
         transitions: List[Dict[str, Any]] = None,
         head_positions: List[int] = None,
         detect_loops: bool = True,
-        max_tape_size: int = 10000
+        max_tape_size: int = 10000,
+        loop_detection: str = "exact",
+        loop_memory: int = DEFAULT_LOOP_MEMORY,
+        keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL,
+        accelerate: bool = True
     ):
         """
         Initialiser la machine de Turing
@@ -93,21 +430,31 @@ class TuringMachine:
             head_positions: Positions initiales des têtes (une par ruban)
             detect_loops: Activer la détection de boucles infinies
             max_tape_size: Taille maximale d'un ruban (sécurité)
+            loop_detection: 'exact' (toutes les configurations, boucle signalée
+                dès la première répétition) ou 'bounded' (mémoire bornée,
+                boucle signalée avec un retard d'au plus quelques cycles)
+            loop_memory: Capacité de la table d'empreintes du mode 'bounded'
+                (0 = algorithme de Brent seul)
+            keyframe_interval: Étapes entre deux images complètes des rubans
+                dans l'historique (deltas entre les deux)
+            accelerate: Macro-pas sur les balayages (mono-ruban, sans
+                historique, détection 'exact' ou aucune); résultats identiques
         """
+        # Arguments conservés pour rejouer l'exécution depuis le début
+        self._arguments = dict(
+            tapes=tapes, blank_symbol=blank_symbol, initial_state=initial_state,
+            final_states=final_states, transitions=transitions,
+            head_positions=head_positions, max_tape_size=max_tape_size
+        )
+
         # Configuration de base
         self.num_tapes = len(tapes)
         self.blank = blank_symbol
         self.initial_state = initial_state
-        self.state = initial_state
         self.final_states = final_states or []
         self.detect_loops = detect_loops
         self.max_tape_size = max_tape_size
-        
-        # Initialiser les rubans
-        self.tapes = [
-            TapeState(list(tape), pos if head_positions else 0)
-            for tape, pos in zip(tapes, head_positions or [0] * len(tapes))
-        ]
+        self.accelerate = accelerate
         
         # Construire la table de transitions
         # Format: (state, symbols...) -> (new_state, write_symbols..., directions...)
@@ -140,31 +487,417 @@ class TuringMachine:
                 )
             
             self.transitions[key] = value
+
+        # Compilation: états et symboles internés, table dense d'entiers
+        self.program = CompiledProgram(
+            self.num_tapes, blank_symbol, initial_state, self.final_states, self.transitions, tapes
+        )
+        self.state_id = self.program.state_index[initial_state]
+
+        # Initialiser les rubans
+        symbol_index = self.program.symbol_index
+        self.tapes = [
+            TapeState(bytes(symbol_index[symbol] for symbol in tape), pos if head_positions else 0)
+            for tape, pos in zip(tapes, head_positions or [0] * len(tapes))
+        ]
         
-        # Historique et détection de boucles
-        self.steps: List[Dict[str, Any]] = []
-        self.configurations: Set[str] = set()
+        # Historique compact: deltas par étape et images périodiques
+        self.trace = ExecutionTrace(self.num_tapes, keyframe_interval)
+        self._steps: List[Dict[str, Any]] = []
+        self.step_count = 0
+        # Détection de boucles sur les empreintes de configuration
+        self.detector = create_loop_detector(loop_detection, loop_memory) if detect_loops else None
+        # Maintenir les empreintes même sans détection (machines de rejeu)
+        self.fingerprinting = detect_loops
+        self.loop_start: Optional[int] = None
+        self.loop_length: Optional[int] = None
         self.loop_detected = False
+        # Macro-pas effectués pendant la détection (répétitions non observées)
+        self._swept = False
         self.halted = False
         self.halt_reason = None
+
+    @property
+    def state(self) -> str:
+        """Nom de l'état courant"""
+        return self.program.states[self.state_id]
+
+    @property
+    def steps(self) -> List[Dict[str, Any]]:
+        """Historique détaillé, reconstruit depuis la trace à la première lecture"""
+        if len(self._steps) < len(self.trace):
+            self._steps.extend(self.step_details(range(len(self._steps), len(self.trace))))
+        return self._steps
+
+    def step_details(self, steps: Iterable[int]) -> List[Dict[str, Any]]:
+        """Étapes demandées (croissantes) reconstruites depuis la trace"""
+        program = self.program
+        return [
+            {
+                'step_number': step,
+                'current_state': program.states[state],
+                'tape_contents': [content for content, _ in displays],
+                'head_positions': [head for _, head in displays],
+                'symbols_read': [program.symbols[symbol] for symbol in reads],
+                'action_taken': program.describe(outcome, state, reads)
+            }
+            for step, state, outcome, reads, displays in self.trace.frames(program.translation, steps)
+        ]
+
+    def sampled_steps(self, every: Optional[int] = None, frames: int = DEFAULT_SAMPLE_FRAMES) -> List[Dict[str, Any]]:
+        """Une étape sur every, ou frames étapes régulièrement espacées (première et dernière incluses)"""
+        total = len(self.trace)
+        if every is not None:
+            return self.step_details(range(0, total, every))
+        if total <= frames:
+            return self.step_details(range(total))
+        return self.step_details(sorted({round(i * (total - 1) / (frames - 1)) for i in range(frames)}))
+
+    def current_step(self, action: Optional[str] = None) -> Dict[str, Any]:
+        """Configuration courante au format d'une étape (numérotée step_count)"""
+        displays = self.tape_displays()
+        return {
+            'step_number': self.step_count,
+            'current_state': self.state,
+            'tape_contents': [content for content, _ in displays],
+            'head_positions': [head for _, head in displays],
+            'symbols_read': [self.program.symbols[tape.get_symbol()] for tape in self.tapes],
+            'action_taken': action
+        }
+
+    def tape_displays(self) -> List[Tuple[str, int]]:
+        return [tape.display(self.program.translation) for tape in self.tapes]
     
-    def get_configuration_hash(self) -> str:
+    def get_configuration_hash(self) -> Tuple[int, ...]:
         """
-        Obtenir un hash de la configuration actuelle
-        Utilisé pour détecter les boucles infinies
+        Obtenir un hash de la configuration actuelle (O(1))
+        Utilisé pour détecter les boucles infinies: état et empreinte de
+        chaque ruban relative à sa tête
         """
-        tape_strings = [tape.to_string(self.blank) for tape in self.tapes]
-        head_positions = [tape.head_position for tape in self.tapes]
-        
-        config = f"{self.state}|{'|'.join(tape_strings)}|{','.join(map(str, head_positions))}"
-        return config
+        return (self.state_id, *(tape.relative_fingerprint() for tape in self.tapes))
+
+    def configuration(self) -> Tuple:
+        """Configuration complète (état, contenus et têtes), comparée en cas de collision"""
+        return (self.state_id, tuple(self.tape_displays()))
     
     def check_tape_size_limit(self) -> bool:
         """Vérifier si un ruban dépasse la taille maximale"""
         for tape in self.tapes:
-            if len(tape.content) > self.max_tape_size:
+            if tape.size > self.max_tape_size:
+                return True
+        return False
+
+    def _configuration_seen(self) -> bool:
+        """Configuration déjà rencontrée? (candidats du détecteur confirmés)"""
+        candidates = self.detector.observe(self.get_configuration_hash(), self.step_count)
+        return bool(candidates) and self._confirm_repeat(candidates)
+
+    def _replica(self, steps: int = 0) -> 'TuringMachine':
+        """Nouvelle machine rejouée depuis la configuration initiale jusqu'à l'étape steps"""
+        machine = TuringMachine(**self._arguments, detect_loops=False)
+        machine.fingerprinting = True
+        machine._execute(steps, record=False)
+        return machine
+
+    @staticmethod
+    def _same_configuration(a: 'TuringMachine', b: 'TuringMachine') -> bool:
+        return a.get_configuration_hash() == b.get_configuration_hash() and a.configuration() == b.configuration()
+
+    def _confirm_repeat(self, candidates: List[int]) -> bool:
+        """
+        Une empreinte connue est confirmée en rejouant l'exécution jusqu'aux
+        étapes candidates (croissantes) puis en comparant les configurations
+        complètes (collision d'empreintes sinon). Début et longueur du cycle
+        sont alors enregistrés; après des macro-pas, la répétition observée
+        n'est pas forcément la première: le cycle est recalculé par rejeu.
+        """
+        configuration = self.configuration()
+        machine = self._replica()
+        for step in candidates:
+            machine._execute(step - machine.step_count, record=False)
+            if machine.configuration() == configuration:
+                if self.detector.first_repeat and not self._swept:
+                    self.loop_start, self.loop_length = step, self.step_count - step
+                else:
+                    self.loop_length = self._cycle_length(machine, self.step_count - step)
+                    self.loop_start = self._cycle_start(step, self.loop_length)
                 return True
         return False
+
+    def _rewind(self, steps: int):
+        """Revenir à l'étape steps (rejeu depuis la configuration initiale)"""
+        replica = self._replica(steps)
+        self.tapes, self.state_id, self.step_count = replica.tapes, replica.state_id, steps
+
+    def _unobserved_repeat(self) -> bool:
+        """
+        Exécution interrompue (budget ou taille du ruban) après des macro-pas:
+        le pas à pas a-t-il signalé une boucle avant l'étape courante?
+
+        Sa première répétition c(μ + λ) est toujours observée; si c(μ) était
+        dans une plage sautée, la plage de la même règle qui suit c(μ + λ)
+        finit sur une configuration déjà observée. Il suffit donc de tester
+        la configuration courante puis, au milieu d'une plage, sa fin. En cas
+        de boucle, la machine revient à l'étape μ + λ.
+        """
+        steps = self.step_count
+        tape = self.tapes[0]
+        candidates = self.detector.lookup(self.get_configuration_hash())
+        if not candidates or not self._confirm_repeat(candidates):
+            symbol = tape.get_symbol()
+            transition = self.program.table[self.state_id * self.program.radix + symbol]
+            if transition is None or transition[0] != self.state_id or transition[2] == 0:
+                return False
+            _, write, move, _ = transition
+            end = copy.copy(tape)
+            end.buffer = bytearray(tape.buffer)
+            count = end.sweep(symbol, write, move, len(end.buffer) + 1, len(end.buffer) + 1, complete=True)
+            if not count or end.get_symbol() == symbol:
+                # Plage de blancs sans fin: configurations toutes distinctes
+                return False
+            self.tapes, self.step_count = [end], steps + count
+            candidates = self.detector.lookup(self.get_configuration_hash())
+            found = bool(candidates) and self._confirm_repeat(candidates)
+            self.tapes, self.step_count = [tape], steps
+            if not found:
+                return False
+        if self.loop_start + self.loop_length >= steps:
+            self.loop_start = self.loop_length = None
+            return False
+        self._rewind(self.loop_start + self.loop_length)
+        return True
+
+    def _cycle_length(self, machine: 'TuringMachine', period: int) -> int:
+        """Plus petite période du cycle: le plus petit diviseur d de period ramenant la configuration"""
+        reference = self._replica(machine.step_count)
+        for d in divisors(period):
+            machine._execute(reference.step_count + d - machine.step_count, record=False)
+            if d == period or self._same_configuration(machine, reference):
+                return d
+        return period
+
+    def _cycle_start(self, repeat: int, length: int) -> int:
+        """
+        Première étape μ du cycle: c(i) = c(i + λ) pour tout i ≥ μ seulement;
+        test par blocs de LOOP_SEARCH_CHUNK étapes puis affinage dans le bloc
+        (μ ≤ repeat, étape déjà connue dans le cycle)
+        """
+        follower, leader = self._replica(), self._replica(length)
+        previous = 0
+        while not self._same_configuration(follower, leader):
+            previous = follower.step_count
+            chunk = min(LOOP_SEARCH_CHUNK, repeat - previous)
+            follower._execute(chunk, record=False)
+            leader._execute(chunk, record=False)
+        if follower.step_count == previous:
+            return previous
+
+        follower, leader = self._replica(previous), self._replica(previous + length)
+        while not self._same_configuration(follower, leader):
+            follower._execute(1, record=False)
+            leader._execute(1, record=False)
+        return follower.step_count
+
+    def _halt(self, outcome: int) -> str:
+        self.halted = True
+        self.loop_detected = outcome == LOOP
+        self.halt_reason, message = HALT_REASONS[outcome]
+        return message
+
+    def _halt_tape_limit(self) -> str:
+        self.halted = True
+        self.halt_reason = f"Tape size limit exceeded ({self.max_tape_size})"
+        return self.halt_reason
+
+    def _execute(self, limit: int, record: bool) -> Optional[str]:
+        """
+        Exécuter au plus limit étapes
+
+        Returns:
+            message d'arrêt, ou None si la limite est atteinte sans arrêt
+        """
+        if self.num_tapes == 1:
+            return self._execute_single(limit, record)
+        return self._execute_multi(limit, record)
+
+    def _execute_single(self, limit: int, record: bool) -> Optional[str]:
+        """Boucle mono-ruban: indices du tampon et état en variables locales"""
+        program = self.program
+        table, radix, final = program.table, program.radix, program.final
+        tape = self.tapes[0]
+        buffer = tape.buffer
+        capacity = len(buffer)
+        index, start, end = tape.index, tape.start, tape.end
+        state = self.state_id
+        max_size = self.max_tape_size
+        detector = self.detector
+        detect = detector is not None
+        hashing = self.fingerprinting
+        trace = self.trace
+        steps = self.step_count
+        if hashing:
+            tape.relative_fingerprint()
+            fingerprint, power, inverse_power = tape.fingerprint, tape.power, tape.inverse_power
+        else:
+            tape.fingerprint = None
+        # Macro-pas sans historique; avec détection, seulement pour le
+        # détecteur exact (cycle recalculé par rejeu, voir _confirm_repeat)
+        accelerate = self.accelerate and not record and (not detect or detector.first_repeat)
+        # Balayage refusé (plage incomplète): pas à pas jusqu'à la fin de la plage
+        blocked = False
+        stop = steps + limit
+        message = None
+        overflow = False
+
+        while steps < stop:
+            if end - start > max_size:
+                message = self._halt_tape_limit()
+                overflow = True
+                break
+
+            symbol = buffer[index]
+            current = state
+            if record and trace.keyframe_due:
+                tape.index, tape.start, tape.end = index, start, end
+                trace.keyframe([tape.snapshot()])
+
+            outcome = None
+            if final[state]:
+                outcome = ACCEPTED
+            elif detect:
+                candidates = detector.observe((state, fingerprint * inverse_power % HASH_MODULUS), steps)
+                if candidates:
+                    # Empreinte connue: synchroniser puis comparer les configurations complètes
+                    tape.index, tape.start, tape.end = index, start, end
+                    tape.fingerprint, tape.power, tape.inverse_power = fingerprint, power, inverse_power
+                    self.state_id = state
+                    self.step_count = steps
+                    if self._confirm_repeat(candidates):
+                        outcome = LOOP
+                        if self.loop_start + self.loop_length < steps:
+                            # Première répétition dans une plage de macro-pas: reprendre
+                            # la configuration où le pas à pas s'arrête
+                            self._rewind(self.loop_start + self.loop_length)
+                            state, steps = self.state_id, self.step_count
+                            tape = self.tapes[0]
+                            buffer = tape.buffer
+                            index, start, end = tape.index, tape.start, tape.end
+                            fingerprint, power, inverse_power = tape.fingerprint, tape.power, tape.inverse_power
+
+            if outcome is None:
+                transition = table[state * radix + symbol]
+                if transition is None:
+                    outcome = NO_TRANSITION
+                else:
+                    state, write, move, outcome = transition
+                    if hashing:
+                        # Mise à jour incrémentale de l'empreinte
+                        if write != symbol:
+                            fingerprint = (fingerprint + (write - symbol) * power) % HASH_MODULUS
+                        if move > 0:
+                            power = power * HASH_BASE % HASH_MODULUS
+                            inverse_power = inverse_power * HASH_BASE_INVERSE % HASH_MODULUS
+                        elif move < 0:
+                            power = power * HASH_BASE_INVERSE % HASH_MODULUS
+                            inverse_power = inverse_power * HASH_BASE % HASH_MODULUS
+                    buffer[index] = write
+                    if index < start:
+                        start = index
+                    elif index >= end:
+                        end = index + 1
+                    index += move
+                    if index < 0 or index >= capacity:
+                        shift = tape.grow(index)
+                        index += shift
+                        start += shift
+                        end += shift
+                        capacity = len(buffer)
+                    if accelerate and state == current and buffer[index] == symbol:
+                        if not blocked:
+                            # Balayage: même règle tant que la tête lit symbol
+                            tape.index, tape.start, tape.end = index, start, end
+                            if hashing:
+                                tape.fingerprint, tape.power, tape.inverse_power = fingerprint, power, inverse_power
+                            swept = tape.sweep(symbol, write, move, stop - steps - 1, max_size, complete=detect)
+                            index, start, end = tape.index, tape.start, tape.end
+                            capacity = len(buffer)
+                            if hashing:
+                                fingerprint, power, inverse_power = tape.fingerprint, tape.power, tape.inverse_power
+                            steps += swept
+                            if detect:
+                                blocked = not swept
+                                self._swept = self._swept or swept > 0
+                    else:
+                        blocked = False
+
+            steps += 1
+            if record:
+                if outcome >= 0:
+                    trace.append(current, outcome, (write,), (move,))
+                else:
+                    trace.append(current, outcome, (symbol,), (0,))
+            if outcome < 0:
+                message = self._halt(outcome)
+                break
+
+        tape.index, tape.start, tape.end = index, start, end
+        if hashing:
+            tape.fingerprint, tape.power, tape.inverse_power = fingerprint, power, inverse_power
+        else:
+            # Empreinte non maintenue par cette boucle
+            tape.fingerprint = None
+        self.state_id = state
+        self.step_count = steps
+        if detect and self._swept and (message is None or overflow) and self._unobserved_repeat():
+            self.step_count += 1
+            message = self._halt(LOOP)
+        return message
+
+    def _execute_multi(self, limit: int, record: bool) -> Optional[str]:
+        """Boucle multi-rubans: code des symboles lus calculé en base len(symbols)"""
+        program = self.program
+        table, radix, final, base = program.table, program.radix, program.final, program.base
+        tapes = self.tapes
+        message = None
+
+        for _ in range(limit):
+            if self.check_tape_size_limit():
+                message = self._halt_tape_limit()
+                break
+
+            reads = tuple(tape.get_symbol() for tape in tapes)
+            if record and self.trace.keyframe_due:
+                self.trace.keyframe([tape.snapshot() for tape in tapes])
+
+            state = self.state_id
+            if final[state]:
+                outcome = ACCEPTED
+            elif self.detector is not None and self._configuration_seen():
+                outcome = LOOP
+            else:
+                code = 0
+                for symbol in reversed(reads):
+                    code = code * base + symbol
+                transition = table[state * radix + code]
+                if transition is None:
+                    outcome = NO_TRANSITION
+                else:
+                    self.state_id, writes, moves, outcome = transition
+                    for tape, write, move in zip(tapes, writes, moves):
+                        tape.write_symbol(write)
+                        tape.move_head(move)
+
+            self.step_count += 1
+            if record:
+                if outcome >= 0:
+                    self.trace.append(state, outcome, writes, moves)
+                else:
+                    self.trace.append(state, outcome, reads, (0,) * self.num_tapes)
+            if outcome < 0:
+                message = self._halt(outcome)
+                break
+
+        return message
     
     def step(self) -> Tuple[bool, Optional[str]]:
         """
@@ -173,123 +906,55 @@ class TuringMachine:
         Returns:
             (can_continue, message): Peut continuer?, message de statut
         """
-        # Vérification de sécurité
-        if self.check_tape_size_limit():
-            self.halted = True
-            self.halt_reason = f"Tape size limit exceeded ({self.max_tape_size})"
-            return False, self.halt_reason
-        
-        # Lire les symboles actuels
-        current_symbols = [tape.get_symbol() for tape in self.tapes]
-        
-        # Enregistrer l'état avant transition
-        step_info = {
-            'step_number': len(self.steps),
-            'current_state': self.state,
-            'tape_contents': [tape.to_string(self.blank) for tape in self.tapes],
-            'head_positions': [tape.head_position for tape in self.tapes],
-            'symbols_read': current_symbols,
-            'action_taken': None
-        }
-        
-        # Vérifier si on est dans un état final
-        if self.state in self.final_states:
-            step_info['action_taken'] = f"✓ Accepté dans l'état {self.state}"
-            self.steps.append(step_info)
-            self.halted = True
-            self.halt_reason = "Accepted"
-            return False, "Accepted"
-        
-        # Détecter les boucles infinies
-        if self.detect_loops:
-            config_hash = self.get_configuration_hash()
-            if config_hash in self.configurations:
-                step_info['action_taken'] = "⚠ Boucle infinie détectée (configuration répétée)"
-                self.steps.append(step_info)
-                self.loop_detected = True
-                self.halted = True
-                self.halt_reason = "Infinite loop detected"
-                return False, "Infinite loop detected"
-            self.configurations.add(config_hash)
-        
-        # Chercher la transition applicable
-        if self.num_tapes == 1:
-            key = (self.state, current_symbols[0])
-        else:
-            key = tuple([self.state] + current_symbols)
-        
-        if key not in self.transitions:
-            step_info['action_taken'] = f"✗ Aucune transition pour ({self.state}, {current_symbols})"
-            self.steps.append(step_info)
-            self.halted = True
-            self.halt_reason = "No transition"
-            return False, "Rejected (no transition)"
-        
-        # Récupérer et exécuter la transition
-        if self.num_tapes == 1:
-            next_state, write_symbol, direction = self.transitions[key]
-            
-            # Écrire et déplacer
-            self.tapes[0].write_symbol(write_symbol)
-            self.tapes[0].move_head(direction)
-            
-            action = f"Écrire '{write_symbol}', mouvement {direction}, état → {next_state}"
-        else:
-            next_state, write_symbols, directions = self.transitions[key]
-            
-            # Écrire et déplacer sur chaque ruban
-            for tape, symbol, direction in zip(self.tapes, write_symbols, directions):
-                tape.write_symbol(symbol)
-                tape.move_head(direction)
-            
-            writes = ', '.join(f"R{i}:'{s}'" for i, s in enumerate(write_symbols))
-            moves = ', '.join(f"R{i}:{d}" for i, d in enumerate(directions))
-            action = f"Écrire [{writes}], mouvements [{moves}], état → {next_state}"
-        
-        # Changer d'état
-        self.state = next_state
-        step_info['action_taken'] = action
-        self.steps.append(step_info)
-        
-        return True, None
+        message = self._execute(1, record=True)
+        return message is None, message
     
-    def run(self, max_steps: int = 1000) -> Dict[str, Any]:
+    def run(self, max_steps: int = 1000, record: bool = True) -> Dict[str, Any]:
         """
         Exécuter la machine jusqu'à l'arrêt ou max_steps
+
+        Args:
+            record: conserver l'historique des étapes (sinon seuls l'état
+                final et le nombre d'étapes sont calculés)
         
         Returns:
             Dictionnaire avec les résultats de l'exécution
         """
+        result = self._run(max_steps, record)
+        result['execution_steps'] = self.steps
+        return result
+
+    def _run(self, max_steps: int, record: bool) -> Dict[str, Any]:
+        """Résultats de l'exécution, sans les étapes détaillées"""
         start_time = time.time()
-        
-        for step_count in range(max_steps):
-            can_continue, message = self.step()
-            if not can_continue:
-                break
-        else:
+        message = self._execute(max_steps, record)
+        return self._result(message, max_steps, time.time() - start_time)
+
+    def _result(self, message: Optional[str], max_steps: int, execution_time: float) -> Dict[str, Any]:
+        """Résultats après exécution (message None: max_steps atteint sans arrêt)"""
+        if message is None:
             # Atteint max_steps sans s'arrêter
             self.halted = True
             self.halt_reason = f"Max steps limit ({max_steps})"
             message = f"Exécution arrêtée après {max_steps} étapes (limite)"
         
-        execution_time = time.time() - start_time
-        
         # Déterminer si accepté
-        accepted = self.state in self.final_states
+        accepted = self.program.final[self.state_id]
         
         # Résultats finaux des rubans
-        final_tapes = [tape.to_string(self.blank) for tape in self.tapes]
+        final_tapes = [tape.to_string(self.program.translation) for tape in self.tapes]
         
         return {
             'success': True,
             'accepted': accepted,
             'final_tapes': final_tapes,
             'final_state': self.state,
-            'execution_steps': self.steps,
-            'total_steps': len(self.steps),
+            'total_steps': self.step_count,
             'halted': self.halted,
             'halt_reason': self.halt_reason,
             'loop_detected': self.loop_detected,
+            'loop_start': self.loop_start,
+            'loop_length': self.loop_length,
             'execution_time': execution_time,
             'message': message or (
                 f"✓ Accepté dans l'état {self.state}" if accepted 
@@ -297,12 +962,76 @@ class TuringMachine:
             ),
             'num_tapes': self.num_tapes
         }
+
+    def run_batches(
+        self,
+        max_steps: int = 1000,
+        batch_size: int = 1000,
+        every: int = 1
+    ) -> Iterator[Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]]:
+        """
+        Exécuter par lots de batch_size étapes
+
+        Chaque lot est enregistré dans une trace neuve, puis ses étapes (une
+        sur every, numérotées depuis le début de l'exécution) sont produites:
+        la mémoire de l'historique est bornée par batch_size. Le lot suivant
+        n'est exécuté qu'à la demande du consommateur.
+
+        Yields:
+            (étapes du lot, None) puis, après le dernier lot, ([], résultats)
+        """
+        execution_time = 0.0
+        remaining = max_steps
+        message = None
+        while remaining > 0 and not self.halted:
+            offset = self.step_count
+            self.trace = ExecutionTrace(self.num_tapes, self.trace.interval)
+            self._steps = []
+            start_time = time.time()
+            message = self._execute(min(batch_size, remaining), True)
+            execution_time += time.time() - start_time
+            remaining -= len(self.trace)
+
+            steps = self.step_details(
+                step for step in range(len(self.trace)) if (offset + step) % every == 0
+            )
+            for step in steps:
+                step['step_number'] += offset
+            yield steps, None
+        yield [], self._result(message, max_steps, execution_time)
     
-    def run_with_animation_data(self, max_steps: int = 1000) -> Dict[str, Any]:
+    def run_with_animation_data(
+        self,
+        max_steps: int = 1000,
+        trace: str = "full",
+        sample_every: Optional[int] = None,
+        sample_frames: int = DEFAULT_SAMPLE_FRAMES
+    ) -> Dict[str, Any]:
         """
         Exécuter et retourner des données optimisées pour l'animation
+
+        Args:
+            trace: 'none' (résultat et nombre d'étapes), 'summary' (configurations
+                initiale et finale), 'sampled' (une étape sur sample_every, ou
+                sample_frames étapes régulièrement espacées) ou 'full'.
+                'none' et 'summary' n'enregistrent aucun historique.
         """
-        result = self.run(max_steps)
+        if trace not in TRACE_MODES:
+            raise ValueError(f"Niveau de trace inconnu: {trace} (attendu: {', '.join(TRACE_MODES)})")
+
+        initial = self.current_step() if trace == "summary" else None
+        result = self._run(max_steps, record=trace in ("sampled", "full"))
+
+        if trace == "none":
+            steps = []
+        elif trace == "summary":
+            steps = [initial, self.current_step(result['message'])]
+        elif trace == "sampled":
+            steps = self.sampled_steps(sample_every, sample_frames)
+        else:
+            steps = self.steps
+        result['execution_steps'] = steps
+        result['trace'] = trace
         
         # Ajouter des métadonnées pour l'animation
         result['animation_frames'] = [
@@ -313,7 +1042,7 @@ class TuringMachine:
                 'heads': step['head_positions'],
                 'action': step['action_taken']
             }
-            for step in self.steps
+            for step in steps
         ]
         
         return result
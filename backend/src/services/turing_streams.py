@@ -0,0 +1,145 @@
+"""
+Exécution en flux des machines de Turing (SSE)
+La machine avance par lots, un lot n'étant calculé qu'une fois le précédent
+transmis: un client lent ralentit donc l'exécution (contre-pression) et la
+mémoire d'une session est bornée par la taille d'un lot. Chaque session peut
+être mise en pause, reprise ou annulée entre deux lots.
+"""
+
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+import asyncio
+import secrets
+import time
+
+from src.services.turing_machine import TuringMachine
+
+# Intervalle entre deux événements de maintien pendant une pause (secondes)
+HEARTBEAT_INTERVAL = 15.0
+
+
+class StreamLimitExceeded(RuntimeError):
+    """Nombre maximal de sessions simultanées atteint"""
+
+
+class StreamSession:
+    """État de contrôle d'une exécution en flux (pause, reprise, annulation)"""
+
+    def __init__(self, session_id: str):
+        self.session_id = session_id
+        self.created = time.time()
+        self.cancelled = False
+        self.paused_since: Optional[float] = None
+        self._running = asyncio.Event()
+        self._running.set()
+
+    @property
+    def paused(self) -> bool:
+        return not self._running.is_set()
+
+    def pause(self):
+        if not self.paused and not self.cancelled:
+            self.paused_since = time.monotonic()
+            self._running.clear()
+
+    def resume(self):
+        self.paused_since = None
+        self._running.set()
+
+    def cancel(self):
+        self.cancelled = True
+        self.resume()
+
+    async def wait_resumed(self, timeout: float) -> bool:
+        """Attendre la reprise (ou l'annulation) au plus timeout secondes"""
+        try:
+            await asyncio.wait_for(self._running.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            'session_id': self.session_id,
+            'paused': self.paused,
+            'cancelled': self.cancelled
+        }
+
+
+class StreamRegistry:
+    """Sessions en cours, en nombre borné (identifiants aléatoires)"""
+
+    def __init__(self, max_sessions: int = 32):
+        self.max_sessions = max_sessions
+        self.sessions: Dict[str, StreamSession] = {}
+
+    def open(self) -> StreamSession:
+        if len(self.sessions) >= self.max_sessions:
+            raise StreamLimitExceeded(
+                f"Trop d'exécutions en flux simultanées (limite: {self.max_sessions})"
+            )
+        session = StreamSession(secrets.token_hex(8))
+        self.sessions[session.session_id] = session
+        return session
+
+    def get(self, session_id: str) -> StreamSession:
+        """Session en cours (KeyError si inconnue ou terminée)"""
+        return self.sessions[session_id]
+
+    def close(self, session_id: str):
+        self.sessions.pop(session_id, None)
+
+    def __len__(self) -> int:
+        return len(self.sessions)
+
+
+async def stream_execution(
+    machine: TuringMachine,
+    session: StreamSession,
+    max_steps: int,
+    batch_size: int = 500,
+    every: int = 1,
+    pause_timeout: float = 300.0
+) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Événements d'une exécution en flux
+
+    - `session`: identifiant à utiliser pour les commandes de contrôle
+    - `steps`: étapes d'un lot (une sur every) et nombre total d'étapes
+    - `paused` / `resumed`: pause prise en compte entre deux lots, reprise
+    - `heartbeat`: maintien de la connexion pendant une pause
+    - `result`: résultats finaux (mêmes champs que /turing/simulate, sans étapes)
+    - `cancelled`: annulation par le client ou pause plus longue que pause_timeout
+
+    Chaque lot est calculé hors de la boucle d'événements; le suivant ne l'est
+    qu'après consommation de l'événement précédent.
+    """
+    yield 'session', {**session.status(), 'num_tapes': machine.num_tapes}
+
+    batches = machine.run_batches(max_steps, batch_size, every)
+    while True:
+        if session.paused:
+            yield 'paused', {'total_steps': machine.step_count}
+            while session.paused:
+                remaining = session.paused_since + pause_timeout - time.monotonic()
+                if remaining <= 0:
+                    session.cancel()
+                    yield 'cancelled', {
+                        'total_steps': machine.step_count,
+                        'reason': f"Pause de plus de {pause_timeout:g} s"
+                    }
+                    return
+                if not await session.wait_resumed(min(HEARTBEAT_INTERVAL, remaining)) and \
+                        time.monotonic() - session.paused_since < pause_timeout:
+                    yield 'heartbeat', {'total_steps': machine.step_count}
+            if not session.cancelled:
+                yield 'resumed', {'total_steps': machine.step_count}
+
+        if session.cancelled:
+            yield 'cancelled', {'total_steps': machine.step_count, 'reason': "Annulée par le client"}
+            return
+
+        steps, result = await asyncio.to_thread(next, batches)
+        if result is not None:
+            yield 'result', result
+            return
+        yield 'steps', {'steps': steps, 'total_steps': machine.step_count}
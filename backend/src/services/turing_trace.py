@@ -0,0 +1,140 @@
+"""
+Historique compact d'une exécution de machine de Turing
+Par étape: état, issue (règle appliquée ou arrêt), symbole écrit et déplacement
+de chaque tête dans des tableaux parallèles; une image complète des rubans
+(keyframe) toutes les interval étapes. La configuration de n'importe quelle
+étape est reconstruite à la demande en rejouant au plus interval deltas.
+"""
+
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+# Étapes entre deux images complètes des rubans
+DEFAULT_KEYFRAME_INTERVAL = 256
+
+
+def display_cells(cells: bytes, head: int, translation: Dict[int, str]) -> Tuple[str, int]:
+    """
+    Contenu sans les blancs aux extrémités et position de la tête relative à
+    son premier caractère (ruban vide: un blanc sous la tête)
+
+    Args:
+        cells: cellules (codes internés, 0 = blanc)
+        head: indice de la tête dans cells (éventuellement hors bornes)
+        translation: code interné -> symbole
+    """
+    trimmed = cells.lstrip(b'\x00')
+    if not trimmed:
+        return translation[0], 0
+    first = len(cells) - len(trimmed)
+    return trimmed.rstrip(b'\x00').decode('latin-1').translate(translation), head - first
+
+
+class ExecutionTrace:
+    """
+    Deltas par étape et images périodiques
+
+    L'étape i décrit la configuration avant sa transition: état states[i],
+    issue outcomes[i] (index de règle, ou code d'arrêt négatif) puis, pour
+    chaque ruban t, écriture writes[t][i] sous la tête et déplacement
+    moves[t][i]. keyframes[k] contient les rubans avant l'étape k × interval.
+    """
+
+    def __init__(self, num_tapes: int, interval: int = DEFAULT_KEYFRAME_INTERVAL):
+        if interval < 1:
+            raise ValueError("L'intervalle entre images complètes doit être >= 1")
+        self.num_tapes = num_tapes
+        self.interval = interval
+        self.states = array('I')
+        self.outcomes = array('i')
+        self.writes = [bytearray() for _ in range(num_tapes)]
+        self.moves = [array('b') for _ in range(num_tapes)]
+        # (cellules écrites, indice de la tête dans ces cellules) par ruban
+        self.keyframes: List[List[Tuple[bytes, int]]] = []
+
+    def __len__(self) -> int:
+        return len(self.states)
+
+    @property
+    def keyframe_due(self) -> bool:
+        return len(self.states) % self.interval == 0
+
+    def keyframe(self, tapes: Sequence[Tuple[bytes, int]]):
+        """Image complète des rubans avant la prochaine étape"""
+        self.keyframes.append([(bytes(cells), head) for cells, head in tapes])
+
+    def append(self, state: int, outcome: int, writes: Sequence[int], moves: Sequence[int]):
+        self.states.append(state)
+        self.outcomes.append(outcome)
+        for tape_writes, tape_moves, write, move in zip(self.writes, self.moves, writes, moves):
+            tape_writes.append(write)
+            tape_moves.append(move)
+
+    @property
+    def nbytes(self) -> int:
+        """Mémoire occupée par les tableaux et les images"""
+        deltas = sum(len(w) + m.itemsize * len(m) for w, m in zip(self.writes, self.moves))
+        frames = sum(len(cells) for keyframe in self.keyframes for cells, _ in keyframe)
+        return self.states.itemsize * len(self.states) + self.outcomes.itemsize * len(self.outcomes) + deltas + frames
+
+    def replay(self, start: int = 0, stop: Optional[int] = None
+               ) -> Iterator[Tuple[int, List[bytearray], List[int]]]:
+        """
+        Reconstruire les configurations des étapes start..stop-1
+
+        Yields:
+            (étape, cellules de chaque ruban, indice de chaque tête); les
+            tampons sont réutilisés d'une étape à l'autre (à copier si conservés)
+        """
+        stop = len(self) if stop is None else min(stop, len(self))
+        step = start - start % self.interval
+        buffers: List[bytearray] = []
+        heads: List[int] = []
+        while step < stop:
+            if step % self.interval == 0:
+                # Marge d'au plus interval cellules: aucune extension avant l'image suivante
+                # (plus la distance de la tête aux cellules, possible avant la première écriture)
+                pad = min(self.interval, len(self) - step) + 1
+                keyframe = self.keyframes[step // self.interval]
+                buffers = [
+                    bytearray(pad + max(0, -head)) + cells + bytearray(pad + max(0, head - len(cells)))
+                    for cells, head in keyframe
+                ]
+                heads = [pad + max(0, -head) + head for _, head in keyframe]
+            if step >= start:
+                yield step, buffers, heads
+            if self.outcomes[step] >= 0:
+                for t in range(self.num_tapes):
+                    buffers[t][heads[t]] = self.writes[t][step]
+                    heads[t] += self.moves[t][step]
+            step += 1
+
+    def frames(self, translation: Dict[int, str], steps: Iterable[int]
+               ) -> Iterator[Tuple[int, int, int, Tuple[int, ...], List[Tuple[str, int]]]]:
+        """
+        Étapes reconstruites pour l'affichage (steps croissantes)
+
+        Une étape du même intervalle que la précédente prolonge le rejeu en
+        cours; sinon le rejeu repart de l'image de son intervalle.
+
+        Yields:
+            (étape, état, issue, symboles lus, [(contenu, tête)] par ruban)
+        """
+        replay, position = None, None
+        for target in steps:
+            if not 0 <= target < len(self):
+                raise IndexError(f"Étape hors de la trace: {target}")
+            if replay is None or target <= position or target // self.interval != position // self.interval:
+                replay = self.replay(target)
+            for step, buffers, heads in replay:
+                if step == target:
+                    break
+            position = target
+            reads = tuple(buffer[head] for buffer, head in zip(buffers, heads))
+            displays = [display_cells(buffer, head, translation) for buffer, head in zip(buffers, heads)]
+            yield target, self.states[target], self.outcomes[target], reads, displays
+
+    def configuration_at(self, step: int, translation: Dict[int, str]) -> Tuple[int, List[Tuple[str, int]]]:
+        """(état, [(contenu, tête)] par ruban) avant l'étape step"""
+        _, state, _, _, displays = next(self.frames(translation, [step]))
+        return state, displays
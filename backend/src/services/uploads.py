@@ -0,0 +1,499 @@
+"""
+Import de matrices depuis des fichiers (CSV, MatrixMarket, .npy)
+Les lecteurs sont incrémentaux: chaque morceau reçu est analysé puis écrit
+directement dans un tableau préalloué en mémoire projetée (memmap .npy), sans
+jamais conserver le fichier complet en mémoire. Les matrices importées sont
+ensuite référencées par leur identifiant (upload_id) dans MatrixInput.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Optional, Tuple
+import ast
+import hashlib
+import io
+import os
+import secrets
+import tempfile
+import time
+import numpy as np
+
+from src.config import settings
+
+UPLOAD_FORMATS = ("csv", "mtx", "npy")
+
+_EXTENSIONS = {".csv": "csv", ".txt": "csv", ".mtx": "mtx", ".mm": "mtx", ".npy": "npy"}
+
+# Taille des blocs de lignes recopiés d'un memmap à l'autre (redimensionnement CSV)
+COPY_BLOCK_BYTES = 8 << 20
+
+
+class UploadError(ValueError):
+    """Fichier invalide ou dépassant les limites"""
+
+
+class UploadTooLarge(UploadError):
+    """Limite de taille dépassée pendant la réception"""
+
+
+class UploadNotFound(UploadError):
+    """Import inconnu ou expiré"""
+
+
+def infer_format(filename: Optional[str]) -> Optional[str]:
+    """Format d'après l'extension du nom de fichier"""
+    if not filename:
+        return None
+    return _EXTENSIONS.get(os.path.splitext(filename)[1].lower())
+
+
+class _MatrixReader(ABC):
+    """
+    Lecteur incrémental: feed(morceau) puis finish() → chemin du .npy écrit
+
+    La matrice est écrite dans un memmap .npy (open_memmap) dont la taille est
+    connue dès l'en-tête (MatrixMarket, npy) ou dès la première ligne (CSV).
+    """
+
+    def __init__(self, path: str, max_dimension: int):
+        self.path = path
+        self.max_dimension = max_dimension
+        self.out: Optional[np.memmap] = None
+
+    def _allocate(self, rows: int, cols: int, fortran_order: bool = False) -> np.memmap:
+        if rows < 1 or cols < 1:
+            raise UploadError(f"Dimensions invalides: {rows}×{cols}")
+        if max(rows, cols) > self.max_dimension:
+            raise UploadTooLarge(f"Taille maximale: {self.max_dimension} (fichier: {rows}×{cols})")
+        self.out = np.lib.format.open_memmap(
+            self.path, mode="w+", dtype=np.float64, shape=(rows, cols), fortran_order=fortran_order
+        )
+        return self.out
+
+    @abstractmethod
+    def feed(self, chunk: bytes):
+        """Analyser un morceau reçu et écrire ses valeurs dans le memmap"""
+
+    @abstractmethod
+    def finish(self) -> Tuple[int, int]:
+        """Terminer la lecture (fichier complet vérifié); renvoie les dimensions"""
+
+    def close(self):
+        if self.out is not None:
+            self.out.flush()
+            del self.out
+            self.out = None
+
+
+class _LineReader(_MatrixReader):
+    """Base des formats texte: découpe en lignes complètes, analysées par lots"""
+
+    def __init__(self, path: str, max_dimension: int):
+        super().__init__(path, max_dimension)
+        self._pending = b""
+
+    def feed(self, chunk: bytes):
+        data = self._pending + chunk
+        cut = data.rfind(b"\n")
+        if cut < 0:
+            self._pending = data
+            return
+        self._pending = data[cut + 1:]
+        self._lines(data[:cut + 1])
+
+    def _flush(self):
+        if self._pending.strip():
+            self._lines(self._pending + b"\n")
+        self._pending = b""
+
+    @abstractmethod
+    def _lines(self, block: bytes):
+        """Analyser un bloc de lignes complètes"""
+
+
+class CsvReader(_LineReader):
+    """
+    CSV numérique (séparateur ',' ';' ou tabulation, lignes vides ignorées)
+
+    Le nombre de lignes n'est pas connu à l'avance: le tableau est préalloué
+    carré (cas des systèmes n×n) puis agrandi par doublement si nécessaire;
+    agrandissement et ajustement final recopient les lignes d'un memmap à
+    l'autre par blocs de COPY_BLOCK_BYTES, sans charger la matrice en mémoire.
+    """
+
+    def __init__(self, path: str, max_dimension: int):
+        super().__init__(path, max_dimension)
+        self.rows = 0
+        self.cols = 0
+        self.delimiter: Optional[str] = None
+
+    def _lines(self, block: bytes):
+        text = block.decode("utf-8-sig" if self.rows == 0 and self.out is None else "utf-8")
+        if self.delimiter is None:
+            first = next((line for line in text.splitlines() if line.strip()), None)
+            if first is None:
+                return
+            self.delimiter = next((d for d in (",", ";", "\t") if d in first), None)
+        try:
+            values = np.loadtxt(io.StringIO(text), delimiter=self.delimiter, ndmin=2, dtype=np.float64)
+        except ValueError as e:
+            raise UploadError(f"CSV invalide (ligne {self.rows + 1} et suivantes): {e}")
+        if values.size == 0:
+            return
+
+        if self.out is None:
+            self.cols = values.shape[1]
+            self._allocate(self.cols, self.cols)
+        elif values.shape[1] != self.cols:
+            raise UploadError(f"Toutes les lignes doivent avoir {self.cols} colonnes")
+
+        needed = self.rows + values.shape[0]
+        if needed > self.max_dimension:
+            raise UploadTooLarge(f"Taille maximale: {self.max_dimension} lignes")
+        if needed > self.out.shape[0]:
+            self._resize(min(max(needed, 2 * self.out.shape[0]), self.max_dimension))
+        self.out[self.rows:needed] = values
+        self.rows = needed
+
+    def _resize(self, capacity: int):
+        """Remplacer le .npy par un memmap de capacity lignes contenant les lignes lues"""
+        previous = self.out
+        self.out = None
+        resized_path = self.path + ".resize"
+        try:
+            resized = np.lib.format.open_memmap(
+                resized_path, mode="w+", dtype=np.float64, shape=(capacity, self.cols)
+            )
+            step = max(1, COPY_BLOCK_BYTES // (self.cols * resized.itemsize))
+            for start in range(0, self.rows, step):
+                stop = min(start + step, self.rows)
+                resized[start:stop] = previous[start:stop]
+            resized.flush()
+            del previous, resized
+            os.replace(resized_path, self.path)
+        except BaseException:
+            if os.path.exists(resized_path):
+                os.remove(resized_path)
+            raise
+        self.out = np.load(self.path, mmap_mode="r+")
+
+    def finish(self) -> Tuple[int, int]:
+        self._flush()
+        if self.out is None:
+            raise UploadError("Fichier CSV vide")
+        if self.rows != self.out.shape[0]:
+            # Matrice rectangulaire: .npy aux dimensions exactes
+            self._resize(self.rows)
+        self.close()
+        return self.rows, self.cols
+
+
+class MatrixMarketReader(_LineReader):
+    """
+    MatrixMarket réel/entier, formats 'array' (dense, par colonnes) et
+    'coordinate' (triplets i j v), symétrie 'general', 'symmetric' ou
+    'skew-symmetric'
+    """
+
+    def __init__(self, path: str, max_dimension: int):
+        super().__init__(path, max_dimension)
+        self.layout: Optional[str] = None
+        self.symmetry = "general"
+        self.shape: Optional[Tuple[int, int]] = None
+        self.expected = 0
+        self.count = 0
+        self._column_starts: Optional[np.ndarray] = None
+        self._diagonal_offset = 0
+
+    def _lines(self, block: bytes):
+        text = block.decode("utf-8")
+        if self.shape is None:
+            text = self._header(text)
+            if self.shape is None:
+                return
+        body = "\n".join(line for line in text.splitlines() if line.strip() and not line.startswith("%"))
+        if not body:
+            return
+        try:
+            values = np.loadtxt(io.StringIO(body), dtype=np.float64, ndmin=2)
+        except ValueError as e:
+            raise UploadError(f"MatrixMarket invalide: {e}")
+
+        if self.layout == "array":
+            self._array_values(values.ravel())
+        else:
+            self._coordinate_values(values)
+
+    def _header(self, text: str) -> str:
+        """Analyser la bannière et la ligne de dimensions; renvoie le reste du texte"""
+        lines = text.splitlines()
+        for index, line in enumerate(lines):
+            stripped = line.strip()
+            if self.layout is None:
+                parts = stripped.lower().split()
+                if len(parts) < 5 or parts[0] != "%%matrixmarket" or parts[1] != "matrix":
+                    raise UploadError("Bannière MatrixMarket attendue: %%MatrixMarket matrix <format> <type> <symétrie>")
+                if parts[2] not in ("array", "coordinate"):
+                    raise UploadError(f"Format MatrixMarket non supporté: {parts[2]}")
+                if parts[3] not in ("real", "integer", "double"):
+                    raise UploadError(f"Type MatrixMarket non supporté: {parts[3]}")
+                if parts[4] not in ("general", "symmetric", "skew-symmetric"):
+                    raise UploadError(f"Symétrie MatrixMarket non supportée: {parts[4]}")
+                self.layout, self.symmetry = parts[2], parts[4]
+                continue
+            if not stripped or stripped.startswith("%"):
+                continue
+            expected = 3 if self.layout == "coordinate" else 2
+            try:
+                sizes = [int(v) for v in stripped.split()]
+            except ValueError:
+                sizes = []
+            if len(sizes) != expected:
+                raise UploadError(
+                    f"Ligne de dimensions MatrixMarket invalide: '{stripped}' "
+                    f"({'lignes colonnes non-nuls' if expected == 3 else 'lignes colonnes'} attendus)"
+                )
+            rows, cols = sizes[0], sizes[1]
+            if self.symmetry != "general" and rows != cols:
+                raise UploadError("Une matrice symétrique doit être carrée")
+            self.shape = (rows, cols)
+            if self.layout == "array" and self.symmetry == "general":
+                # Valeurs par colonnes: mémoire en ordre Fortran, écriture séquentielle
+                self._allocate(rows, cols, fortran_order=True)
+                self.expected = rows * cols
+            elif self.layout == "array":
+                # Triangle inférieur par colonnes, diagonale exclue si antisymétrique
+                self._allocate(rows, cols)[...] = 0.0
+                self._diagonal_offset = 0 if self.symmetry == "symmetric" else 1
+                lengths = np.arange(rows - self._diagonal_offset, 0, -1)
+                self.expected = int(lengths.sum())
+                self._column_starts = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+            else:
+                if sizes[2] < 0:
+                    raise UploadError(f"Nombre de valeurs MatrixMarket invalide: {sizes[2]}")
+                self._allocate(rows, cols)[...] = 0.0
+                self.expected = sizes[2]
+            return "\n".join(lines[index + 1:])
+        return ""
+
+    def _array_values(self, values: np.ndarray):
+        if self.count + values.size > self.expected:
+            raise UploadError("MatrixMarket: plus de valeurs que déclaré")
+        if self.symmetry == "general":
+            flat = self.out.T.reshape(-1)
+            flat[self.count:self.count + values.size] = values
+        else:
+            # Triangle inférieur par colonnes: position → (i, j)
+            offsets = np.arange(self.count, self.count + values.size)
+            j = np.searchsorted(self._column_starts, offsets, side="right") - 1
+            i = j + self._diagonal_offset + offsets - self._column_starts[j]
+            self.out[i, j] = values
+            off = i != j
+            sign = 1.0 if self.symmetry == "symmetric" else -1.0
+            self.out[j[off], i[off]] = sign * values[off]
+        self.count += values.size
+
+    def _coordinate_values(self, values: np.ndarray):
+        if values.shape[1] != 3:
+            raise UploadError("MatrixMarket coordinate: trois valeurs par ligne attendues (i j valeur)")
+        if self.count + values.shape[0] > self.expected:
+            raise UploadError("MatrixMarket: plus d'entrées que déclaré")
+        i = values[:, 0].astype(np.int64) - 1
+        j = values[:, 1].astype(np.int64) - 1
+        rows, cols = self.shape
+        if i.min() < 0 or j.min() < 0 or i.max() >= rows or j.max() >= cols:
+            raise UploadError("MatrixMarket: indice hors des dimensions déclarées")
+        self.out[i, j] = values[:, 2]
+        if self.symmetry != "general":
+            off = i != j
+            sign = 1.0 if self.symmetry == "symmetric" else -1.0
+            self.out[j[off], i[off]] = sign * values[off, 2]
+        self.count += values.shape[0]
+
+    def finish(self) -> Tuple[int, int]:
+        self._flush()
+        if self.shape is None:
+            raise UploadError("Fichier MatrixMarket sans ligne de dimensions")
+        if self.count != self.expected:
+            raise UploadError(f"MatrixMarket: {self.expected} valeurs déclarées, {self.count} reçues")
+        self.close()
+        return self.shape
+
+
+class NpyReader(_MatrixReader):
+    """
+    Fichier .npy (NumPy) 2-D numérique
+
+    L'en-tête donne forme, type et ordre: les données brutes sont ensuite
+    converties en float64 morceau par morceau, dans l'ordre du fichier.
+    """
+
+    def __init__(self, path: str, max_dimension: int):
+        super().__init__(path, max_dimension)
+        self._header = b""
+        self.dtype: Optional[np.dtype] = None
+        self._remainder = b""
+        self._flat: Optional[np.ndarray] = None
+        self.count = 0
+
+    def feed(self, chunk: bytes):
+        if self.dtype is None:
+            self._header += chunk
+            chunk = self._parse_header()
+            if self.dtype is None:
+                return
+        data = self._remainder + chunk
+        usable = len(data) - len(data) % self.dtype.itemsize
+        self._remainder = data[usable:]
+        if not usable:
+            return
+        values = np.frombuffer(data[:usable], dtype=self.dtype)
+        if self.count + values.size > self._flat.size:
+            raise UploadError("Fichier .npy: plus de données que déclaré")
+        self._flat[self.count:self.count + values.size] = values
+        self.count += values.size
+
+    def _parse_header(self) -> bytes:
+        data = self._header
+        if len(data) < 10:
+            return b""
+        if data[:6] != b"\x93NUMPY":
+            raise UploadError("Fichier .npy invalide (signature)")
+        major = data[6]
+        length_size = 2 if major == 1 else 4
+        if len(data) < 8 + length_size:
+            return b""
+        header_length = int.from_bytes(data[8:8 + length_size], "little")
+        start = 8 + length_size
+        if len(data) < start + header_length:
+            return b""
+        try:
+            header = ast.literal_eval(data[start:start + header_length].decode("latin1"))
+            dtype = np.dtype(header["descr"])
+            shape = tuple(header["shape"])
+            fortran_order = bool(header["fortran_order"])
+        except (ValueError, SyntaxError, KeyError, TypeError) as e:
+            raise UploadError(f"En-tête .npy invalide: {e}")
+        if dtype.kind not in "biuf" or dtype.hasobject:
+            raise UploadError(f"Type .npy non numérique: {dtype}")
+        if len(shape) != 2:
+            raise UploadError(f"Une matrice 2-D est attendue (forme {shape})")
+
+        out = self._allocate(shape[0], shape[1], fortran_order=fortran_order)
+        # Vue plate dans l'ordre de stockage du fichier
+        self._flat = (out.T if fortran_order else out).reshape(-1)
+        self.dtype = dtype
+        self._header = b""
+        return data[start + header_length:]
+
+    def finish(self) -> Tuple[int, int]:
+        if self.dtype is None:
+            raise UploadError("Fichier .npy incomplet (en-tête)")
+        if self._remainder or self.count != self._flat.size:
+            raise UploadError(f"Fichier .npy incomplet: {self.count}/{self._flat.size} valeurs")
+        shape = self.out.shape
+        self._flat = None
+        self.close()
+        return shape
+
+
+_READERS = {"csv": CsvReader, "mtx": MatrixMarketReader, "npy": NpyReader}
+
+
+class UploadSession:
+    """
+    Réception d'un fichier: lecteur incrémental, limite d'octets et empreinte
+
+    L'identifiant final est l'empreinte SHA-256 du contenu: un même fichier
+    importé deux fois donne le même upload_id (et les mêmes clés de cache).
+    """
+
+    def __init__(self, store: "UploadStore", file_format: str, max_bytes: int, max_dimension: int):
+        if file_format not in _READERS:
+            raise UploadError(f"Format inconnu: {file_format} (choix: {', '.join(UPLOAD_FORMATS)})")
+        self.store = store
+        self.format = file_format
+        self.max_bytes = max_bytes
+        self.bytes_received = 0
+        self._hash = hashlib.sha256(file_format.encode())
+        self._temp_path = os.path.join(store.directory, f".partial_{secrets.token_hex(8)}.npy")
+        self.reader = _READERS[file_format](self._temp_path, max_dimension)
+
+    def feed(self, chunk: bytes):
+        self.bytes_received += len(chunk)
+        if self.bytes_received > self.max_bytes:
+            raise UploadTooLarge(f"Fichier trop volumineux (limite: {self.max_bytes} octets)")
+        self._hash.update(chunk)
+        self.reader.feed(chunk)
+
+    def finish(self) -> Tuple[str, Tuple[int, int]]:
+        shape = self.reader.finish()
+        upload_id = self._hash.hexdigest()[:32]
+        os.replace(self._temp_path, self.store.path(upload_id))
+        return upload_id, shape
+
+    def abort(self):
+        self.reader.close()
+        try:
+            os.remove(self._temp_path)
+        except FileNotFoundError:
+            pass
+
+
+class UploadStore:
+    """Matrices importées, stockées en .npy et relues en mémoire projetée"""
+
+    def __init__(self, directory: Optional[str] = None, ttl: float = 3600.0):
+        self.directory = directory or os.path.join(tempfile.gettempdir(), "opm_uploads")
+        self.ttl = ttl
+        os.makedirs(self.directory, exist_ok=True)
+
+    def path(self, upload_id: str) -> str:
+        if not upload_id.isalnum():
+            raise UploadError(f"Identifiant d'import invalide: {upload_id}")
+        return os.path.join(self.directory, f"{upload_id}.npy")
+
+    def session(self, file_format: str, max_bytes: int, max_dimension: int) -> UploadSession:
+        self.cleanup()
+        return UploadSession(self, file_format, max_bytes, max_dimension)
+
+    def load(self, upload_id: str) -> np.ndarray:
+        """Matrice importée (memmap en lecture seule)"""
+        path = self.path(upload_id)
+        if not os.path.exists(path):
+            raise UploadNotFound(f"Import inconnu ou expiré: {upload_id}")
+        os.utime(path)
+        return np.load(path, mmap_mode="r")
+
+    def shape(self, upload_id: str) -> Tuple[int, int]:
+        """Dimensions lues dans l'en-tête .npy (sans charger les données)"""
+        path = self.path(upload_id)
+        if not os.path.exists(path):
+            raise UploadNotFound(f"Import inconnu ou expiré: {upload_id}")
+        with open(path, "rb") as f:
+            version = np.lib.format.read_magic(f)
+            if version == (1, 0):
+                shape, _, _ = np.lib.format.read_array_header_1_0(f)
+            else:
+                shape, _, _ = np.lib.format.read_array_header_2_0(f)
+        return shape
+
+    def delete(self, upload_id: str) -> bool:
+        try:
+            os.remove(self.path(upload_id))
+            return True
+        except FileNotFoundError:
+            return False
+
+    def cleanup(self):
+        """Supprimer les imports non utilisés depuis plus de ttl secondes"""
+        limit = time.time() - self.ttl
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            try:
+                if os.path.getmtime(path) < limit:
+                    os.remove(path)
+            except FileNotFoundError:
+                pass
+
+
+upload_store = UploadStore(settings.UPLOAD_DIR, ttl=settings.UPLOAD_TTL)
@@ -1,3 +1,5 @@
+import json
+import os
 import pytest
 from fastapi.testclient import TestClient
 from src.app import app
@@ -106,3 +108,538 @@ def test_analyze_matrix():
     assert data["is_symmetric"] is True
     assert data["is_singular"] is False
     assert "recommendations" in data
+
+def test_determinant_etag_and_cache():
+    """Test cache des réponses et ETag (If-None-Match)"""
+    request_data = {
+        "matrix_a": {
+            "data": [[2, 1], [7, 5]]
+        }
+    }
+    
+    first = client.post("/api/v1/determinant", json=request_data)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    
+    second = client.post("/api/v1/determinant", json=request_data)
+    assert second.status_code == 200
+    assert second.headers["ETag"] == etag
+    assert second.headers["X-Cache"] == "HIT"
+    assert second.content == first.content
+    
+    not_modified = client.post(
+        "/api/v1/determinant", json=request_data, headers={"If-None-Match": etag}
+    )
+    assert not_modified.status_code == 304
+    assert not_modified.headers["ETag"] == etag
+    
+    other = client.post("/api/v1/determinant", json={"matrix_a": {"data": [[1, 0], [0, 1]]}})
+    assert other.headers["ETag"] != etag
+
+def test_cache_keys_depend_on_version(monkeypatch):
+    """Test clés de cache versionnées: une autre version ne sert pas les anciennes réponses"""
+    from src.api import routes
+    
+    request_data = {"matrix_a": {"data": [[3, 1], [4, 2]]}}
+    first = client.post("/api/v1/determinant", json=request_data)
+    
+    monkeypatch.setattr(routes, "CACHE_KEY_VERSION", routes.CACHE_KEY_VERSION + "-next")
+    upgraded = client.post("/api/v1/determinant", json=request_data)
+    assert upgraded.headers["ETag"] != first.headers["ETag"]
+    assert upgraded.headers["X-Cache"] == "MISS"
+
+def test_calculate_inverse():
+    """Test calcul de l'inverse"""
+    request_data = {
+        "matrix_a": {
+            "data": [[4, 7], [2, 6]]
+        }
+    }
+    
+    response = client.post("/api/v1/inverse", json=request_data)
+    
+    assert response.status_code == 200
+    data = response.json()
+    
+    assert data["success"] is True
+    assert abs(data["matrix_inverse"][0][0] - 0.6) < 1e-10
+    assert data["verification"] < 1e-10
+
+def test_trace_gauss_elimination_stream():
+    """Test trace SSE de l'élimination de Gauss"""
+    request_data = {
+        "matrix_a": {
+            "data": [[1, 2], [3, 4]]
+        },
+        "vector_b": {
+            "data": [5, 6]
+        },
+        "method": "gauss",
+        "viewport": {"row_start": 1}
+    }
+    
+    response = client.post("/api/v1/solve/trace", json=request_data)
+    
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    
+    events = [
+        (block.split("\n")[0][len("event: "):], json.loads(block.split("\n")[1][len("data: "):]))
+        for block in response.text.strip().split("\n\n")
+    ]
+    names = [name for name, _ in events]
+    
+    assert names[0] == "init" and names[-1] == "result"
+    assert "pivot" in names and "eliminate" in names
+    # Seules les lignes de la fenêtre sont transmises
+    assert set(events[0][1]["rows"]) == {"1"}
+    assert abs(events[-1][1]["solution"][0] - 4.5) < 1e-10
+    
+    # Entier hors de la plage des flottants dans A ou b: 400
+    for matrix, vector in (([[10 ** 400, 2], [3, 4]], [5, 6]), ([[1, 2], [3, 4]], [10 ** 400, 6])):
+        response = client.post("/api/v1/solve/trace", json={
+            **request_data, "matrix_a": {"data": matrix}, "vector_b": {"data": vector}
+        })
+        assert response.status_code == 400
+
+def test_solve_least_squares_qr():
+    """Test moindres carrés (A rectangulaire) par QR de Householder"""
+    request_data = {
+        "matrix_a": {
+            "data": [[1, 0], [1, 1], [1, 2], [1, 3]]
+        },
+        "vector_b": {
+            "data": [1, 3, 5, 7.5]
+        },
+        "method": "qr"
+    }
+    
+    response = client.post("/api/v1/solve", json=request_data)
+    
+    assert response.status_code == 200
+    data = response.json()
+    
+    assert data["success"] is True
+    assert data["rank"] == 2
+    assert data["determinant"] is None
+    assert abs(data["solution"][0] - 0.9) < 1e-10
+    assert abs(data["solution"][1] - 2.15) < 1e-10
+
+def test_solve_rejects_rectangular_without_qr():
+    """Test rejet d'une matrice rectangulaire hors moindres carrés"""
+    request_data = {
+        "matrix_a": {
+            "data": [[1, 0], [1, 1], [1, 2]]
+        },
+        "vector_b": {
+            "data": [1, 3, 5]
+        },
+        "method": "gauss"
+    }
+    
+    response = client.post("/api/v1/solve", json=request_data)
+    
+    assert response.status_code == 422
+
+def test_exact_determinant_and_solve():
+    """Test mode exact (Bareiss): résultats rationnels"""
+    response = client.post("/api/v1/determinant", json={
+        "matrix_a": {"data": [[2, 1], [1, 3]]},
+        "exact": True
+    })
+    
+    assert response.status_code == 200
+    assert response.json()["determinant_exact"] == {"numerator": "5", "denominator": "1"}
+    
+    response = client.post("/api/v1/solve", json={
+        "matrix_a": {"data": [[2, 1], [1, 3]]},
+        "vector_b": {"data": [1, 0.1]},
+        "exact": True
+    })
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert data["solution_exact"] == [
+        {"numerator": "29", "denominator": "50"},
+        {"numerator": "-4", "denominator": "25"}
+    ]
+
+def test_exact_mode_keeps_large_integers():
+    """Test mode exact: entiers au-delà de 2^53 non arrondis, flottants imprécis refusés"""
+    big = 2 ** 53 + 1
+    response = client.post("/api/v1/determinant", json={"matrix_a": {"data": [[big, 0], [0, 1]]}, "exact": True})
+    assert response.status_code == 200
+    assert response.json()["determinant_exact"] == {"numerator": str(big), "denominator": "1"}
+    
+    huge = 10 ** 30 + 7
+    response = client.post("/api/v1/solve", json={
+        "matrix_a": {"data": [[1, 0], [0, 1]]}, "vector_b": {"data": [huge, 1]}, "exact": True
+    })
+    assert response.status_code == 200
+    assert response.json()["solution_exact"][0] == {"numerator": str(huge), "denominator": "1"}
+    
+    response = client.post("/api/v1/determinant", json={"matrix_a": {"data": [[1e20, 0], [0, 1]]}, "exact": True})
+    assert response.status_code == 422
+    # Entier hors de la plage des flottants (calculs flottants du mode exact compris): 400
+    for exact in (False, True):
+        response = client.post("/api/v1/solve", json={
+            "matrix_a": {"data": [[1, 0], [0, 1]]}, "vector_b": {"data": [10 ** 400, 1]}, "exact": exact
+        })
+        assert response.status_code == 400
+    
+    # Hors mode exact, les flottants restent acceptés
+    response = client.post("/api/v1/determinant", json={"matrix_a": {"data": [[1e20, 0], [0, 1]]}})
+    assert response.status_code == 200
+
+def test_solve_with_reordering():
+    """Test résolution après renumérotation RCM (rapport bande/remplissage)"""
+    n = 8
+    order = [3, 7, 0, 5, 1, 6, 2, 4]
+    A = [[0.0] * n for _ in range(n)]
+    for i in range(n):
+        A[order[i]][order[i]] = 4.0
+        if i + 1 < n:
+            A[order[i]][order[i + 1]] = A[order[i + 1]][order[i]] = -1.0
+    
+    response = client.post("/api/v1/solve", json={
+        "matrix_a": {"data": A},
+        "vector_b": {"data": [1.0] * n},
+        "method": "lu",
+        "reordering": "rcm"
+    })
+    
+    assert response.status_code == 200
+    data = response.json()
+    report = data["reordering"]
+    assert report["bandwidth_after"] == 1
+    assert report["bandwidth_before"] > 1
+    assert report["fill_after"] == 0
+    assert data["residual_error"] < 1e-10
+    
+    response = client.post("/api/v1/solve", json={
+        "matrix_a": {"data": A},
+        "vector_b": {"data": [1.0] * n},
+        "method": "qr",
+        "reordering": "minimum_degree"
+    })
+    assert response.status_code == 422
+
+def test_operations_share_factorization():
+    """Test opérations combinées: une factorisation, une sous-réponse par opération"""
+    response = client.post("/api/v1/operations", json={
+        "matrix_a": {"data": [[0.0, 2.0, 1.0], [1.0, 1.0, 0.0], [3.0, 0.0, 1.0]]},
+        "vector_b": {"data": [3.0, 2.0, 4.0]},
+        "operations": ["solve", "determinant", "inverse", "analyze"]
+    })
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert data["success"] is True
+    assert data["solve"]["solution"] == pytest.approx([1.0, 1.0, 1.0])
+    assert data["determinant"]["determinant"] == pytest.approx(-5.0)
+    assert data["inverse"]["verification"] < 1e-10
+    assert data["analyze"]["rank"] == 3
+    assert set(data["timings"]) == {"lu_factorization", "singular_values", "solve", "determinant", "inverse", "analyze"}
+    
+    # Matrice singulière: solve/inverse échouent, le reste répond
+    response = client.post("/api/v1/operations", json={
+        "matrix_a": {"data": [[1.0, 2.0], [2.0, 4.0]]},
+        "operations": ["determinant", "inverse"]
+    })
+    data = response.json()
+    assert data["success"] is False
+    assert data["determinant"]["determinant"] == pytest.approx(0.0)
+    assert data["inverse"]["success"] is False
+
+def test_generated_matrices():
+    """Test générateurs côté serveur: endpoint /generate et spécification dans les requêtes"""
+    response = client.post("/api/v1/generate", json={"kind": "poisson2d", "n": 9})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["shape"] == [9, 9]
+    assert data["matrix"][0][:4] == [4.0, -1.0, 0.0, -1.0]
+    
+    spec = {"kind": "conditioned", "n": 20, "seed": 7, "condition_number": 1e4}
+    response = client.post("/api/v1/analyze", json={"matrix_a": {"generator": spec}})
+    assert response.json()["condition_number"] == pytest.approx(1e4, rel=1e-6)
+    
+    response = client.post("/api/v1/solve", json={
+        "matrix_a": {"generator": {"kind": "spd", "n": 30, "seed": 1}},
+        "vector_b": {"generator": {"kind": "ones", "n": 30}}
+    })
+    assert response.status_code == 200
+    assert response.json()["residual_error"] < 1e-10
+    
+    # Soit data, soit generator; paramètres propres au générateur
+    assert client.post("/api/v1/analyze", json={"matrix_a": {}}).status_code == 422
+    response = client.post("/api/v1/generate", json={"kind": "hilbert", "n": 4, "bandwidth": 2})
+    assert response.status_code == 422
+    response = client.post("/api/v1/generate", json={"kind": "poisson2d", "n": 10})
+    assert response.status_code == 400
+
+def test_solve_structured_toeplitz_and_circulant():
+    """Test forme compacte (première colonne/ligne) et détection de structure"""
+    n = 20
+    column = [4.0] + [1.0 / (k + 1) for k in range(1, n)]
+    row = [4.0] + [-1.0 / (k + 2) for k in range(1, n)]
+    
+    response = client.post("/api/v1/solve", json={
+        "matrix_a": {"structured": {"kind": "toeplitz", "first_column": column, "first_row": row}},
+        "vector_b": {"data": [1.0] * n}
+    })
+    assert response.status_code == 200
+    data = response.json()
+    assert data["structure"] == "toeplitz"
+    assert data["residual_error"] < 1e-10
+    
+    # Même matrice transmise en dense: détectée automatiquement
+    dense = [[column[i - j] if i >= j else row[j - i] for j in range(n)] for i in range(n)]
+    response = client.post("/api/v1/solve", json={"matrix_a": {"data": dense}, "vector_b": {"data": [1.0] * n}})
+    assert response.json()["structure"] == "toeplitz"
+    assert response.json()["solution"] == pytest.approx(data["solution"])
+    
+    response = client.post("/api/v1/determinant", json={
+        "matrix_a": {"structured": {"kind": "circulant", "first_column": [2.0, 1.0, 0.0]}}
+    })
+    assert response.status_code == 200
+    assert response.json()["structure"] == "circulant"
+    assert response.json()["determinant"] == pytest.approx(9.0)
+
+def test_solve_block_diagonal_system(monkeypatch):
+    """Test détection des sous-systèmes indépendants (bloc-diagonale permutée)"""
+    import numpy as np
+    
+    n = 20
+    A = [[0.0] * n for _ in range(n)]
+    for i in range(n):
+        A[i][i] = 3.0 + 0.1 * i
+        # Deux sous-systèmes entrelacés: indices pairs / impairs
+        if i + 2 < n:
+            A[i][i + 2] = A[i + 2][i] = 1.0
+    
+    response = client.post("/api/v1/solve", json={"matrix_a": {"data": A}, "vector_b": {"data": [1.0] * n}})
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert data["structure"] == "block_diagonal"
+    assert data["blocks"] == [list(range(0, n, 2)), list(range(1, n, 2))]
+    assert data["residual_error"] < 1e-10
+    assert data["determinant"] == pytest.approx(np.linalg.det(A))
+    
+    # Worker mort: pool abandonné, repli séquentiel pour la requête
+    from concurrent.futures.process import BrokenProcessPool
+    from src.api import routes
+    
+    class BrokenPool:
+        def solve_many(self, systems, method):
+            raise BrokenProcessPool("worker mort")
+        
+        def shutdown(self, wait=True):
+            pass
+    
+    monkeypatch.setattr(routes, "block_pool", BrokenPool())
+    monkeypatch.setattr(routes.settings, "BLOCK_SOLVE_WORKERS", 2)
+    monkeypatch.setattr(routes.settings, "BLOCK_PARALLEL_MIN_SIZE", 1)
+    response = client.post("/api/v1/solve", json={"matrix_a": {"data": A}, "vector_b": {"data": [1.0] * n}})
+    assert response.status_code == 200
+    assert response.json()["solution"] == pytest.approx(data["solution"])
+    assert routes.block_pool is None
+
+def test_upload_matrix_file_and_solve(monkeypatch):
+    """Test import multipart (CSV) puis résolution par upload_id"""
+    from src.config import settings
+    
+    csv = b"4,1,0\n1,3,1\n0,1,2\n"
+    response = client.post("/api/v1/upload", files={"file": ("A.csv", csv, "text/csv")})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["shape"] == [3, 3]
+    assert data["format"] == "csv"
+    
+    response = client.post("/api/v1/solve", json={
+        "matrix_a": {"upload_id": data["upload_id"]},
+        "vector_b": {"data": [5.0, 5.0, 3.0]}
+    })
+    assert response.status_code == 200
+    assert response.json()["solution"] == pytest.approx([1.0, 1.0, 1.0])
+    
+    # Dimensions d'un import vérifiées par la route (inconnues à la validation)
+    response = client.post("/api/v1/solve", json={
+        "matrix_a": {"upload_id": data["upload_id"]}, "vector_b": {"data": [1.0, 2.0]}
+    })
+    assert response.status_code == 400
+    wide = client.post("/api/v1/upload", files={"file": ("W.csv", b"1,2,3\n4,5,6\n", "text/csv")}).json()
+    response = client.post("/api/v1/operations", json={
+        "matrix_a": {"upload_id": wide["upload_id"]}, "operations": ["determinant"]
+    })
+    assert response.status_code == 400
+    
+    # Interruption quelconque pendant la réception: aucun fichier partiel laissé
+    from src.services.uploads import UploadSession, upload_store
+    def failing_feed(self, chunk):
+        raise OSError("Disque plein")
+    monkeypatch.setattr(UploadSession, "feed", failing_feed)
+    with pytest.raises(OSError):
+        client.post("/api/v1/upload", files={"file": ("A.csv", csv, "text/csv")})
+    monkeypatch.undo()
+    assert not [name for name in os.listdir(upload_store.directory) if name.startswith(".partial_")]
+    
+    mtx = b"%%MatrixMarket matrix coordinate real general\n3 3\n1 1 1.0\n"
+    response = client.post("/api/v1/upload", files={"file": ("A.mtx", mtx, "text/plain")})
+    assert response.status_code == 400
+    
+    monkeypatch.setattr(settings, "UPLOAD_MAX_BYTES", 8)
+    response = client.post("/api/v1/upload", files={"file": ("A.csv", csv, "text/csv")})
+    assert response.status_code == 413
+    
+    assert client.delete(f"/api/v1/upload/{data['upload_id']}").status_code == 200
+    response = client.post("/api/v1/determinant", json={"matrix_a": {"upload_id": data["upload_id"]}})
+    assert response.status_code == 404
+
+def test_engine_selection_and_pinning():
+    """Test moteur choisi selon la taille, moteur imposé et capacités"""
+    A = [[4.0, 1.0], [1.0, 3.0]]
+    response = client.post("/api/v1/solve", json={"matrix_a": {"data": A}, "vector_b": {"data": [1.0, 2.0]}})
+    assert response.json()["engine"] == "reference"
+    
+    response = client.post("/api/v1/solve", json={
+        "matrix_a": {"generator": {"kind": "spd", "n": 300}},
+        "vector_b": {"generator": {"kind": "ones", "n": 300}}
+    })
+    assert response.status_code == 200
+    assert response.json()["engine"] == "lapack"
+    assert response.json()["residual_error"] < 1e-8
+    
+    for engine in ("reference", "numpy", "lapack"):
+        response = client.post("/api/v1/inverse", json={"matrix_a": {"data": A}, "engine": engine})
+        assert response.status_code == 200
+        assert response.json()["engine"] == engine
+    
+    response = client.post("/api/v1/decompose-lu", json={"matrix_a": {"data": A}, "engine": "lapack"})
+    assert response.status_code == 400
+    response = client.post("/api/v1/solve", json={
+        "matrix_a": {"data": A}, "vector_b": {"data": [1.0, 2.0]}, "exact": True, "engine": "numpy"
+    })
+    assert response.status_code == 422
+    
+    for engine in ("reference", "numpy", "lapack"):
+        response = client.post("/api/v1/solve", json={
+            "matrix_a": {"data": A}, "vector_b": {"data": [1.0, 2.0]}, "engine": engine
+        })
+        profile = response.json()["profile"]
+        assert profile["flops"] > 0 and profile["peak_bytes"] > 0
+        assert "substitution" in profile["phases"]
+    
+    engines = client.get("/api/v1/engines").json()["engines"]
+    assert [engine["name"] for engine in engines] == ["reference", "numpy", "lapack"]
+
+def test_analyze_approximate_mode(monkeypatch):
+    """Test analyse approchée par défaut au-delà du seuil, exacte sur demande"""
+    from src.config import settings
+    
+    monkeypatch.setattr(settings, "ANALYSIS_SKETCH_THRESHOLD", 50)
+    matrix = {"generator": {"kind": "spd", "n": 80, "seed": 4}}
+    data = client.post("/api/v1/analyze", json={"matrix_a": matrix}).json()
+    assert data["mode"] == "approximate"
+    assert data["eigenvalues"] is None
+    low, high = data["estimates"]["condition_number_bounds"]
+    
+    exact = client.post("/api/v1/analyze", json={"matrix_a": matrix, "mode": "exact"}).json()
+    assert exact["mode"] == "exact" and exact["estimates"] is None
+    assert low <= exact["condition_number"] * (1 + 1e-9) and exact["condition_number"] <= high
+    assert data["rank"] == exact["rank"] == 80
+
+def test_turing_simulate_bounded_loop_detection():
+    """Test simulation Turing: cycle détecté en mémoire bornée"""
+    request_data = {
+        "initial_tape": "111",
+        "final_states": ["h"],
+        "transitions": [
+            {"current_state": "q0", "read_symbol": "1", "next_state": "q0", "write_symbol": "1", "move_direction": "R"},
+            {"current_state": "q0", "read_symbol": "_", "next_state": "q1", "write_symbol": "1", "move_direction": "L"},
+            {"current_state": "q1", "read_symbol": "1", "next_state": "q2", "write_symbol": "1", "move_direction": "R"},
+            {"current_state": "q2", "read_symbol": "1", "next_state": "q1", "write_symbol": "1", "move_direction": "L"}
+        ],
+        "loop_detection": "bounded",
+        "loop_memory": 8
+    }
+    
+    response = client.post("/api/v1/turing/simulate", json=request_data)
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert data["loop_detected"] is True
+    assert data["loop_start"] == 4
+    assert data["loop_length"] == 2
+    
+    exact = client.post("/api/v1/turing/simulate", json={**request_data, "loop_detection": "exact"}).json()
+    assert (exact["loop_start"], exact["loop_length"]) == (4, 2)
+    assert exact["total_steps"] <= data["total_steps"]
+
+
+def test_turing_simulate_trace_levels():
+    """Test simulation Turing: niveaux de trace none / summary / sampled / full"""
+    request_data = {
+        "initial_tape": "1" * 50,
+        "final_states": ["h"],
+        "transitions": [
+            {"current_state": "q0", "read_symbol": "1", "next_state": "q0", "write_symbol": "0", "move_direction": "R"},
+            {"current_state": "q0", "read_symbol": "_", "next_state": "h", "write_symbol": "_", "move_direction": "N"}
+        ]
+    }
+    
+    full = client.post("/api/v1/turing/simulate", json=request_data).json()
+    steps = full["execution_steps"]
+    assert full["trace"] == "full"
+    assert len(steps) == full["total_steps"] == 52
+    
+    none = client.post("/api/v1/turing/simulate", json={**request_data, "trace": "none"}).json()
+    assert none["execution_steps"] == [] and none["animation_frames"] == []
+    assert (none["total_steps"], none["final_tapes"]) == (full["total_steps"], full["final_tapes"])
+    
+    summary = client.post("/api/v1/turing/simulate", json={**request_data, "trace": "summary"}).json()
+    first, last = summary["execution_steps"]
+    assert first == {**steps[0], "action_taken": None}
+    assert last["step_number"] == 52 and last["tape_contents"] == full["final_tapes"]
+    assert last["action_taken"] == full["message"]
+    
+    sampled = client.post("/api/v1/turing/simulate", json={**request_data, "trace": "sampled", "sample_every": 10}).json()
+    assert sampled["execution_steps"] == steps[::10]
+    
+    spaced = client.post("/api/v1/turing/simulate", json={**request_data, "trace": "sampled", "sample_frames": 5}).json()
+    assert [s["step_number"] for s in spaced["execution_steps"]] == [0, 13, 26, 38, 51]
+    assert spaced["execution_steps"][-1] == steps[-1]
+    assert len(spaced["animation_frames"]) == 5
+
+
+def test_turing_stream_sends_batches():
+    """Test exécution Turing en flux (SSE): lots d'étapes puis résultat"""
+    request_data = {
+        "initial_tape": "1" * 50,
+        "final_states": ["h"],
+        "transitions": [
+            {"current_state": "q0", "read_symbol": "1", "next_state": "q0", "write_symbol": "0", "move_direction": "R"},
+            {"current_state": "q0", "read_symbol": "_", "next_state": "h", "write_symbol": "_", "move_direction": "N"}
+        ]
+    }
+    full = client.post("/api/v1/turing/simulate", json=request_data).json()
+    
+    response = client.post("/api/v1/turing/stream", json={**request_data, "batch_size": 20})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    
+    events = []
+    for block in response.text.strip().split("\n\n"):
+        event_line, data_line = block.split("\n")
+        events.append((event_line[len("event: "):], json.loads(data_line[len("data: "):])))
+    
+    assert [name for name, _ in events] == ["session", "steps", "steps", "steps", "result"]
+    assert [s for _, data in events[1:4] for s in data["steps"]] == full["execution_steps"]
+    result = events[-1][1]
+    assert (result["total_steps"], result["final_tapes"], result["message"]) == \
+        (full["total_steps"], full["final_tapes"], full["message"])
+    
+    # Session terminée: plus de contrôle possible
+    session_id = events[0][1]["session_id"]
+    assert client.post(f"/api/v1/turing/stream/{session_id}/pause").status_code == 404
+    assert client.post(f"/api/v1/turing/stream/{session_id}/stop").status_code == 422
@@ -0,0 +1,813 @@
+import numpy as np
+import pytest
+from src.services.matrix_solver import MatrixSolver
+from src.services.triangular import solve_triangular
+
+solver = MatrixSolver()
+
+@pytest.mark.parametrize("variant", ["row", "blocked"])
+@pytest.mark.parametrize("unit_diagonal", [False, True])
+def test_solve_triangular_variants(variant, unit_diagonal):
+    """Test substitution avant/arrière, plusieurs seconds membres"""
+    rng = np.random.default_rng(0)
+    n = 40
+    L = np.tril(rng.standard_normal((n, n))) / n + np.eye(n)
+    B = rng.standard_normal((n, 3))
+    
+    X = solve_triangular(L, B, lower=True, unit_diagonal=unit_diagonal, variant=variant, block_size=8)
+    Y = solve_triangular(L.T, B[:, 0], unit_diagonal=unit_diagonal, variant=variant, block_size=8)
+    
+    L_eff = L.copy()
+    if unit_diagonal:
+        np.fill_diagonal(L_eff, 1.0)
+    assert np.allclose(L_eff @ X, B)
+    assert np.allclose(L_eff.T @ Y, B[:, 0])
+
+def test_gauss_multiple_right_hand_sides():
+    """Test élimination de Gauss avec seconds membres multiples"""
+    A = np.array([[2.0, 1.0, 1.0], [4.0, -6.0, 0.0], [-2.0, 7.0, 2.0]])
+    B = np.arange(6, dtype=float).reshape(3, 2)
+    
+    X, _ = solver.gauss_elimination(A, B)
+    
+    assert X.shape == (3, 2)
+    assert np.allclose(A @ X, B)
+
+@pytest.mark.parametrize("pivoting", [False, True])
+def test_blocked_householder_qr(pivoting):
+    """Test QR par blocs: A·P = Q·R et moindres carrés"""
+    from src.services.qr import householder_qr, least_squares
+    
+    rng = np.random.default_rng(1)
+    A = rng.standard_normal((60, 13))
+    b = rng.standard_normal(60)
+    
+    factorization = householder_qr(A, block_size=4, pivoting=pivoting)
+    Q = factorization.apply_qt(np.eye(60)).T
+    R = np.zeros_like(A)
+    R[:13] = factorization.R
+    AP = A[:, factorization.perm] if pivoting else A
+    assert np.allclose(Q @ R, AP)
+    
+    x, info = least_squares(A, b, pivoting=pivoting)
+    assert info['rank'] == 13
+    assert np.allclose(x, np.linalg.lstsq(A, b, rcond=None)[0])
+
+def test_least_squares_rank_deficient_pivoting():
+    """Test QR avec pivotage sur une matrice de rang déficient"""
+    from src.services.qr import least_squares
+    
+    rng = np.random.default_rng(2)
+    A = rng.standard_normal((30, 4))
+    A = np.hstack([A, A[:, :1] + A[:, 1:2]])
+    b = rng.standard_normal(30)
+    
+    x, info = least_squares(A, b, pivoting=True)
+    
+    assert info['rank'] == 4
+    reference = np.linalg.lstsq(A, b, rcond=None)[0]
+    assert np.isclose(np.linalg.norm(A @ x - b), np.linalg.norm(A @ reference - b))
+    
+    with pytest.raises(ValueError):
+        least_squares(A, b, pivoting=False)
+
+def test_shared_memory_pool_solves_without_leaking_segments():
+    """Test transport par mémoire partagée vers un pool de processus"""
+    from src.services.shared_memory_pool import SharedArrayArena, SharedMemorySolverPool
+    
+    rng = np.random.default_rng(3)
+    A = rng.standard_normal((30, 30)) + 30 * np.eye(30)
+    b = rng.standard_normal(30)
+    
+    with SharedMemorySolverPool(max_workers=1) as pool:
+        x, info = pool.solve(A, b)
+        L, U, _ = pool.lu_decomposition(A)
+        with pytest.raises(ValueError):
+            pool.solve(np.zeros((2, 2)), np.ones(2))
+    
+    assert np.allclose(A @ x, b)
+    assert np.allclose(L @ U, A)
+    
+    arena = SharedArrayArena()
+    handle = arena.put(A)
+    assert np.array_equal(arena.view(handle), A)
+    arena.release()
+    assert len(arena) == 0
+
+def test_schema_version_tracks_response_shape():
+    """Test empreinte des schémas: change avec les champs des modèles"""
+    from typing import Optional
+    from pydantic import BaseModel
+    from src.services.response_cache import schema_version
+    
+    class Response(BaseModel):
+        value: float
+    
+    class Extended(BaseModel):
+        value: float
+        profile: Optional[dict] = None
+    
+    assert schema_version(Response) == schema_version(Response)
+    Extended.__name__ = "Response"
+    assert schema_version(Extended) != schema_version(Response)
+
+def test_result_store_ttl_and_eviction(tmp_path):
+    """Test stockage persistant: relecture, expiration et taille bornée"""
+    from src.services.result_store import ResultStore
+    
+    path = str(tmp_path / "results.sqlite3")
+    store = ResultStore(path, ttl=60, max_bytes=100)
+    store.put("a", b"x" * 40, kind="analyze")
+    store.put("b", b"y" * 40, kind="analyze")
+    assert store.get("a") == b"x" * 40
+    
+    # Dépasse la limite: la moins récemment lue ("b") est évincée
+    store.put("c", b"z" * 40, kind="turing/simulate")
+    assert store.get("b") is None
+    assert store.get("a") is not None
+    
+    # Compteur de taille tenu à jour (remplacement, suppression)
+    assert store.total_bytes() == 80
+    store.put("c", b"z" * 10, kind="turing/simulate")
+    store.delete("a")
+    assert store.total_bytes() == 10
+    
+    # Une autre instance (autre worker) voit les mêmes résultats
+    assert ResultStore(path).get("c") == b"z" * 10
+    assert ResultStore(path).total_bytes() == 10
+    
+    expired = ResultStore(str(tmp_path / "expired.sqlite3"), ttl=-1)
+    expired.put("k", b"v")
+    assert expired.get("k") is None
+    expired.put("l", b"w")
+    assert expired.total_bytes() == 0
+
+def test_exact_determinant_bareiss_and_modular_agree():
+    """Test déterminant exact: Bareiss et restes chinois"""
+    import random
+    from fractions import Fraction
+    from src.services.exact import exact_determinant, exact_solve
+    
+    rng = random.Random(0)
+    rows = [[rng.randint(-10**12, 10**12) for _ in range(15)] for _ in range(15)]
+    
+    bareiss, _ = exact_determinant(rows, method="bareiss")
+    modular, _ = exact_determinant(rows, method="modular_crt")
+    assert bareiss == modular
+    assert exact_determinant([[0.5, 1], [1, 4]])[0] == Fraction(1)
+    assert exact_determinant([[1, 2], [2, 4]], method="modular_crt")[0] == 0
+    
+    b = [rng.randint(-9, 9) for _ in range(15)]
+    x, det = exact_solve(rows, b)
+    assert det == bareiss
+    assert all(sum(a * xi for a, xi in zip(row, x)) == bi for row, bi in zip(rows, b))
+
+@pytest.mark.parametrize("reordering", ["rcm", "minimum_degree"])
+@pytest.mark.parametrize("method", ["gauss", "lu"])
+def test_reordered_solve_reduces_bandwidth_and_fill(reordering, method):
+    """Test renumérotation: matrice bande mélangée, fill prédit et solution"""
+    from src.services.reordering import factor_nonzeros, sparsity_pattern
+    
+    rng = np.random.default_rng(3)
+    n = 60
+    band = 4 * np.eye(n) - np.eye(n, k=1) - np.eye(n, k=-1) - np.eye(n, k=2) - np.eye(n, k=-2)
+    shuffle = rng.permutation(n)
+    A = band[np.ix_(shuffle, shuffle)]
+    b = rng.standard_normal(n)
+    
+    x, info = solver.reordered_solve(A, b, method=method, reordering=reordering)
+    report = info['reordering']
+    
+    assert np.allclose(A @ x, b)
+    assert sorted(report['permutation']) == list(range(n))
+    assert report['fill_after'] < report['fill_before']
+    if reordering == "rcm":
+        assert report['bandwidth_after'] <= 4
+    
+    # Le remplissage prédit correspond à la factorisation LU effective
+    perm = report['permutation']
+    L, U, _ = solver.lu_decomposition(A[np.ix_(perm, perm)])
+    actual = np.count_nonzero(np.tril(L, -1)) + np.count_nonzero(np.triu(U))
+    assert actual <= factor_nonzeros(sparsity_pattern(A[np.ix_(perm, perm)]))
+
+def test_minimum_degree_fill_on_grid_and_arrow():
+    """Test degré minimum: remplissage jamais supérieur à l'ordre naturel (grille, flèche)"""
+    from src.services.reordering import compute_ordering
+    
+    # Laplacien 2D à 5 points sur une grille 12×12
+    m = 12
+    T = 4 * np.eye(m) - np.eye(m, k=1) - np.eye(m, k=-1)
+    grid = np.kron(np.eye(m), T) - np.kron(np.eye(m, k=1) + np.eye(m, k=-1), np.eye(m))
+    report = compute_ordering(grid, "minimum_degree")
+    assert report['fill_after'] <= report['fill_before']
+    
+    # Flèche pointant vers le haut: l'ordre naturel remplit toute la matrice
+    n = 30
+    arrow = 4 * np.eye(n)
+    arrow[0, :] = arrow[:, 0] = 1.0
+    arrow[0, 0] = n
+    report = compute_ordering(arrow, "minimum_degree")
+    assert report['fill_before'] == (n - 1) * (n - 2)
+    assert report['fill_after'] == 0
+
+def test_minimum_degree_matches_greedy_reference():
+    """Test degré minimum: même ordre qu'un glouton naïf (plus petit degré, puis plus petit indice)"""
+    from src.services.reordering import minimum_degree_ordering
+    
+    def greedy(pattern):
+        n = pattern.shape[0]
+        graph = {i: set(np.flatnonzero(pattern[i]).tolist()) for i in range(n)}
+        order = []
+        while graph:
+            node = min(graph, key=lambda i: (len(graph[i]), i))
+            neighbors = graph.pop(node)
+            for v in neighbors:
+                graph[v] = (graph[v] | neighbors) - {v, node}
+            order.append(node)
+        return order
+    
+    rng = np.random.default_rng(11)
+    for _ in range(100):
+        n = int(rng.integers(2, 25))
+        pattern = rng.random((n, n)) < rng.uniform(0.05, 0.4)
+        pattern = pattern | pattern.T
+        np.fill_diagonal(pattern, False)
+        assert minimum_degree_ordering(pattern).tolist() == greedy(pattern)
+
+def test_matrix_generators_are_deterministic():
+    """Test générateurs: graine, structure et propriétés annoncées"""
+    from src.services.generators import generate_matrix
+    
+    A = generate_matrix("random", 12, seed=5)
+    assert np.array_equal(A, generate_matrix("random", 12, seed=5))
+    assert not np.array_equal(A, generate_matrix("random", 12, seed=6))
+    
+    S = generate_matrix("spd", 12, seed=5)
+    assert np.allclose(S, S.T) and np.linalg.eigvalsh(S).min() > 0
+    
+    H = generate_matrix("hilbert", 4)
+    assert H[1, 2] == pytest.approx(1 / 4)
+    
+    B = generate_matrix("banded", 12, seed=5, bandwidth=2)
+    i, j = np.nonzero(B)
+    assert np.abs(i - j).max() == 2
+    
+    P = generate_matrix("poisson2d", 16)
+    assert np.allclose(P, P.T)
+    assert np.count_nonzero(P) == 16 + 2 * 2 * 4 * 3
+    
+    C = generate_matrix("conditioned", 15, seed=5, condition_number=1e6)
+    assert np.linalg.cond(C) == pytest.approx(1e6, rel=1e-6)
+
+def test_toeplitz_and_circulant_solvers():
+    """Test Levinson (non symétrique) et FFT circulante contre la résolution dense"""
+    from scipy.linalg import toeplitz, circulant
+    from src.services import structured
+    
+    rng = np.random.default_rng(11)
+    n = 50
+    c = rng.standard_normal(n)
+    c[0] += 12.0
+    r = rng.standard_normal(n)
+    r[0] = c[0]
+    b = rng.standard_normal(n)
+    
+    T = toeplitz(c, r)
+    assert structured.detect_structure(T) == "toeplitz"
+    assert np.allclose(structured.toeplitz_matvec(c, r, b), T @ b)
+    x, det = structured.toeplitz_solve(c, r, b)
+    assert np.allclose(T @ x, b)
+    assert det == pytest.approx(np.linalg.det(T), rel=1e-8)
+    
+    C = circulant(c)
+    assert structured.detect_structure(C) == "circulant"
+    x, _ = structured.circulant_solve(c, b)
+    assert np.allclose(C @ x, b)
+    assert structured.circulant_determinant(c) == pytest.approx(np.linalg.det(C), rel=1e-8)
+    
+    # Sous-matrice principale singulière: repli dense dans MatrixSolver
+    x, info = solver.structured_solve("toeplitz", np.array([0.0, 1.0]), np.array([0.0, 2.0]), np.array([2.0, 1.0]))
+    assert info['method'] == 'toeplitz_dense_fallback'
+    assert np.allclose(toeplitz([0.0, 1.0], [0.0, 2.0]) @ x, [2.0, 1.0])
+    
+    # Premier pivot minuscule: déterminant de Levinson imprécis, repli LU dense
+    det, info = solver.structured_determinant("toeplitz", c, r)
+    assert info['method'] == 'toeplitz_levinson'
+    for scale in (1e-7, 1e-8, 1e-9):
+        c_small, r_small = c.copy(), r.copy()
+        c_small[0] = r_small[0] = scale
+        det, info = solver.structured_determinant("toeplitz", c_small, r_small)
+        assert info['method'] == 'toeplitz_dense_fallback'
+        assert det == pytest.approx(np.linalg.det(toeplitz(c_small, r_small)), rel=1e-9)
+
+def test_block_solve_sequential_and_parallel():
+    """Test décomposition bloc-diagonale: blocs trouvés, solution assemblée, pool"""
+    from scipy.linalg import block_diag
+    from src.services.shared_memory_pool import SharedMemorySolverPool
+    
+    rng = np.random.default_rng(4)
+    sizes = [5, 8, 3]
+    B = block_diag(*[rng.standard_normal((k, k)) + k * np.eye(k) for k in sizes])
+    shuffle = rng.permutation(sum(sizes))
+    A = B[np.ix_(shuffle, shuffle)]
+    b = rng.standard_normal(len(shuffle))
+    
+    x, info = solver.block_solve(A, b)
+    assert np.allclose(A @ x, b)
+    assert sorted(len(block) for block in info['blocks']) == sorted(sizes)
+    assert info['determinant'] == pytest.approx(np.linalg.det(A))
+    # Pas de SVD des blocs: conditionnement via analyze_matrix
+    assert info['condition_number'] is None
+    assert not info['parallel']
+    
+    with SharedMemorySolverPool(max_workers=2) as pool:
+        x_parallel, info = solver.block_solve(A, b, method="lu", pool=pool, parallel_min_size=1)
+    assert info['parallel']
+    assert np.allclose(x_parallel, x)
+    assert info['determinant'] == pytest.approx(np.linalg.det(A))
+
+@pytest.mark.parametrize("engine", ["reference", "numpy", "lapack"])
+def test_engines_agree(engine):
+    """Test moteurs de calcul: mêmes résultats, capacités déclarées"""
+    from src.services.backends import default_registry
+    
+    registry = default_registry(solver, reference_max_size=4, numpy_max_size=16)
+    backend = registry.get(engine)
+    rng = np.random.default_rng(6)
+    n = 70
+    A = rng.standard_normal((n, n)) + n * np.eye(n)
+    b = rng.standard_normal(n)
+    
+    x, info = backend.solve(A, b, method="lu")
+    assert info['engine'] == engine
+    assert np.allclose(x, np.linalg.solve(A, b))
+    assert backend.determinant(A)[0] == pytest.approx(np.linalg.det(A))
+    assert np.allclose(backend.inverse(A)[0], np.linalg.inv(A))
+    M = rng.standard_normal((n + 5, n))
+    c = rng.standard_normal(n + 5)
+    x, info = backend.least_squares(M, c)
+    assert info['rank'] == n
+    assert np.allclose(x, np.linalg.lstsq(M, c, rcond=None)[0])
+    if backend.supports("lu_decomposition"):
+        L, U, _ = backend.lu_decomposition(A)
+        assert np.allclose(L @ U, A)
+        assert np.allclose(np.triu(L, 1), 0.0) and np.allclose(np.tril(U, -1), 0.0)
+    else:
+        with pytest.raises(ValueError):
+            registry.select("lu_decomposition", n, engine)
+        with pytest.raises(ValueError):
+            backend.lu_decomposition(A)
+    with pytest.raises(ValueError):
+        backend.solve(np.ones((3, 3)), np.ones(3))
+    
+    assert [registry.select("gauss", k).name for k in (3, 10, 100)] == ["reference", "numpy", "lapack"]
+    assert registry.select("lu_decomposition", 100).name == "numpy"
+
+def test_incomplete_backend_fails_at_instantiation():
+    """Test interface abstraite: un moteur sans toutes les opérations n'est pas instanciable"""
+    from src.services.backends import SolverBackend
+    
+    class PartialBackend(SolverBackend):
+        name = "partial"
+        
+        def solve(self, A, b, method="gauss"):
+            return np.linalg.solve(A, b), {}
+    
+    with pytest.raises(TypeError):
+        PartialBackend()
+
+def test_sketched_spectrum_bounds_contain_exact_values():
+    """Test analyse approchée: bornes de σ, du conditionnement et du rang"""
+    from src.services.factorization import blocked_lu
+    from src.services.generators import conditioned
+    from src.services.sketching import estimate_spectrum
+    
+    A = conditioned(300, 1e5, seed=3)
+    s = np.linalg.svd(A, compute_uv=False)
+    estimates = estimate_spectrum(A, blocked_lu(A), rank=5)
+    low, high = estimates['condition_number_bounds']
+    assert low <= s[0] / s[-1] <= high and high / low < 2.0
+    assert estimates['rank_bounds'] == [300, 300]
+    for value, exact in zip(estimates['singular_values'], s):
+        assert value <= exact * (1 + 1e-12) <= value + estimates['singular_value_error']
+    assert estimates['confidence'] > 0.9999
+    
+    rng = np.random.default_rng(5)
+    low_rank = rng.standard_normal((200, 4)) @ rng.standard_normal((4, 200))
+    estimates = estimate_spectrum(low_rank, blocked_lu(low_rank))
+    assert estimates['rank'] == 4 and estimates['condition_number'] is None
+
+def test_solver_profile_phases_flops_and_hook():
+    """Test profil: phases, flops comptés, pic mémoire et hook de métriques"""
+    from src.services import profiling
+    
+    samples = []
+    profiling.set_metrics_hook(samples.append)
+    try:
+        n = 30
+        A = np.random.default_rng(7).standard_normal((n, n)) + n * np.eye(n)
+        _, info = solver.gauss_elimination(A, np.ones(n))
+        profile = info['profile']
+        assert set(profile['phases']) == {'setup', 'pivoting', 'elimination', 'substitution'}
+        # Dense: Σ (n-i-1)·(1 + 2(n-i+1)) pour l'élimination + n² pour la substitution
+        expected = sum((n - i - 1) * (1 + 2 * (n - i + 1)) for i in range(n)) + n * n
+        assert profile['flops'] == expected
+        assert profile['peak_bytes'] >= n * (n + 1) * 8
+        
+        _, info = solver.inverse(A)
+        assert 'verification' in info['profile']['phases']
+        assert [sample['operation'] for sample in samples] == ['gauss_elimination', 'inverse_gauss']
+        
+        # Moteur de référence: même nom dans l'échantillon et dans la réponse
+        samples.clear()
+        from src.services.backends import default_registry
+        _, info = default_registry(solver).select("gauss", n).solve(A, np.ones(n))
+        assert samples[-1]['engine'] == info['engine'] == 'reference'
+        
+        profiling.set_metrics_hook(lambda sample: 1 / 0)
+        with pytest.warns(RuntimeWarning):
+            solver.determinant(A)
+    finally:
+        profiling.set_metrics_hook(None)
+
+@pytest.mark.parametrize("file_format", ["csv", "mtx", "npy"])
+def test_upload_readers_stream_in_chunks(tmp_path, file_format):
+    """Test lecteurs incrémentaux: fichier reçu par petits morceaux"""
+    import io
+    import scipy.io
+    import scipy.sparse
+    from src.services.uploads import UploadStore, UploadTooLarge
+    
+    rng = np.random.default_rng(2)
+    A = rng.standard_normal((6, 6))
+    A[A < 0.3] = 0.0
+    buffer = io.BytesIO()
+    if file_format == "csv":
+        np.savetxt(buffer, A, delimiter=",")
+    elif file_format == "mtx":
+        scipy.io.mmwrite(buffer, scipy.sparse.coo_matrix(A))
+    else:
+        np.save(buffer, np.asfortranarray(A))
+    content = buffer.getvalue()
+    
+    store = UploadStore(str(tmp_path))
+    session = store.session(file_format, max_bytes=len(content), max_dimension=100)
+    for start in range(0, len(content), 13):
+        session.feed(content[start:start + 13])
+    upload_id, shape = session.finish()
+    
+    assert shape == (6, 6)
+    assert store.shape(upload_id) == (6, 6)
+    assert np.allclose(store.load(upload_id), A)
+    
+    # Limite vérifiée au fil de la réception; fichier partiel supprimé
+    session = store.session(file_format, max_bytes=len(content) - 1, max_dimension=100)
+    with pytest.raises(UploadTooLarge):
+        for start in range(0, len(content), 13):
+            session.feed(content[start:start + 13])
+    session.abort()
+    assert sorted(p.name for p in tmp_path.iterdir()) == [f"{upload_id}.npy"]
+
+def test_csv_reader_resizes_in_bounded_blocks(tmp_path, monkeypatch):
+    """Test CSV haut et étroit: agrandissements et ajustement final par blocs de lignes"""
+    from src.services import uploads
+    from src.services.uploads import UploadStore
+    
+    copies = []
+    original = np.lib.format.open_memmap
+    monkeypatch.setattr(uploads, "COPY_BLOCK_BYTES", 48)
+    # Aucune copie complète en mémoire (np.array des lignes lues)
+    monkeypatch.setattr(np, "array", lambda *args, **kwargs: pytest.fail("copie en mémoire"))
+    def open_memmap(*args, **kwargs):
+        if kwargs.get("mode") == "w+":
+            copies.append(kwargs["shape"])
+        return original(*args, **kwargs)
+    monkeypatch.setattr(np.lib.format, "open_memmap", open_memmap)
+    
+    A = np.arange(41 * 3, dtype=float).reshape(41, 3)
+    content = "\n".join(",".join(f"{v:g}" for v in row) for row in A).encode()
+    store = UploadStore(str(tmp_path))
+    session = store.session("csv", max_bytes=len(content), max_dimension=100)
+    for start in range(0, len(content), 17):
+        session.feed(content[start:start + 17])
+    upload_id, shape = session.finish()
+    monkeypatch.undo()
+    
+    assert shape == (41, 3)
+    assert np.array_equal(store.load(upload_id), A)
+    # Capacités successives: 3, 6, 12, 24, 48 lignes puis ajustement à 41
+    assert copies == [(3, 3), (6, 3), (12, 3), (24, 3), (48, 3), (41, 3)]
+    assert sorted(p.name for p in tmp_path.iterdir()) == [f"{upload_id}.npy"]
+    
+    # Lecteur incomplet: refusé dès l'instanciation
+    with pytest.raises(TypeError):
+        uploads._LineReader(str(tmp_path / "x.npy"), 10)
+
+@pytest.mark.parametrize("size_line", ["3 3", "3", "3 x 4", "2 2 1.5", "3 3 -1"])
+def test_matrix_market_rejects_malformed_size_line(tmp_path, size_line):
+    """Test ligne de dimensions MatrixMarket incomplète ou non entière: UploadError"""
+    from src.services.uploads import UploadError, UploadStore
+    
+    store = UploadStore(str(tmp_path))
+    session = store.session("mtx", max_bytes=1000, max_dimension=100)
+    with pytest.raises(UploadError):
+        session.feed(f"%%MatrixMarket matrix coordinate real general\n{size_line}\n1 1 1.0\n".encode())
+        session.finish()
+    session.abort()
+    
+    session = store.session("mtx", max_bytes=1000, max_dimension=100)
+    with pytest.raises(UploadError):
+        session.feed(b"%%MatrixMarket matrix array real general\n2\n1.0\n2.0\n")
+        session.finish()
+    session.abort()
+
+def test_compiled_turing_machine_with_and_without_history():
+    """Test table compilée: mêmes résultats avec ou sans historique, actions à la demande"""
+    from src.services.turing_machine import TuringMachine, create_example_machines
+    
+    examples = create_example_machines()
+    for name, expected_tapes in [('binary_increment', ['1100']), ('string_copy', ['abc', 'abc'])]:
+        example = examples[name]
+        machine = dict(
+            tapes=example.get('initial_tapes') or [example['initial_tape']],
+            initial_state=example['initial_state'],
+            final_states=example['final_states'],
+            transitions=example['transitions']
+        )
+        traced = TuringMachine(**machine).run(100)
+        fast = TuringMachine(**machine).run(100, record=False)
+        
+        assert traced['accepted'] and fast['accepted']
+        assert traced['final_tapes'] == fast['final_tapes'] == expected_tapes
+        assert traced['total_steps'] == fast['total_steps'] == len(traced['execution_steps'])
+        assert fast['execution_steps'] == []
+        assert traced['execution_steps'][-1]['action_taken'].startswith("✓ Accepté")
+    
+    steps = TuringMachine(**{**machine, 'tapes': ['ab', '']}).run(100)['execution_steps']
+    assert steps[0]['action_taken'] == "Écrire [R0:'a', R1:'a'], mouvements [R0:R, R1:R], état → q0"
+    assert steps[0]['tape_contents'] == ['ab', '_']
+
+def test_turing_tape_grows_both_ways_with_size_limit():
+    """Test ruban bidirectionnel: extension à gauche en O(1) amorti et limite de taille"""
+    from src.services.turing_machine import TuringMachine
+    
+    sweep_left = [{'current_state': 'q0', 'read_symbol': '_', 'next_state': 'q0', 'write_symbol': '1', 'move_direction': 'L'}]
+    result = TuringMachine(['ab'], final_states=['h'], transitions=sweep_left, head_positions=[-1],
+                           detect_loops=False, max_tape_size=10**6).run(5000, record=False)
+    assert result['final_tapes'] == ['1' * 5000 + 'ab']
+    assert result['halt_reason'] == "Max steps limit (5000)"
+    
+    # Limite vérifiée avant chaque étape: 100 cellules écrites autorisées, arrêt à la suivante
+    tm = TuringMachine([''], final_states=['h'], transitions=sweep_left, detect_loops=False, max_tape_size=100)
+    result = tm.run(1000)
+    assert result['halt_reason'] == "Tape size limit exceeded (100)"
+    assert result['total_steps'] == 101
+    assert tm.tapes[0].size == 101 and tm.tapes[0].head_position == -101
+    assert result['execution_steps'][-1]['head_positions'] == [-1]
+    
+    with pytest.raises(ValueError):
+        TuringMachine([''.join(map(chr, range(300)))], final_states=['h'], transitions=sweep_left)
+
+def test_turing_loop_detection_confirms_fingerprint_collisions(monkeypatch):
+    """Test empreintes incrémentales: collisions forcées écartées par comparaison complète"""
+    from src.services import turing_machine
+    from src.services.turing_machine import TuringMachine
+    
+    # Va-et-vient entre deux cases puis boucle, et compteur binaire sans boucle
+    bounce = [
+        {'current_state': 'q0', 'read_symbol': '1', 'next_state': 'q1', 'write_symbol': '0', 'move_direction': 'R'},
+        {'current_state': 'q1', 'read_symbol': '_', 'next_state': 'q0', 'write_symbol': '1', 'move_direction': 'L'},
+        {'current_state': 'q1', 'read_symbol': '1', 'next_state': 'q0', 'write_symbol': '1', 'move_direction': 'L'},
+        {'current_state': 'q0', 'read_symbol': '0', 'next_state': 'q0', 'write_symbol': '1', 'move_direction': 'N'},
+    ]
+    counter = [
+        {'current_state': 'q0', 'read_symbol': s, 'next_state': 'q0', 'write_symbol': s, 'move_direction': 'R'} for s in '01'
+    ] + [
+        {'current_state': 'q0', 'read_symbol': '_', 'next_state': 'q1', 'write_symbol': '_', 'move_direction': 'L'},
+        {'current_state': 'q1', 'read_symbol': '1', 'next_state': 'q1', 'write_symbol': '0', 'move_direction': 'L'},
+        {'current_state': 'q1', 'read_symbol': '0', 'next_state': 'q0', 'write_symbol': '1', 'move_direction': 'R'},
+        {'current_state': 'q1', 'read_symbol': '_', 'next_state': 'q0', 'write_symbol': '1', 'move_direction': 'R'},
+    ]
+    
+    def outcome(transitions, tapes):
+        results = []
+        for tm in (TuringMachine([tapes[0]], final_states=['h'], transitions=transitions),
+                   TuringMachine(tapes, final_states=['h'], transitions=[
+                       {'current_state': t['current_state'], 'read_symbols': [t['read_symbol'], '_'],
+                        'next_state': t['next_state'], 'write_symbols': [t['write_symbol'], '_'],
+                        'move_directions': [t['move_direction'], 'N']} for t in transitions
+                   ])):
+            result = tm.run(200, record=False)
+            results.append((result['loop_detected'], result['total_steps'], result['final_tapes'][0]))
+        assert results[0] == results[1]
+        return results[0]
+    
+    expected = [outcome(bounce, ['1', '']), outcome(counter, ['0', ''])]
+    assert expected[0] == (True, 6, '01')
+    assert expected[1] == (False, 200, '110000')
+    
+    # Module minuscule: presque toutes les empreintes entrent en collision
+    monkeypatch.setattr(turing_machine, 'HASH_MODULUS', 3)
+    monkeypatch.setattr(turing_machine, 'HASH_BASE', 2)
+    monkeypatch.setattr(turing_machine, 'HASH_BASE_INVERSE', 2)
+    assert [outcome(bounce, ['1', '']), outcome(counter, ['0', ''])] == expected
+
+def test_turing_bounded_loop_detection_reports_cycle():
+    """Test détection de cycle en mémoire bornée (Brent + table d'échantillons)"""
+    from src.services.turing_machine import TuringMachine
+    
+    # Balayage de 3000 cases puis va-et-vient de période 2
+    transitions = [
+        {'current_state': 'q0', 'read_symbol': '1', 'next_state': 'q0', 'write_symbol': '1', 'move_direction': 'R'},
+        {'current_state': 'q0', 'read_symbol': '_', 'next_state': 'q1', 'write_symbol': '1', 'move_direction': 'L'},
+        {'current_state': 'q1', 'read_symbol': '1', 'next_state': 'q2', 'write_symbol': '1', 'move_direction': 'R'},
+        {'current_state': 'q2', 'read_symbol': '1', 'next_state': 'q1', 'write_symbol': '1', 'move_direction': 'L'},
+    ]
+    
+    def run(**options):
+        tm = TuringMachine(['1' * 3000], final_states=['h'], transitions=transitions, **options)
+        return tm, tm.run(100000, record=False)
+    
+    exact, expected = run()
+    assert expected['loop_detected']
+    assert (expected['loop_start'], expected['loop_length']) == (3001, 2)
+    assert expected['total_steps'] == 3004
+    # Balayage de 3000 cases en un macro-pas: seules ses extrémités sont observées
+    assert len(exact.detector) == 4
+    plain, result = run(accelerate=False)
+    assert result == {**expected, 'execution_time': result['execution_time']}
+    assert len(plain.detector) == 3003
+    
+    for memory in (0, 16):
+        tm, result = run(loop_detection='bounded', loop_memory=memory)
+        assert result['loop_detected']
+        assert (result['loop_start'], result['loop_length']) == (3001, 2)
+        assert result['total_steps'] >= expected['total_steps']
+        assert len(tm.detector) <= memory + 1
+    
+    with pytest.raises(ValueError):
+        TuringMachine(['1'], transitions=transitions, loop_detection='approximate')
+
+def test_turing_delta_trace_reconstructs_any_step():
+    """Test historique compact: deltas + images périodiques, reconstruction à la demande"""
+    from src.services.turing_machine import TuringMachine, create_example_machines
+    
+    example = create_example_machines()['binary_increment']
+    machine = dict(tapes=['1' * 40 + '0' + '1' * 40], final_states=example['final_states'],
+                   transitions=example['transitions'], detect_loops=False)
+    reference = TuringMachine(keyframe_interval=10**6, **machine).run(1000)['execution_steps']
+    
+    tm = TuringMachine(keyframe_interval=7, **machine)
+    result = tm.run(1000)
+    assert result['execution_steps'] == reference
+    assert len(tm.trace.keyframes) == -(-len(reference) // 7)
+    
+    translation = tm.program.translation
+    for step in (0, 6, 7, 50, len(reference) - 1):
+        state, displays = tm.trace.configuration_at(step, translation)
+        assert tm.program.states[state] == reference[step]['current_state']
+        assert [content for content, _ in displays] == reference[step]['tape_contents']
+        assert [head for _, head in displays] == reference[step]['head_positions']
+    assert tm.step_details(range(10, 30, 5)) == reference[10:30:5]
+    assert tm.step_details([3, 40, 41, 100]) == [reference[i] for i in (3, 40, 41, 100)]
+    
+    # Par étape: état (4 octets), issue (4), écriture (1), déplacement (1)
+    assert tm.trace.nbytes == 10 * len(reference) + sum(len(k[0][0]) for k in tm.trace.keyframes)
+    
+    # Tête initiale loin des cellules écrites
+    far = TuringMachine(tapes=['0'], head_positions=[9], final_states=['h'], detect_loops=False, transitions=[
+        {'current_state': 'q0', 'read_symbol': '_', 'next_state': 'q0', 'write_symbol': '1', 'move_direction': 'R'}
+    ]).run(3)['execution_steps']
+    assert [step['head_positions'][0] for step in far] == [9, 10, 11]
+    assert far[2]['tape_contents'] == ['0' + '_' * 8 + '11']
+
+
+def test_turing_stream_pause_resume_cancel():
+    """Test flux Turing: contre-pression, pause/reprise entre deux lots, annulation"""
+    import asyncio
+    from src.services.turing_machine import TuringMachine
+    from src.services.turing_streams import StreamLimitExceeded, StreamRegistry, stream_execution
+    
+    # Machine sans fin: avance à droite indéfiniment
+    machine = dict(tapes=[''], final_states=['h'], detect_loops=False, max_tape_size=10**6, transitions=[
+        {'current_state': 'q0', 'read_symbol': '_', 'next_state': 'q0', 'write_symbol': '1', 'move_direction': 'R'}
+    ])
+    
+    registry = StreamRegistry(max_sessions=1)
+    session = registry.open()
+    with pytest.raises(StreamLimitExceeded):
+        registry.open()
+    
+    async def consume():
+        tm = TuringMachine(**machine)
+        events = []
+        stream = stream_execution(tm, session, max_steps=10**6, batch_size=10)
+        async for event, data in stream:
+            events.append((event, data))
+            if event == 'steps':
+                # Lot suivant calculé seulement à la demande
+                batches = sum(name == 'steps' for name, _ in events)
+                assert tm.step_count == data['total_steps'] == 10 * batches
+                assert len(tm.trace) == 10
+                if data['total_steps'] == 20:
+                    session.pause()
+                    asyncio.get_running_loop().call_later(0.05, session.resume)
+                elif data['total_steps'] == 40:
+                    session.cancel()
+        return events
+    
+    events = asyncio.run(consume())
+    names = [event for event, _ in events]
+    assert names == ['session', 'steps', 'steps', 'paused', 'resumed', 'steps', 'steps', 'cancelled']
+    assert events[-1][1]['total_steps'] == 40
+    assert [step['step_number'] for step in events[5][1]['steps']] == list(range(20, 30))
+    
+    registry.close(session.session_id)
+    assert len(registry) == 0
+    
+    async def expire():
+        timed_out = registry.open()
+        timed_out.pause()
+        stream = stream_execution(TuringMachine(**machine), timed_out, max_steps=100, pause_timeout=0.01)
+        return [event async for event, _ in stream]
+    
+    assert asyncio.run(expire()) == ['session', 'paused', 'cancelled']
+
+
+def test_turing_macro_steps_match_single_stepping():
+    """Test macro-pas: balayages sautés d'un bloc, résultats identiques au pas à pas"""
+    from src.services.turing_machine import TuringMachine, create_example_machines
+    
+    def run(accelerate, max_steps, **machine):
+        result = TuringMachine(detect_loops=False, accelerate=accelerate, **machine).run(max_steps, record=False)
+        result.pop('execution_time')
+        return result
+    
+    example = create_example_machines()['binary_increment']
+    machine = dict(tapes=['1' * 2000], final_states=example['final_states'], transitions=example['transitions'])
+    # Arrêts en plein balayage (max_steps) ou à son terme
+    for max_steps in (1, 1000, 2001, 2002, 4003, 10**6):
+        assert run(True, max_steps, **machine) == run(False, max_steps, **machine)
+    assert run(True, 10**6, **machine)['total_steps'] == 4003
+    
+    # Balayage vers la gauche dans les blancs, borné par la taille du ruban
+    left = dict(tapes=['1'], final_states=['h'], max_tape_size=500, transitions=[
+        {'current_state': 'q0', 'read_symbol': '1', 'next_state': 'q0', 'write_symbol': '1', 'move_direction': 'L'},
+        {'current_state': 'q0', 'read_symbol': '_', 'next_state': 'q0', 'write_symbol': '0', 'move_direction': 'L'}
+    ])
+    accelerated = run(True, 10**6, **left)
+    assert accelerated == run(False, 10**6, **left)
+    assert accelerated['halt_reason'] == "Tape size limit exceeded (500)"
+    assert accelerated['final_tapes'] == ['0' * 500 + '1']
+
+
+def test_turing_macro_steps_with_exact_loop_detection():
+    """Test macro-pas pendant la détection exacte: boucles et arrêts identiques au pas à pas"""
+    import random
+    from src.services.turing_machine import TuringMachine
+    
+    def run(accelerate, max_steps, **machine):
+        tm = TuringMachine(accelerate=accelerate, **machine)
+        result = tm.run(max_steps, record=False)
+        result.pop('execution_time')
+        return tm, result
+    
+    def rule(state, read, write, move, next_state=None):
+        return {'current_state': state, 'read_symbol': read, 'next_state': next_state or state,
+                'write_symbol': write, 'move_direction': move}
+    
+    # Va-et-vient sur 'aaaa': première répétition (étape 10) au milieu d'un balayage
+    bounce = dict(tapes=['aaaa'], head_positions=[2], initial_state='q', final_states=['h'], transitions=[
+        rule('q', 'a', 'a', 'R'), rule('q', '_', '_', 'L', 'p'),
+        rule('p', 'a', 'a', 'L'), rule('p', '_', '_', 'R', 'q'),
+    ])
+    # Boucle de période 2 au bout d'un balayage de 'a'
+    edge = dict(tapes=['__aaa'], head_positions=[2], final_states=['h'], transitions=[
+        rule('q0', '_', '_', 'L'), rule('q0', 'a', 'a', 'R'),
+    ])
+    for machine in (bounce, edge):
+        # Arrêts avant, pendant et après la détection
+        for max_steps in range(1, 25):
+            accelerated, expected = run(True, max_steps, **machine)
+            assert expected == run(False, max_steps, **machine)[1]
+    assert (expected['loop_start'], expected['loop_length'], expected['total_steps']) == (2, 2, 5)
+    _, result = run(True, 100, **bounce)
+    assert (result['loop_start'], result['loop_length'], result['total_steps']) == (0, 10, 11)
+    
+    # Balayages sans fin dans les blancs et boucles sur des machines aléatoires
+    rng = random.Random(0)
+    swept = 0
+    for _ in range(300):
+        states, symbols = ['q0', 'q1', 'q2'][:rng.randint(1, 3)], ['_', 'a', 'b']
+        transitions = [
+            rule(state, read, rng.choice(symbols), rng.choice('LR'), rng.choice(states + ['h']))
+            for state in states for read in symbols if rng.random() < 0.9
+        ]
+        tape = ''.join(rng.choice(symbols) for _ in range(rng.randint(0, 20)))
+        machine = dict(tapes=[tape], final_states=['h'], transitions=transitions,
+                       max_tape_size=rng.choice([10, 10000]))
+        max_steps = rng.choice([5, 50, 2000])
+        accelerated, result = run(True, max_steps, **machine)
+        assert result == run(False, max_steps, **machine)[1]
+        swept += accelerated._swept
+    assert swept > 0
@@ -1,6 +1,9 @@
 import axios from 'axios';
-import type { SolveRequest, SolveResponse, AnalysisRequest, AnalysisResponse, DecomposeLURequest, DecomposeLUResponse } from '@/types';
-import type { TuringMachineRequest, TuringMachineResponse } from '@/types/turing';
+import type { SolveRequest, SolveResponse, AnalysisRequest, AnalysisResponse, DecomposeLURequest, DecomposeLUResponse, OperationsRequest, OperationsResponse, MatrixGenerator, GeneratedMatrixResponse, UploadResponse } from '@/types';
+import type {
+  TuringMachineRequest, TuringMachineResponse,
+  TuringStreamRequest, TuringStreamEvent, TuringStreamAction,
+} from '@/types/turing';
 
 const API_URL = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000';
 
@@ -24,6 +27,28 @@ export const solverApi = {
     return response.data;
   },
 
+  // Plusieurs opérations sur une même matrice (factorisation partagée)
+  operations: async (request: OperationsRequest): Promise<OperationsResponse> => {
+    const response = await api.post<OperationsResponse>('/api/v1/operations', request);
+    return response.data;
+  },
+
+  // Générer une matrice de test côté serveur
+  generate: async (request: MatrixGenerator): Promise<GeneratedMatrixResponse> => {
+    const response = await api.post<GeneratedMatrixResponse>('/api/v1/generate', request);
+    return response.data;
+  },
+
+  // Importer une matrice depuis un fichier (CSV, MatrixMarket, .npy)
+  upload: async (file: File): Promise<UploadResponse> => {
+    const form = new FormData();
+    form.append('file', file);
+    const response = await api.post<UploadResponse>('/api/v1/upload', form, {
+      headers: { 'Content-Type': 'multipart/form-data' },
+    });
+    return response.data;
+  },
+
   // Décomposition LU
   decomposeLU: async (request: DecomposeLURequest): Promise<DecomposeLUResponse> => {
     const response = await api.post<DecomposeLUResponse>('/api/v1/decompose-lu', request);
@@ -41,6 +66,46 @@ export const solverApi = {
     const response = await api.post<TuringMachineResponse>('/api/v1/turing/simulate', request);
     return response.data;
   },
+
+  // Exécuter une machine de Turing en flux (SSE). Le flux n'est lu qu'au
+  // rythme de onEvent: un traitement lent ralentit l'exécution côté serveur
+  turingStream: async (
+    request: TuringStreamRequest,
+    onEvent: (event: TuringStreamEvent) => void | Promise<void>,
+    signal?: AbortSignal,
+  ): Promise<void> => {
+    const response = await fetch(`${API_URL}/api/v1/turing/stream`, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify(request),
+      signal,
+    });
+    if (!response.ok || !response.body) {
+      throw new Error(`Erreur HTTP ${response.status}`);
+    }
+    const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+    let buffer = '';
+    for (;;) {
+      const { value, done } = await reader.read();
+      if (done) break;
+      buffer += value;
+      let end;
+      while ((end = buffer.indexOf('\n\n')) >= 0) {
+        const block = buffer.slice(0, end);
+        buffer = buffer.slice(end + 2);
+        const event = /^event: (.*)$/m.exec(block)?.[1];
+        const data = /^data: (.*)$/m.exec(block)?.[1];
+        if (event && data) {
+          await onEvent({ event, data: JSON.parse(data) } as TuringStreamEvent);
+        }
+      }
+    }
+  },
+
+  // Pause, reprise ou annulation d'une exécution en flux
+  turingStreamControl: async (sessionId: string, action: TuringStreamAction): Promise<void> => {
+    await api.post(`/api/v1/turing/stream/${sessionId}/${action}`);
+  },
 };
 
 export default api;
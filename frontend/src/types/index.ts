@@ -1,17 +1,92 @@
 // Types pour les matrices et vecteurs
+export type MatrixGeneratorKind = 'random' | 'spd' | 'hilbert' | 'poisson2d' | 'banded' | 'conditioned';
+
+export interface MatrixGenerator {
+  kind: MatrixGeneratorKind;
+  n: number;
+  seed?: number;
+  bandwidth?: number;
+  condition_number?: number;
+}
+
+export interface VectorGenerator {
+  kind?: 'random' | 'ones';
+  n: number;
+  seed?: number;
+}
+
+export interface StructuredMatrix {
+  kind: 'toeplitz' | 'circulant';
+  first_column: number[];
+  first_row?: number[];
+}
+
+// Données littérales, générateur côté serveur ou forme compacte (une seule source)
 export interface Matrix {
-  data: number[][];
+  data?: number[][];
+  generator?: MatrixGenerator;
+  structured?: StructuredMatrix;
+  upload_id?: string;
+}
+
+export interface UploadResponse {
+  success: boolean;
+  upload_id: string;
+  format: 'csv' | 'mtx' | 'npy';
+  shape: number[];
+  bytes_received: number;
+  execution_time: number;
+  message?: string;
 }
 
 export interface Vector {
-  data: number[];
+  data?: number[];
+  generator?: VectorGenerator;
+}
+
+export interface GeneratedMatrixResponse {
+  success: boolean;
+  kind: string;
+  shape: number[];
+  matrix: number[][];
+  execution_time: number;
+  message?: string;
 }
 
 // Types pour les requêtes API
 export interface SolveRequest {
   matrix_a: Matrix;
   vector_b: Vector;
-  method: 'gauss' | 'lu';
+  method: 'gauss' | 'lu' | 'qr';
+  column_pivoting?: boolean;
+  exact?: boolean;
+  reordering?: 'none' | 'rcm' | 'minimum_degree';
+  detect_structure?: boolean;
+  engine?: Engine;
+}
+
+export type Engine = 'reference' | 'numpy' | 'lapack';
+
+export interface SolverProfile {
+  phases: Record<string, number>;
+  flops: number;
+  gflops?: number | null;
+  peak_bytes: number;
+}
+
+export interface RationalNumber {
+  numerator: string;
+  denominator: string;
+}
+
+export interface ReorderingReport {
+  method: string;
+  permutation: number[];
+  nnz: number;
+  bandwidth_before: number;
+  bandwidth_after: number;
+  fill_before: number;
+  fill_after: number;
 }
 
 export interface SolveResponse {
@@ -21,13 +96,36 @@ export interface SolveResponse {
   method: string;
   execution_time: number;
   matrix_condition: number;
-  determinant: number;
+  determinant: number | null;
+  rank?: number | null;
+  solution_exact?: RationalNumber[] | null;
+  determinant_exact?: RationalNumber | null;
+  reordering?: ReorderingReport | null;
+  structure?: string | null;
+  blocks?: number[][] | null;
+  engine?: string | null;
+  profile?: SolverProfile | null;
   message?: string;
 }
 
 export interface AnalysisRequest {
   matrix_a: Matrix;
   vector_b?: Vector;
+  mode?: 'exact' | 'approximate';
+}
+
+export interface SpectrumEstimates {
+  singular_values: number[];
+  singular_value_error: number;
+  largest_singular_value_bounds: number[];
+  smallest_singular_value?: number | null;
+  smallest_singular_value_bounds?: number[] | null;
+  condition_number_bounds?: (number | null)[] | null;
+  rank_bounds: number[];
+  confidence: number;
+  sketch_size: number;
+  power_iterations: number;
+  probes: number;
 }
 
 export interface AnalysisResponse {
@@ -39,19 +137,65 @@ export interface AnalysisResponse {
   is_positive_definite?: boolean;
   eigenvalues?: number[];
   rank: number;
+  mode?: 'exact' | 'approximate';
+  estimates?: SpectrumEstimates | null;
   properties: Record<string, any>;
   recommendations: string[];
   execution_time: number;
 }
 
+export interface DeterminantResponse {
+  success: boolean;
+  determinant: number | null;
+  determinant_exact?: RationalNumber | null;
+  structure?: string | null;
+  method: string;
+  engine?: string | null;
+  profile?: SolverProfile | null;
+  execution_time: number;
+  message?: string;
+}
+
+export interface InverseResponse {
+  success: boolean;
+  matrix_inverse: number[][] | null;
+  verification: number | null;
+  engine?: string | null;
+  profile?: SolverProfile | null;
+  execution_time: number;
+  message?: string;
+}
+
+export type MatrixOperation = 'solve' | 'determinant' | 'inverse' | 'analyze';
+
+export interface OperationsRequest {
+  matrix_a: Matrix;
+  vector_b?: Vector;
+  operations: MatrixOperation[];
+}
+
+export interface OperationsResponse {
+  success: boolean;
+  solve?: SolveResponse | null;
+  determinant?: DeterminantResponse | null;
+  inverse?: InverseResponse | null;
+  analyze?: AnalysisResponse | null;
+  timings: Record<string, number>;
+  execution_time: number;
+  message?: string;
+}
+
 export interface DecomposeLURequest {
   matrix_a: Matrix;
+  engine?: Engine;
 }
 
 export interface DecomposeLUResponse {
   success: boolean;
   matrix_l: number[][];
   matrix_u: number[][];
+  engine?: string | null;
+  profile?: SolverProfile | null;
   execution_time: number;
   message?: string;
 }
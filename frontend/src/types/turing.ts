@@ -46,6 +46,13 @@ export interface TuringMachineRequest {
   head_position?: number;
   head_positions?: number[];
   detect_loops?: boolean;
+  // 'exact': toutes les configurations; 'bounded': mémoire bornée (Brent)
+  loop_detection?: 'exact' | 'bounded';
+  loop_memory?: number;
+  // Étapes retournées: aucune, initiale + finale, échantillon ou toutes
+  trace?: 'none' | 'summary' | 'sampled' | 'full';
+  sample_every?: number;
+  sample_frames?: number;
 }
 
 /**
@@ -84,12 +91,37 @@ export interface TuringMachineResponse {
   halted: boolean;
   halt_reason?: string;
   loop_detected: boolean;
+  loop_start?: number | null;
+  loop_length?: number | null;
   execution_time: number;
   message?: string;
   num_tapes: number;
+  trace?: 'none' | 'summary' | 'sampled' | 'full';
   animation_frames?: TuringAnimationFrame[];
 }
 
+/**
+ * Requête d'exécution en flux (SSE, /turing/stream)
+ */
+export interface TuringStreamRequest extends TuringMachineRequest {
+  batch_size?: number;
+  every?: number;
+}
+
+/**
+ * Événements du flux: identifiant de session, lots d'étapes, pause/reprise,
+ * résultat final (sans étapes) ou annulation
+ */
+export type TuringStreamEvent =
+  | { event: 'session'; data: { session_id: string; paused: boolean; cancelled: boolean; num_tapes: number } }
+  | { event: 'steps'; data: { steps: TuringExecutionStep[]; total_steps: number } }
+  | { event: 'paused' | 'resumed' | 'heartbeat'; data: { total_steps: number } }
+  | { event: 'cancelled'; data: { total_steps: number; reason: string } }
+  | { event: 'result'; data: Omit<TuringMachineResponse, 'execution_steps' | 'animation_frames'> }
+  | { event: 'error'; data: { detail: string } };
+
+export type TuringStreamAction = 'pause' | 'resume' | 'cancel';
+
 /**
  * Exemple pré-configuré de machine de Turing
  */
@@ -0,0 +1,289 @@
+"""
+Générateur de charge local pour OPM Solver Pro
+Rejoue un mélange configurable de requêtes (/solve, /inverse, /analyze, /turing/simulate)
+à un débit cible et rapporte débit, latences p50/p95/p99 et taux d'erreur par endpoint.
+
+Exemples:
+    python load_test.py                                  # démarre l'API localement
+    python load_test.py --rate 50 --duration 30 --size 100 --workers 2
+    python load_test.py --url http://localhost:8000 --mix solve=3,analyze=1
+    python load_test.py --size 1000 --literal-payloads     # matrices transférées en JSON
+
+Par défaut les matrices sont décrites par une spécification de générateur
+(graine + taille) et construites côté serveur: la mesure porte sur le calcul,
+pas sur le transfert de matrices JSON de plusieurs mégaoctets.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+import httpx
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend")
+
+DEFAULT_MIX = {"solve": 4, "inverse": 1, "analyze": 2, "turing": 1}
+
+ENDPOINTS = {
+    "solve": "/api/v1/solve",
+    "inverse": "/api/v1/inverse",
+    "analyze": "/api/v1/analyze",
+    "turing": "/api/v1/turing/simulate",
+}
+
+
+def random_matrix(rng, n):
+    """Matrice aléatoire à diagonale dominante (toujours inversible)"""
+    rows = [[rng.uniform(-1, 1) for _ in range(n)] for _ in range(n)]
+    for i in range(n):
+        rows[i][i] += n
+    return rows
+
+
+def build_payload(kind, rng, size, vary, literal=False):
+    """Construire le corps d'une requête (aléatoire si vary, sinon fixe)"""
+    if not vary:
+        rng = random.Random(0)
+    if kind in ("solve", "inverse", "analyze"):
+        if literal:
+            matrix = {"data": random_matrix(rng, size)}
+        else:
+            # Matrice bien conditionnée générée côté serveur
+            seed = rng.randrange(2 ** 31)
+            matrix = {"generator": {"kind": "conditioned", "n": size, "seed": seed, "condition_number": 100.0}}
+        if kind != "solve":
+            return {"matrix_a": matrix}
+        if literal:
+            vector = {"data": [rng.uniform(-1, 1) for _ in range(size)]}
+        else:
+            vector = {"generator": {"kind": "random", "n": size, "seed": rng.randrange(2 ** 31)}}
+        return {"matrix_a": matrix, "vector_b": vector, "method": "gauss"}
+    if kind == "turing":
+        # Incrémentation binaire sur un nombre aléatoire de 'size' bits
+        tape = "1" + "".join(rng.choice("01") for _ in range(max(size - 1, 0)))
+        return {
+            "initial_tape": tape,
+            "initial_state": "q0",
+            "final_states": ["q_halt"],
+            "transitions": [
+                {"current_state": "q0", "read_symbol": "0", "next_state": "q0", "write_symbol": "0", "move_direction": "R"},
+                {"current_state": "q0", "read_symbol": "1", "next_state": "q0", "write_symbol": "1", "move_direction": "R"},
+                {"current_state": "q0", "read_symbol": "_", "next_state": "q1", "write_symbol": "_", "move_direction": "L"},
+                {"current_state": "q1", "read_symbol": "0", "next_state": "q_halt", "write_symbol": "1", "move_direction": "N"},
+                {"current_state": "q1", "read_symbol": "1", "next_state": "q1", "write_symbol": "0", "move_direction": "L"},
+                {"current_state": "q1", "read_symbol": "_", "next_state": "q_halt", "write_symbol": "1", "move_direction": "N"},
+            ],
+        }
+    raise ValueError(f"Type de requête inconnu: {kind}")
+
+
+def parse_mix(text):
+    """Parser 'solve=4,analyze=1' en dictionnaire de poids"""
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in ENDPOINTS:
+            raise argparse.ArgumentTypeError(f"Endpoint inconnu: {name} (choix: {', '.join(ENDPOINTS)})")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def percentile(sorted_values, q):
+    """Percentile par interpolation linéaire (valeurs triées)"""
+    if not sorted_values:
+        return float("nan")
+    k = (len(sorted_values) - 1) * q
+    lo = int(k)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+
+class Stats:
+    """Latences et erreurs collectées par endpoint"""
+
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+
+    def record(self, name, latency, ok):
+        self.latencies[name].append(latency)
+        if not ok:
+            self.errors[name] += 1
+
+    def summary(self, elapsed):
+        report = {}
+        for name in sorted(self.latencies):
+            values = sorted(self.latencies[name])
+            count = len(values)
+            report[name] = {
+                "requests": count,
+                "throughput_rps": count / elapsed if elapsed > 0 else 0.0,
+                "p50_ms": percentile(values, 0.50) * 1000,
+                "p95_ms": percentile(values, 0.95) * 1000,
+                "p99_ms": percentile(values, 0.99) * 1000,
+                "max_ms": values[-1] * 1000,
+                "error_rate": self.errors[name] / count if count else 0.0,
+            }
+        return report
+
+
+async def fire(client, stats, name, payload, semaphore):
+    """Envoyer une requête et enregistrer sa latence"""
+    async with semaphore:
+        start = time.perf_counter()
+        try:
+            response = await client.post(ENDPOINTS[name], json=payload)
+            ok = response.status_code == 200
+        except httpx.HTTPError:
+            ok = False
+        stats.record(name, time.perf_counter() - start, ok)
+
+
+async def probe_health(client, stats, interval, stop):
+    """
+    Sonde /health à intervalle fixe pendant la charge
+
+    /health ne calcule rien: une latence élevée signifie que la boucle
+    d'événements est bloquée par un calcul synchrone.
+    """
+    while not stop.is_set():
+        start = time.perf_counter()
+        try:
+            response = await client.get("/api/v1/health")
+            ok = response.status_code == 200
+        except httpx.HTTPError:
+            ok = False
+        stats.record("health (probe)", time.perf_counter() - start, ok)
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=interval)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def run_load(base_url, mix, rate, duration, size, concurrency, vary, seed, timeout, literal=False):
+    """Générer la charge en boucle ouverte (arrivées de Poisson au débit cible)"""
+    rng = random.Random(seed)
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    stats = Stats()
+    semaphore = asyncio.Semaphore(concurrency)
+    stop = asyncio.Event()
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, timeout=timeout, limits=limits) as client:
+        probe = asyncio.create_task(probe_health(client, stats, 0.1, stop))
+        tasks = []
+        start = time.perf_counter()
+        next_at = start
+        while True:
+            next_at += rng.expovariate(rate)
+            if next_at - start >= duration:
+                break
+            delay = next_at - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            name = rng.choices(names, weights)[0]
+            payload = build_payload(name, rng, size, vary, literal)
+            tasks.append(asyncio.create_task(fire(client, stats, name, payload, semaphore)))
+
+        await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - start
+        stop.set()
+        await probe
+
+    return stats.summary(elapsed), elapsed
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_local_app(port, workers):
+    """Démarrer l'API (uvicorn) localement et attendre qu'elle réponde"""
+    command = [
+        sys.executable, "-m", "uvicorn", "src.app:app",
+        "--host", "127.0.0.1", "--port", str(port),
+        "--workers", str(workers), "--log-level", "warning",
+    ]
+    process = subprocess.Popen(command, cwd=BACKEND_DIR, stdout=subprocess.DEVNULL)
+    url = f"http://127.0.0.1:{port}"
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("Le serveur uvicorn s'est arrêté au démarrage")
+        try:
+            if httpx.get(f"{url}/api/v1/health", timeout=1).status_code == 200:
+                return process, url
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError("Le serveur uvicorn n'a pas démarré à temps")
+
+
+def print_report(report, elapsed):
+    print("=" * 86)
+    print(f" RÉSULTATS ({elapsed:.1f}s)")
+    print("=" * 86)
+    print(f"{'endpoint':<16}{'req':>7}{'req/s':>9}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}{'erreurs':>10}")
+    for name, row in report.items():
+        print(
+            f"{name:<16}{row['requests']:>7}{row['throughput_rps']:>9.1f}"
+            f"{row['p50_ms']:>10.1f}{row['p95_ms']:>10.1f}{row['p99_ms']:>10.1f}"
+            f"{row['max_ms']:>10.1f}{row['error_rate']:>9.1%}"
+        )
+    print("=" * 86)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Test de charge local de l'API OPM Solver Pro")
+    parser.add_argument("--url", help="URL d'une API déjà démarrée (sinon démarrage local)")
+    parser.add_argument("--workers", type=int, default=1, help="Workers uvicorn (démarrage local)")
+    parser.add_argument("--rate", type=float, default=20.0, help="Débit cible (requêtes/s)")
+    parser.add_argument("--duration", type=float, default=10.0, help="Durée de la charge (s)")
+    parser.add_argument("--size", type=int, default=50, help="Taille n des matrices / rubans")
+    parser.add_argument("--mix", type=parse_mix, default=DEFAULT_MIX, help="Poids, ex: solve=4,inverse=1,analyze=2,turing=1")
+    parser.add_argument("--concurrency", type=int, default=64, help="Requêtes simultanées maximum")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Timeout par requête (s)")
+    parser.add_argument("--fixed-payloads", action="store_true", help="Rejouer des corps identiques (mesure le cache)")
+    parser.add_argument("--literal-payloads", action="store_true", help="Envoyer les matrices en JSON au lieu de générateurs")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", help="Écrire le rapport JSON dans ce fichier")
+    args = parser.parse_args()
+
+    process = None
+    url = args.url
+    if url is None:
+        process, url = start_local_app(free_port(), args.workers)
+        print(f"API démarrée localement sur {url} ({args.workers} worker(s))")
+
+    try:
+        report, elapsed = asyncio.run(run_load(
+            url, args.mix, args.rate, args.duration, args.size,
+            args.concurrency, not args.fixed_payloads, args.seed, args.timeout,
+            args.literal_payloads
+        ))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait(timeout=10)
+
+    print_report(report, elapsed)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"elapsed_s": elapsed, "endpoints": report, "config": vars(args)}, f, indent=2, default=str)
+
+    failed = any(row["error_rate"] > 0 for row in report.values())
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()